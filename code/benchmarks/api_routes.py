@@ -0,0 +1,206 @@
+"""Benchmark in-process semua route /api/v1 terhadap dataset sintetis.
+
+Jalankan dari folder code/:
+
+    python benchmarks/api_routes.py [skala] [ulangan] [file_output]
+
+skala: 1k, 100k atau 1m (default 1k), lihat benchmarks/datasets.py. Dataset
+dibuat di database SQLite sementara dengan seed tetap, lalu setiap route
+dipanggil lewat django.test.Client (tanpa server/jaringan). Cache response
+dikosongkan sebelum setiap request sehingga yang diukur adalah jalur ke
+database. Hasil (median, p95, rata-rata, jumlah query, status) ditulis ke
+benchmarks/results/api_<skala>_<commit>.json; bandingkan dua hasil dengan
+benchmarks/compare.py.
+"""
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+BASE_DIR = os.path.abspath(os.path.join(__file__, *[os.pardir] * 2))
+sys.path.append(BASE_DIR)
+os.environ['DJANGO_SETTINGS_MODULE'] = 'simplelms.settings'
+
+from django.conf import settings
+
+SCALE = sys.argv[1] if len(sys.argv) > 1 else '1k'
+REPEAT = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+SEED = 42
+
+tmpdir = tempfile.TemporaryDirectory()
+settings.DATABASES['default'] = {'ENGINE': 'django.db.backends.sqlite3',
+                                  'NAME': os.path.join(tmpdir.name, 'bench.sqlite3')}
+# seperti produksi: tanpa pencatatan query DEBUG
+settings.DEBUG = False
+settings.ALLOWED_HOSTS = ['testserver']
+
+import django
+django.setup()
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from ninja_simple_jwt.jwt.token_operations import get_access_token_for_user
+
+from datasets import SCALES, seed_dataset
+from lms_core.api import router
+from lms_core.models import Course, CourseMember, Comment
+
+API = '/api/v1/'
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def auth(user):
+    return {'HTTP_AUTHORIZATION': f'Bearer {get_access_token_for_user(user)[0]}'}
+
+
+def json_body(data):
+    return {'data': json.dumps(data), 'content_type': 'application/json'}
+
+
+def new_users(prefix, n):
+    User.objects.bulk_create([User(username=f'{prefix}{i}', password='!') for i in range(n)])
+    return list(User.objects.filter(username__startswith=prefix).order_by('id'))
+
+
+def new_comments(member, content_id, n):
+    comments = Comment.objects.bulk_create([
+        Comment(content_id_id=content_id, member_id=member, comment='hapus') for _ in range(n)
+    ])
+    Course.objects.add_counts(member.course_id_id, comments=n)
+    return [comment.id for comment in comments]
+
+
+def build_routes():
+    """route (seperti di lms_core.api.router) -> fungsi(n) yang menyiapkan n request.
+
+    Data yang diubah oleh request tulis disiapkan di sini, di luar pengukuran.
+    """
+    # course terbesar: paling banyak member, konten dan komentar
+    course = Course.objects.select_related('teacher').order_by('-comment_count', 'id').first()
+    member = CourseMember.objects.select_related('user_id').filter(course_id=course).order_by('id').first()
+    content_id = Comment.objects.filter(content_id__course_id=course).values('content_id') \
+                                .annotate(n=Count('id')).order_by('-n').first()['content_id']
+    teacher, student = auth(course.teacher), auth(member.user_id)
+    form = {'name': 'Kursus Benchmark', 'description': '-', 'price': 1000}
+
+    def same(method, path, **kwargs):
+        return lambda n: [(method, path, kwargs)] * n
+
+    return {
+        'GET /hello': same('get', 'hello'),
+        'GET /courses': same('get', 'courses'),
+        'POST /courses': same('post', 'courses', data=form, **teacher),
+        'GET /courses/cursor': same('get', 'courses/cursor'),
+        'GET /courses/search': same('get', 'courses/search?q=python'),
+        'GET /mycourses': same('get', 'mycourses', **student),
+        'POST /courses/{course_id}': same('post', f'courses/{course.id}', data=form, **teacher),
+        'POST /courses/{course_id}/enroll/': lambda n: [
+            ('post', f'courses/{course.id}/enroll/', auth(user)) for user in new_users('enroll', n)],
+        'POST /courses/{course_id}/enroll/bulk': lambda n: [
+            ('post', f'courses/{course.id}/enroll/bulk',
+             {**json_body({'user_ids': [user.id for user in users[i:i + 20]]}), **teacher})
+            for users in [new_users('bulk', n * 20)] for i in range(0, n * 20, 20)],
+        'GET /courses/{course_id}/contents': same('get', f'courses/{course.id}/contents'),
+        'GET /contents/{content_id}/comments': same('get', f'contents/{content_id}/comments'),
+        'POST /contents/{content_id}/comments/': same('post', f'contents/{content_id}/comments/',
+                                                      **json_body({'comment': 'Benchmark'}), **student),
+        'POST /contents/{content_id}/comments/bulk': same(
+            'post', f'contents/{content_id}/comments/bulk',
+            **json_body({'comments': [{'comment': f'Benchmark {i}'} for i in range(10)]}), **student),
+        'POST /comments/bulk-delete': lambda n: [
+            ('post', 'comments/bulk-delete', {**json_body({'ids': new_comments(member, content_id, 10)}), **student})
+            for _ in range(n)],
+        'DELETE /comments/{comment_id}': lambda n: [
+            ('delete', f'comments/{comment_id}', student) for comment_id in new_comments(member, content_id, n)],
+    }
+
+
+def measure(client, requests):
+    """Request pertama sebagai pemanasan (sekaligus menghitung query), sisanya diukur."""
+    cache.clear()
+    method, path, kwargs = requests[0]
+    with CaptureQueriesContext(connection) as ctx:
+        response = getattr(client, method)(API + path, **kwargs)
+    # sama seperti lms_core/tests/query_budgets.json: perintah transaksi tidak dihitung
+    queries = sum(q['sql'] not in ('BEGIN', 'COMMIT') and 'SAVEPOINT' not in q['sql']
+                  for q in ctx.captured_queries)
+
+    latencies, statuses = [], {response.status_code}
+    for method, path, kwargs in requests[1:]:
+        cache.clear()
+        start = time.perf_counter()
+        response = getattr(client, method)(API + path, **kwargs)
+        latencies.append((time.perf_counter() - start) * 1000)
+        statuses.add(response.status_code)
+    latencies.sort()
+    return {
+        'median_ms': round(statistics.median(latencies), 3),
+        'p95_ms': round(latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)], 3),
+        'mean_ms': round(statistics.fmean(latencies), 3),
+        'queries': queries,
+        'status': sorted(statuses),
+        'response_bytes': len(response.content),
+    }
+
+
+def main():
+    if SCALE not in SCALES:
+        sys.exit(f'skala tidak dikenal: {SCALE} (pilih {", ".join(SCALES)})')
+    call_command('migrate', verbosity=0)
+    rows = seed_dataset(SCALE, seed=SEED)
+
+    routes = build_routes()
+    registered = {f'{method} {path}' for path, view in router.path_operations.items()
+                  for operation in view.operations for method in operation.methods}
+    for missing in sorted(registered - set(routes)):
+        print(f'PERINGATAN: route {missing} belum ada di benchmark')
+
+    client = Client()
+    results = {}
+    for name, prepare in routes.items():
+        results[name] = r = measure(client, prepare(REPEAT + 1))
+        flag = '' if all(200 <= s < 300 for s in r['status']) else f"  status {r['status']}"
+        print(f"{name:45} median {r['median_ms']:8.2f} ms  p95 {r['p95_ms']:8.2f} ms  "
+              f"{r['queries']:3d} query{flag}")
+
+    commit = git_commit()
+    output = sys.argv[3] if len(sys.argv) > 3 else \
+        os.path.join(BASE_DIR, 'benchmarks', 'results', f'api_{SCALE}_{commit}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({
+            'meta': {
+                'commit': commit,
+                'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'scale': SCALE,
+                'seed': SEED,
+                'repeat': REPEAT,
+                'rows': rows,
+                'sqlite': connection.Database.sqlite_version,
+                'python': platform.python_version(),
+                'django': django.get_version(),
+            },
+            'routes': results,
+        }, f, indent=2)
+    print(f'hasil ditulis ke {output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Bandingkan throughput server WSGI (gunicorn, sync) vs ASGI (uvicorn, async).
+
+Jalankan dari folder code/ setelah database dev berisi data
+(python manage.py migrate && python manage.py import_lms --legacy-sample):
+
+    python benchmarks/asgi_vs_wsgi.py [jumlah_user] [durasi] [locustfile]
+
+Kedua server dijalankan bergantian dengan jumlah worker yang sama, lalu
+skenario locust (default locusfile.py) dijalankan headless ke /api/v1.
+Hasil ringkasan ditulis ke benchmarks/results/asgi_vs_wsgi.json.
+"""
+import csv
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+BASE_DIR = os.path.abspath(os.path.join(__file__, *[os.pardir] * 2))
+USERS = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+DURATION = sys.argv[2] if len(sys.argv) > 2 else '30s'
+LOCUSTFILE = sys.argv[3] if len(sys.argv) > 3 else 'locusfile.py'
+WORKERS = os.environ.get('BENCH_WORKERS', '2')
+PORT = 8765
+
+SERVERS = {
+    # gunicorn: satu thread melayani satu request sampai selesai
+    'wsgi': [sys.executable, '-m', 'gunicorn', 'simplelms.wsgi:application', '-b', f'127.0.0.1:{PORT}',
+             '-w', WORKERS, '--threads', '4'],
+    # uvicorn: endpoint async tidak memegang thread saat menunggu database
+    'asgi': [sys.executable, '-m', 'uvicorn', 'simplelms.asgi:application', '--host', '127.0.0.1', '--port', str(PORT),
+             '--workers', WORKERS, '--no-access-log'],
+}
+
+
+def wait_ready(timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{PORT}/api/v1/hello', timeout=1)
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError('server tidak merespons')
+
+
+def run_locust(prefix):
+    subprocess.run([sys.executable, '-m', 'locust', '-f', LOCUSTFILE, '--headless', '--only-summary',
+                    '-u', str(USERS), '-r', str(USERS), '-t', DURATION,
+                    '--host', f'http://127.0.0.1:{PORT}/api/v1', '--csv', prefix],
+                   cwd=BASE_DIR, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    with open(f'{prefix}_stats.csv', newline='') as f:
+        row = next(r for r in csv.DictReader(f) if r['Name'] == 'Aggregated')
+    return {
+        'requests': int(row['Request Count']),
+        'failures': int(row['Failure Count']),
+        'rps': float(row['Requests/s']),
+        'median_ms': float(row['Median Response Time']),
+        'p95_ms': float(row['95%']),
+    }
+
+
+def main():
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for mode, command in SERVERS.items():
+            server = subprocess.Popen(command, cwd=BASE_DIR,
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            try:
+                wait_ready()
+                results[mode] = run_locust(os.path.join(tmpdir, mode))
+            finally:
+                server.terminate()
+                server.wait()
+            r = results[mode]
+            print(f"{mode}: {r['rps']:8.1f} req/detik  median {r['median_ms']:.0f} ms  "
+                  f"p95 {r['p95_ms']:.0f} ms  gagal {r['failures']}/{r['requests']}")
+
+    if results['wsgi']['rps']:
+        print(f"asgi/wsgi: {results['asgi']['rps'] / results['wsgi']['rps']:.2f}x")
+
+    output = os.path.join(BASE_DIR, 'benchmarks', 'results', 'asgi_vs_wsgi.json')
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({'users': USERS, 'duration': DURATION, 'workers': int(WORKERS),
+                   'locustfile': LOCUSTFILE, 'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
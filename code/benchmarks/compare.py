@@ -0,0 +1,46 @@
+"""Bandingkan dua hasil benchmarks/api_routes.py, mis. sebelum dan sesudah perubahan.
+
+Jalankan dari folder code/:
+
+    python benchmarks/compare.py benchmarks/results/api_100k_<lama>.json \\
+        benchmarks/results/api_100k_<baru>.json [ambang_persen]
+
+Route yang median-nya berubah lebih dari ambang (default 10%) atau jumlah
+query-nya berubah ditandai. Exit code 1 jika ada route yang lebih lambat,
+sehingga bisa dipakai di CI.
+"""
+import json
+import sys
+
+if len(sys.argv) < 3:
+    sys.exit(__doc__)
+
+with open(sys.argv[1]) as f:
+    old = json.load(f)
+with open(sys.argv[2]) as f:
+    new = json.load(f)
+THRESHOLD = float(sys.argv[3]) if len(sys.argv) > 3 else 10.0
+
+for key in ('scale', 'seed', 'repeat'):
+    if old['meta'][key] != new['meta'][key]:
+        print(f"PERINGATAN: {key} berbeda ({old['meta'][key]} vs {new['meta'][key]}), hasil tidak sebanding")
+
+print(f"{old['meta']['commit']} -> {new['meta']['commit']} (skala {new['meta']['scale']})")
+slower = 0
+for route in sorted(set(old['routes']) | set(new['routes'])):
+    if route not in old['routes'] or route not in new['routes']:
+        print(f"{route:45} hanya ada di {'baru' if route in new['routes'] else 'lama'}")
+        continue
+    a, b = old['routes'][route], new['routes'][route]
+    change = (b['median_ms'] - a['median_ms']) / a['median_ms'] * 100 if a['median_ms'] else 0.0
+    notes = []
+    if change > THRESHOLD:
+        notes.append('LEBIH LAMBAT')
+        slower += 1
+    elif change < -THRESHOLD:
+        notes.append('lebih cepat')
+    if a['queries'] != b['queries']:
+        notes.append(f"query {a['queries']} -> {b['queries']}")
+    print(f"{route:45} {a['median_ms']:8.2f} -> {b['median_ms']:8.2f} ms  {change:+6.1f}%  {'  '.join(notes)}")
+
+sys.exit(1 if slower else 0)
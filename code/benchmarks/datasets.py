@@ -0,0 +1,127 @@
+"""Dataset sintetis untuk benchmark, dengan jumlah baris tetap dan seed tetap.
+
+Dipakai oleh script lain di folder ini setelah django.setup():
+
+    from datasets import SCALES, seed_dataset
+    seed_dataset('100k')
+
+Skala adalah total baris di Course, CourseMember, CourseContent dan Comment.
+Sebaran dibuat miring (course dengan id kecil lebih populer) agar ada course
+dengan banyak member, konten dan komentar seperti data produksi. Semua user
+memakai password DATASET_PASSWORD.
+"""
+import random
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from lms_core.models import Course, CourseMember, CourseContent, Comment
+from lms_core.search import rebuild_search_index
+
+SCALES = {'1k': 1_000, '100k': 100_000, '1m': 1_000_000}
+DATASET_PASSWORD = 'password123'
+COURSES_PER_STUDENT = 5
+BATCH_SIZE = 5000
+
+
+def plan(total):
+    """Jumlah baris per model untuk total `total` baris."""
+    courses = max(total // 100, COURSES_PER_STUDENT)
+    contents = total * 15 // 100
+    members = total * 25 // 100
+    return {
+        'teachers': max(courses // 10, 1),
+        'students': max(members // COURSES_PER_STUDENT, 1),
+        'courses': courses,
+        'members': members,
+        'contents': contents,
+        'comments': total - courses - members - contents,
+    }
+
+
+def _skewed(rng, n):
+    return int(n * rng.random() ** 2)
+
+
+def _bulk_create(model, objects):
+    batch = []
+    for obj in objects:
+        batch.append(obj)
+        if len(batch) == BATCH_SIZE:
+            model.objects.bulk_create(batch)
+            batch = []
+    model.objects.bulk_create(batch)
+
+
+def _ids(model, **filters):
+    return list(model.objects.filter(**filters).order_by('id').values_list('id', flat=True))
+
+
+def seed_dataset(scale, seed=42, verbose=True):
+    """Isi database (yang masih kosong) dengan dataset `scale`; kembalikan jumlah baris per model."""
+    counts = plan(SCALES[scale])
+    rng = random.Random(seed)
+    password = make_password(DATASET_PASSWORD)  # satu hash untuk semua user
+    started = time.perf_counter()
+
+    with transaction.atomic():
+        _bulk_create(User, (User(username=f'teacher{i}', email=f'teacher{i}@lms.test', password=password,
+                                 first_name='Guru', last_name=str(i)) for i in range(counts['teachers'])))
+        _bulk_create(User, (User(username=f'user{i}', email=f'user{i}@lms.test', password=password,
+                                 first_name='Siswa', last_name=str(i)) for i in range(counts['students'])))
+        teachers = _ids(User, username__startswith='teacher')
+        students = _ids(User, username__startswith='user')
+
+        _bulk_create(Course, (Course(name=f'Kursus {i} Python Django', description=f'Materi kursus {i} ' * 5,
+                                     price=rng.randrange(0, 500_000, 1000), teacher_id=teachers[i % len(teachers)])
+                              for i in range(counts['courses'])))
+        courses = _ids(Course)
+
+        def members():
+            created = 0
+            for user_id in students:
+                start = _skewed(rng, len(courses))
+                for k in range(COURSES_PER_STUDENT):
+                    if created == counts['members']:
+                        return
+                    created += 1
+                    yield CourseMember(course_id_id=courses[(start + k) % len(courses)], user_id_id=user_id)
+        _bulk_create(CourseMember, members())
+
+        # 2/3 konten di level atas, sisanya sub-konten dari konten level atas course yang sama
+        roots = counts['contents'] * 2 // 3
+        _bulk_create(CourseContent, (CourseContent(name=f'Bab {i}', description='-', course_id_id=courses[_skewed(rng, len(courses))])
+                                     for i in range(roots)))
+        root_rows = list(CourseContent.objects.order_by('id').values_list('id', 'course_id'))
+
+        def children():
+            for i in range(counts['contents'] - roots):
+                parent_id, course_id = root_rows[_skewed(rng, len(root_rows))]
+                yield CourseContent(name=f'Sub bab {i}', description='-', course_id_id=course_id, parent_id_id=parent_id)
+        _bulk_create(CourseContent, children())
+        CourseContent.objects.rebuild_paths()
+
+        members_by_course = {}
+        for member_id, course_id in CourseMember.objects.order_by('id').values_list('id', 'course_id'):
+            members_by_course.setdefault(course_id, []).append(member_id)
+        contents = [(content_id, members_by_course[course_id])
+                    for content_id, course_id in CourseContent.objects.order_by('id').values_list('id', 'course_id')
+                    if course_id in members_by_course]
+
+        def comments():
+            for i in range(counts['comments']):
+                content_id, course_members = contents[_skewed(rng, len(contents))]
+                yield Comment(content_id_id=content_id, member_id_id=rng.choice(course_members),
+                              comment=f'Komentar {i}')
+        _bulk_create(Comment, comments())
+
+        # bulk_create melewati save() dan signal: counter & index pencarian diisi ulang
+        Course.objects.rebuild_counters()
+        rebuild_search_index()
+
+    rows = {model.__name__: model.objects.count() for model in (User, Course, CourseMember, CourseContent, Comment)}
+    if verbose:
+        print(f'dataset {scale}: {rows} ({time.perf_counter() - started:.1f} detik)')
+    return rows
@@ -0,0 +1,94 @@
+"""Bandingkan biaya koneksi database per request: koneksi baru, persisten, dan pool.
+
+Jalankan dari folder code/ dengan PostgreSQL yang sudah di-migrate, mis.:
+
+    POSTGRES_HOST=localhost POSTGRES_PORT=5551 POSTGRES_PASSWORD=simple_password \\
+        python benchmarks/db_connections.py [jumlah_request] [jumlah_thread]
+
+Setiap "request" meniru siklus Django: sinyal request_started, satu query
+ringan, lalu request_finished (di sinilah koneksi ditutup atau dikembalikan
+ke pool). Mode pool hanya dijalankan jika psycopg 3 + psycopg-pool terpasang.
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(__file__, *[os.pardir] * 2)))
+os.environ['DJANGO_SETTINGS_MODULE'] = 'simplelms.settings'
+
+from django.conf import settings
+
+REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+THREADS = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+default = settings.DATABASES['default']
+if default['ENGINE'] != 'django.db.backends.postgresql':
+    sys.exit('Set POSTGRES_HOST (dan POSTGRES_*) agar benchmark memakai PostgreSQL')
+
+base = {key: value for key, value in default.items() if key not in ('OPTIONS', 'CONN_MAX_AGE')}
+MODES = {
+    'koneksi baru': {**base, 'CONN_MAX_AGE': 0, 'OPTIONS': {}},
+    'persisten': {**base, 'CONN_MAX_AGE': 600, 'OPTIONS': {}},
+}
+try:
+    import psycopg_pool  # noqa: F401
+    import psycopg  # noqa: F401
+    MODES['pool'] = {**base, 'CONN_MAX_AGE': 0,
+                     'OPTIONS': {'pool': {'min_size': THREADS, 'max_size': THREADS}}}
+except ImportError:
+    print('psycopg 3 / psycopg-pool tidak terpasang, mode pool dilewati')
+settings.DATABASES.update(MODES)
+
+import django
+django.setup()
+
+from django.core.signals import request_finished, request_started
+from django.db import connections
+
+
+def fake_request(alias):
+    request_started.send(sender=None)
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute('SELECT id FROM auth_user ORDER BY id LIMIT 1')
+            cursor.fetchone()
+    finally:
+        request_finished.send(sender=None)
+
+
+def worker(alias, count):
+    latencies = []
+    try:
+        for _ in range(count):
+            start = time.perf_counter()
+            fake_request(alias)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        connections[alias].close()
+    return latencies
+
+
+def run(alias):
+    worker(alias, 5)  # pemanasan, mis. mengisi pool
+    per_thread = REQUESTS // THREADS
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        results = executor.map(worker, [alias] * THREADS, [per_thread] * THREADS)
+        latencies = sorted(lat for part in results for lat in part)
+    elapsed = time.perf_counter() - start
+    median = latencies[len(latencies) // 2] * 1000
+    p95 = latencies[int(len(latencies) * 0.95)] * 1000
+    return len(latencies) / elapsed, median, p95
+
+
+results = {}
+for alias in MODES:
+    rps, median, p95 = run(alias)
+    results[alias] = rps
+    print(f'{alias:14} {rps:9.1f} request/detik  median {median:6.2f} ms  p95 {p95:6.2f} ms')
+
+baseline = results['koneksi baru']
+for alias, rps in results.items():
+    if alias != 'koneksi baru':
+        print(f'{alias} vs koneksi baru: {rps / baseline:.1f}x')
@@ -0,0 +1,170 @@
+"""Load test end-to-end: dataset sintetis + server lokal + locust dengan banyak user.
+
+Jalankan dari folder code/:
+
+    python benchmarks/load_test.py [skala] [jumlah_user] [durasi] [asgi|wsgi]
+
+Langkah: buat database SQLite sementara berisi dataset `skala` (lihat
+benchmarks/datasets.py), jalankan server (uvicorn atau gunicorn) dengan
+SQLITE_PATH ke database itu, lalu jalankan skenario benchmarks/locust_lms.py
+secara headless. Setiap user virtual login sebagai akun dataset yang berbeda.
+
+SQLite hanya mengizinkan satu penulis, jadi server dijalankan dengan satu
+worker (dan satu thread); lebih dari itu request tulis gagal dengan "database
+is locked" yang terlihat seperti error aplikasi. Untuk BENCH_WORKERS > 1 set
+POSTGRES_HOST (dan POSTGRES_DB dst., lihat settings) ke database PostgreSQL
+kosong: dataset dibuat di sana dan tidak dihapus setelahnya.
+Laporan throughput & latensi per route ditulis ke
+benchmarks/results/load_<skala>_<server>_<commit>.json.
+"""
+import csv
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from datetime import datetime, timezone
+
+BASE_DIR = os.path.abspath(os.path.join(__file__, *[os.pardir] * 2))
+sys.path.append(BASE_DIR)
+
+SCALE = sys.argv[1] if len(sys.argv) > 1 else '1k'
+USERS = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+DURATION = sys.argv[3] if len(sys.argv) > 3 else '60s'
+SERVER = sys.argv[4] if len(sys.argv) > 4 else 'asgi'
+POSTGRES = bool(os.environ.get('POSTGRES_HOST'))
+WORKERS = os.environ.get('BENCH_WORKERS', '2' if POSTGRES else '1')
+PORT = 8766
+SEED = 42
+
+tmpdir = tempfile.TemporaryDirectory()
+if not POSTGRES:
+    os.environ['SQLITE_PATH'] = os.path.join(tmpdir.name, 'load.sqlite3')
+os.environ['DJANGO_SETTINGS_MODULE'] = 'simplelms.settings'
+
+import django
+django.setup()
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection, connections
+
+from datasets import DATASET_PASSWORD, SCALES, plan, seed_dataset
+
+SERVERS = {
+    'asgi': [sys.executable, '-m', 'uvicorn', 'simplelms.asgi:application', '--host', '127.0.0.1',
+             '--port', str(PORT), '--workers', WORKERS, '--no-access-log'],
+    'wsgi': [sys.executable, '-m', 'gunicorn', 'simplelms.wsgi:application', '-b', f'127.0.0.1:{PORT}',
+             '-w', WORKERS, '--threads', '4' if POSTGRES else '1'],
+}
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def wait_ready(timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{PORT}/api/v1/hello', timeout=1)
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError('server tidak merespons')
+
+
+def run_locust(prefix, counts):
+    # id asli user siswa (bukan diasumsikan berurutan), lewat file karena bisa puluhan ribu
+    student_ids = os.path.join(tmpdir.name, 'student_ids.json')
+    with open(student_ids, 'w') as f:
+        json.dump(list(User.objects.filter(username__startswith='user').values_list('id', flat=True)), f)
+    env = {**os.environ, 'LMS_STUDENTS': str(counts['students']), 'LMS_TEACHERS': str(counts['teachers']),
+           'LMS_PASSWORD': DATASET_PASSWORD, 'LMS_STUDENT_IDS_FILE': student_ids}
+    subprocess.run([sys.executable, '-m', 'locust', '-f', os.path.join('benchmarks', 'locust_lms.py'),
+                    '--headless', '--only-summary', '-u', str(USERS), '-r', str(max(USERS // 10, 1)),
+                    '-t', DURATION, '--host', f'http://127.0.0.1:{PORT}', '--csv', prefix],
+                   cwd=BASE_DIR, env=env, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    routes = {}
+    with open(f'{prefix}_stats.csv', newline='') as f:
+        for row in csv.DictReader(f):
+            routes[row['Name']] = {
+                'requests': int(row['Request Count']),
+                'failures': int(row['Failure Count']),
+                'rps': round(float(row['Requests/s']), 2),
+                'median_ms': float(row['Median Response Time']),
+                'p95_ms': float(row['95%']),
+                'p99_ms': float(row['99%']),
+                'mean_ms': round(float(row['Average Response Time']), 2),
+            }
+    with open(f'{prefix}_failures.csv', newline='') as f:
+        failures = [{'route': row['Name'], 'error': row['Error'], 'count': int(row['Occurrences'])}
+                    for row in csv.DictReader(f)]
+    return routes, failures
+
+
+def main():
+    if SCALE not in SCALES or SERVER not in SERVERS:
+        sys.exit(f'pilih skala {", ".join(SCALES)} dan server {", ".join(SERVERS)}')
+    if not POSTGRES and int(WORKERS) > 1:
+        sys.exit('SQLite hanya mengizinkan satu penulis: pakai BENCH_WORKERS=1 '
+                 'atau PostgreSQL (POSTGRES_HOST) untuk banyak worker')
+    call_command('migrate', verbosity=0)
+    if User.objects.exists():
+        sys.exit(f'database {connection.settings_dict["NAME"]} harus kosong')
+    rows = seed_dataset(SCALE, seed=SEED)
+    connections.close_all()
+    counts = plan(SCALES[SCALE])
+
+    server = subprocess.Popen(SERVERS[SERVER], cwd=BASE_DIR, env=os.environ,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_ready()
+        print(f'{SERVER} siap, {USERS} user selama {DURATION}...')
+        routes, failures = run_locust(os.path.join(tmpdir.name, 'locust'), counts)
+    finally:
+        server.terminate()
+        server.wait()
+
+    total = routes.pop('Aggregated')
+    for name, r in sorted(routes.items()):
+        print(f"{name:45} {r['rps']:7.1f} req/detik  median {r['median_ms']:6.0f} ms  "
+              f"p95 {r['p95_ms']:6.0f} ms  gagal {r['failures']}/{r['requests']}")
+    print(f"{'total':45} {total['rps']:7.1f} req/detik  median {total['median_ms']:6.0f} ms  "
+          f"p95 {total['p95_ms']:6.0f} ms  gagal {total['failures']}/{total['requests']}")
+    for failure in failures:
+        print(f"gagal: {failure['route']} {failure['error']} ({failure['count']}x)")
+
+    commit = git_commit()
+    output = os.path.join(BASE_DIR, 'benchmarks', 'results', f'load_{SCALE}_{SERVER}_{commit}.json')
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({
+            'meta': {
+                'commit': commit,
+                'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'scale': SCALE,
+                'seed': SEED,
+                'rows': rows,
+                'server': SERVER,
+                'database': connection.vendor,
+                'workers': int(WORKERS),
+                'users': USERS,
+                'duration': DURATION,
+            },
+            'total': total,
+            'routes': routes,
+            'failures': failures,
+        }, f, indent=2)
+    print(f'laporan ditulis ke {output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+"""Skenario locust untuk benchmarks/load_test.py: banyak user berbeda dari dataset sintetis.
+
+Setiap user virtual login (POST /api/v1/auth/sign-in) sebagai akun dataset
+yang berbeda, lalu menjalankan campuran request baca/tulis berbobot ke route
+/api/v1 yang sebenarnya. Konfigurasi lewat environment (diisi load_test.py):
+LMS_STUDENTS, LMS_TEACHERS, LMS_PASSWORD dan LMS_STUDENT_IDS_FILE (JSON
+berisi id user siswa, untuk bulk enroll).
+
+Request dikelompokkan per route (nama seperti di lms_core.api.router) agar
+laporan tidak dipecah per id. Katalog (/courses, /courses/cursor,
+/courses/search) diminta tanpa header Authorization seperti pengunjung
+anonim, karena lms_core.cache hanya meng-cache request tanpa header itu.
+"""
+import itertools
+import json
+import os
+import random
+
+from locust import HttpUser, between, task
+
+API = '/api/v1/'
+STUDENTS = int(os.environ.get('LMS_STUDENTS', 1))
+TEACHERS = int(os.environ.get('LMS_TEACHERS', 1))
+PASSWORD = os.environ.get('LMS_PASSWORD', 'password123')
+STUDENT_IDS_FILE = os.environ.get('LMS_STUDENT_IDS_FILE')
+SEARCH_TERMS = ['python', 'django', 'kursus', 'materi', 'pyth']
+
+if STUDENT_IDS_FILE:
+    with open(STUDENT_IDS_FILE) as f:
+        STUDENT_IDS = json.load(f)
+else:
+    STUDENT_IDS = []
+
+_student_numbers = itertools.count()
+_teacher_numbers = itertools.count()
+
+
+class LmsUser(HttpUser):
+    abstract = True
+    wait_time = between(0.5, 1.5)
+
+    def sign_in(self, username):
+        response = self.client.post(API + 'auth/sign-in', name='POST /auth/sign-in',
+                                    json={'username': username, 'password': PASSWORD})
+        response.raise_for_status()
+        self.headers = {'Authorization': f"Bearer {response.json()['access']}"}
+
+    def get(self, path, name, **kwargs):
+        return self.client.get(API + path, name=f'GET {name}', headers=self.headers, **kwargs)
+
+    def get_catalog(self, path, name, **kwargs):
+        return self.client.get(API + path, name=f'GET {name}', **kwargs)
+
+    def post(self, path, name, **kwargs):
+        return self.client.post(API + path, name=f'POST {name}', headers=self.headers, **kwargs)
+
+
+class Student(LmsUser):
+    """Siswa: kebanyakan membaca katalog, konten dan komentar; sesekali menulis."""
+    weight = 9
+
+    def on_start(self):
+        self.sign_in(f'user{next(_student_numbers) % STUDENTS}')
+        self.course_ids = []
+        self.content_ids = {}
+        self.comment_ids = []
+        self.load_my_courses()
+
+    def load_my_courses(self):
+        response = self.get('mycourses', '/mycourses')
+        if response.ok:
+            self.course_ids = [row['course_id']['id'] for row in response.json()]
+
+    def content_id(self):
+        if not self.course_ids:
+            return None
+        course_id = random.choice(self.course_ids)
+        if course_id not in self.content_ids:
+            response = self.get(f'courses/{course_id}/contents', '/courses/{course_id}/contents')
+            self.content_ids[course_id] = [node['id'] for node in response.json()] if response.ok else []
+        contents = self.content_ids[course_id]
+        return random.choice(contents) if contents else None
+
+    @task(10)
+    def list_courses(self):
+        self.get_catalog('courses', '/courses', params={'page': random.randint(1, 5)})
+
+    @task(3)
+    def list_courses_cursor(self):
+        self.get_catalog('courses/cursor', '/courses/cursor')
+
+    @task(4)
+    def search_courses(self):
+        self.get_catalog('courses/search', '/courses/search', params={'q': random.choice(SEARCH_TERMS)})
+
+    @task(5)
+    def my_courses(self):
+        self.load_my_courses()
+
+    @task(6)
+    def course_contents(self):
+        if self.course_ids:
+            course_id = random.choice(self.course_ids)
+            self.get(f'courses/{course_id}/contents', '/courses/{course_id}/contents')
+
+    @task(6)
+    def list_comments(self):
+        content_id = self.content_id()
+        if content_id:
+            self.get(f'contents/{content_id}/comments', '/contents/{content_id}/comments')
+
+    @task(3)
+    def create_comment(self):
+        content_id = self.content_id()
+        if content_id:
+            response = self.post(f'contents/{content_id}/comments/', '/contents/{content_id}/comments/',
+                                 json={'comment': 'Komentar dari load test'})
+            if response.status_code == 201:
+                self.comment_ids.append(response.json()['id'])
+
+    @task(1)
+    def create_comments_bulk(self):
+        content_id = self.content_id()
+        if content_id:
+            response = self.post(f'contents/{content_id}/comments/bulk', '/contents/{content_id}/comments/bulk',
+                                 json={'comments': [{'comment': f'Bulk {i}'} for i in range(5)]})
+            if response.status_code == 201:
+                self.comment_ids += [row['id'] for row in response.json()]
+
+    @task(2)
+    def delete_comment(self):
+        if self.comment_ids:
+            comment_id = self.comment_ids.pop()
+            self.client.delete(f'{API}comments/{comment_id}', name='DELETE /comments/{comment_id}',
+                               headers=self.headers)
+
+    @task(1)
+    def delete_comments_bulk(self):
+        if len(self.comment_ids) >= 5:
+            ids, self.comment_ids = self.comment_ids[-5:], self.comment_ids[:-5]
+            self.post('comments/bulk-delete', '/comments/bulk-delete', json={'ids': ids})
+
+    @task(1)
+    def enroll(self):
+        response = self.get_catalog('courses', '/courses', params={'fields': 'id'})
+        if not response.ok:
+            return
+        course_id = random.choice(response.json()['items'])['id']
+        with self.post(f'courses/{course_id}/enroll/', '/courses/{course_id}/enroll/',
+                       catch_response=True) as response:
+            # sudah terdaftar (400) adalah hasil yang wajar, bukan kegagalan
+            if response.status_code in (200, 400):
+                response.success()
+                if response.status_code == 200:
+                    self.course_ids.append(course_id)
+
+
+class Teacher(LmsUser):
+    """Pengajar: membuat & memperbarui course miliknya dan mendaftarkan siswa."""
+    weight = 1
+
+    def on_start(self):
+        self.sign_in(f'teacher{next(_teacher_numbers) % TEACHERS}')
+        response = self.post('courses', '/courses',
+                             data={'name': 'Kursus load test', 'description': '-', 'price': 1000})
+        self.course_id = response.json()['id'] if response.status_code == 201 else None
+
+    @task(5)
+    def list_courses(self):
+        self.get_catalog('courses', '/courses')
+
+    @task(2)
+    def update_course(self):
+        if self.course_id:
+            self.post(f'courses/{self.course_id}', '/courses/{course_id}',
+                      data={'name': 'Kursus load test', 'description': 'Diperbarui', 'price': random.randint(1, 100) * 1000})
+
+    @task(1)
+    def create_course(self):
+        self.post('courses', '/courses', data={'name': 'Kursus baru', 'description': '-', 'price': 1000})
+
+    @task(1)
+    def enroll_bulk(self):
+        if self.course_id and STUDENT_IDS:
+            user_ids = random.sample(STUDENT_IDS, min(20, len(STUDENT_IDS)))
+            self.post(f'courses/{self.course_id}/enroll/bulk', '/courses/{course_id}/enroll/bulk',
+                      json={'user_ids': user_ids})
@@ -0,0 +1,90 @@
+"""Bandingkan query plan & waktu query sebelum/sesudah migrasi index 0005.
+
+Jalankan dari folder code/:  python benchmarks/query_plans.py [jumlah_course]
+
+Script memakai database SQLite sementara sehingga database dev tidak tersentuh.
+Data dibuat lewat model historis (state migrasi 0004), bukan lms_core.models,
+karena model saat ini membawa kolom dari migrasi sesudahnya.
+"""
+import os
+import sys
+import tempfile
+import time
+from random import randint, seed
+
+sys.path.append(os.path.abspath(os.path.join(__file__, *[os.pardir] * 2)))
+os.environ['DJANGO_SETTINGS_MODULE'] = 'simplelms.settings'
+
+from django.conf import settings
+
+tmpdir = tempfile.TemporaryDirectory()
+settings.DATABASES['default']['NAME'] = os.path.join(tmpdir.name, 'bench.sqlite3')
+
+import django
+django.setup()
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+
+SCALE = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+REPEAT = 200
+
+
+def models_at(migration):
+    apps = MigrationExecutor(connection).loader.project_state(('lms_core', migration)).apps
+    return [apps.get_model('auth', 'User')] + [apps.get_model('lms_core', name) for name in
+                                               ('Course', 'CourseMember', 'CourseContent', 'Comment')]
+
+
+def seed_data(migration):
+    User, Course, CourseMember, CourseContent, Comment = models_at(migration)
+    seed(42)
+    User.objects.bulk_create([User(username=f'user{i}', password='!') for i in range(SCALE)])
+    users = list(User.objects.values_list('id', flat=True))
+    Course.objects.bulk_create([Course(name=f'Course {i}', description='-', price=1000,
+                                       teacher_id=users[i % len(users)]) for i in range(SCALE)])
+    courses = list(Course.objects.values_list('id', flat=True))
+    pairs = {(courses[randint(0, SCALE - 1)], users[randint(0, SCALE - 1)]) for _ in range(SCALE * 10)}
+    CourseMember.objects.bulk_create([CourseMember(course_id_id=c, user_id_id=u) for c, u in pairs])
+    CourseContent.objects.bulk_create([CourseContent(name=f'Content {i}', course_id_id=courses[i % SCALE])
+                                       for i in range(SCALE * 5)])
+    contents = list(CourseContent.objects.values_list('id', flat=True))
+    members = list(CourseMember.objects.values_list('id', flat=True))
+    Comment.objects.bulk_create([Comment(content_id_id=contents[randint(0, len(contents) - 1)],
+                                         member_id_id=members[randint(0, len(members) - 1)],
+                                         comment='-') for _ in range(SCALE * 10)], batch_size=5000)
+
+
+def sample_queries(migration):
+    _, Course, CourseMember, CourseContent, Comment = models_at(migration)
+    member = CourseMember.objects.order_by('?').first()
+    content = Comment.objects.order_by('?').first().content_id_id
+    return {
+        'is_member': CourseMember.objects.filter(course_id=member.course_id_id, user_id=member.user_id_id),
+        'course_listing': Course.objects.order_by('-created_at', '-id')[:20],
+        'content_roots': CourseContent.objects.filter(course_id=member.course_id_id, parent_id=None),
+        'comment_feed': Comment.objects.filter(content_id=content).order_by('created_at')[:20],
+    }
+
+
+def measure(label, migration):
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+    print(f'\n===== {label} =====')
+    for name, queryset in sample_queries(migration).items():
+        plan = queryset.explain()
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            list(queryset.all())
+        elapsed = (time.perf_counter() - start) / REPEAT * 1000
+        print(f'--- {name}: {elapsed:.3f} ms/query')
+        print(plan)
+
+
+call_command('migrate', verbosity=0)
+call_command('migrate', 'lms_core', '0004_dedupe_course_members', verbosity=0)
+seed_data('0004_dedupe_course_members')
+measure('sebelum (0004)', '0004_dedupe_course_members')
+call_command('migrate', 'lms_core', '0005_access_pattern_indexes', verbosity=0)
+measure('sesudah (0005)', '0005_access_pattern_indexes')
@@ -0,0 +1,59 @@
+"""Bandingkan throughput renderer JSON Ninja bawaan vs ORJSONRenderer.
+
+Jalankan dari folder code/:  python benchmarks/renderer.py [jumlah_course] [ulangan]
+
+Payload meniru response GET /courses (CourseSchemaOut + teacher) tanpa database.
+"""
+import os
+import sys
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+sys.path.append(os.path.abspath(os.path.join(__file__, *[os.pardir] * 2)))
+os.environ['DJANGO_SETTINGS_MODULE'] = 'simplelms.settings'
+import django
+django.setup()
+
+from django.utils import timezone
+from ninja.renderers import JSONRenderer
+from lms_core.renderers import ORJSONRenderer
+
+COURSES = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+REPEAT = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+
+def make_payload():
+    now = timezone.now()
+    items = [{
+        'id': i,
+        'name': f'Course {i}',
+        'description': 'Belajar Django dengan Mudah ' * 10,
+        'price': Decimal('150000.00') if i % 2 else 150000,
+        'image': f'/media/course/{i}.png',
+        'teacher': {'id': i % 50, 'email': f'guru{i % 50}@mail.com',
+                    'first_name': 'Guru', 'last_name': str(i % 50)},
+        'created_at': now - timedelta(minutes=i),
+        'updated_at': now,
+    } for i in range(COURSES)]
+    return {'items': items, 'count': COURSES}
+
+
+def measure(renderer, payload):
+    renderer.render(None, payload, response_status=200)
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        body = renderer.render(None, payload, response_status=200)
+    elapsed = time.perf_counter() - start
+    return elapsed / REPEAT * 1000, len(body)
+
+
+payload = make_payload()
+results = {}
+for name, renderer in [('JSONRenderer (json stdlib)', JSONRenderer()), ('ORJSONRenderer', ORJSONRenderer())]:
+    ms, size = measure(renderer, payload)
+    results[name] = ms
+    print(f'{name:28} {ms:8.2f} ms/response  {1000 / ms:8.1f} response/detik  {size} byte')
+
+baseline, fast = results.values()
+print(f'percepatan: {baseline / fast:.1f}x untuk {COURSES} course')
@@ -1,40 +1,88 @@
 from ninja import NinjaAPI, UploadedFile, File, Form, Router, Schema
 from ninja.responses import Response
-from typing import List
-from lms_core.schema import CourseSchemaOut, CourseMemberOut, CourseSchemaIn
-from lms_core.schema import CourseContentMini, CourseContentFull
-from lms_core.schema import CourseCommentOut, CourseCommentIn
+from typing import List, Optional
+from lms_core.schema import CourseSchemaOut, CourseMemberOut, CourseSchemaIn, CourseEnrollBulkIn
+from lms_core.schema import CourseContentMini, CourseContentFull, CourseContentNode
+from lms_core.schema import CourseCommentOut, CourseCommentListOut, CourseCommentIn, CourseCommentBulkIn, CommentBulkDeleteIn
 from lms_core.models import Course, CourseMember, CourseContent, Comment # Keep existing imports
 from ninja_simple_jwt.auth.views.api import mobile_auth_router
-from ninja_simple_jwt.auth.ninja_auth import HttpJwtAuth
+from lms_core.auth import CachedJwtAuth
 from ninja.pagination import paginate, PageNumberPagination
+from ninja.decorators import decorate_view
+from lms_core.cache import cache_response
+from lms_core.pagination import SparsePageNumberPagination, SparseCursorPagination
+from lms_core.fields import sparse_schema, file_lookups
+from lms_core.renderers import get_renderer
+from lms_core.membership import get_memberships
+from lms_core.images import save_course_image
+from lms_core.search import search_courses
 from django.contrib.auth.models import User
 from rest_framework import status
 
-from django.shortcuts import get_object_or_404
+from django.shortcuts import get_object_or_404, aget_object_or_404
+from lms_core.utils import schema_values_fields, nest_values
+from django.db import IntegrityError, transaction
 
 # Inisialisasi API dan otentikasi
-apiAuth = HttpJwtAuth()
-apiv1 = NinjaAPI()
+apiAuth = CachedJwtAuth()
+apiv1 = NinjaAPI(renderer=get_renderer())
 apiv1.add_router("/auth/", mobile_auth_router)
 
 # Router utama
 router = Router()
 
 # Hello endpoint
+# Endpoint baca dibuat async: di bawah server ASGI menunggu database tidak
+# memblokir worker, di bawah WSGI Django menjalankannya lewat async_to_sync.
 class HelloResponse(Schema):
     msg: str
 
 @router.get("/hello", response=HelloResponse)
-def hello(request):
+@decorate_view(cache_response("hello"))
+async def hello(request):
     return {"msg": "Hello World"}
 
 # List courses
-@router.get("/courses", response=List[CourseSchemaOut])
-@paginate(PageNumberPagination)
-def list_courses(request):
+# ?fields=id,name,teacher.first_name membatasi kolom yang di-query & dikirim;
+# teacher di-join dalam query yang sama, tidak ada query per baris
+@router.get("/courses", response=List[sparse_schema(CourseSchemaOut)], exclude_unset=True)
+@decorate_view(cache_response("courses"))
+@paginate(SparsePageNumberPagination, schema=CourseSchemaOut)
+async def list_courses(request):
     return Course.objects.all()
 
+# List courses dengan cursor (keyset) pagination, tanpa COUNT/OFFSET
+@router.get("/courses/cursor", response=List[sparse_schema(CourseSchemaOut, "CursorItem")], exclude_unset=True)
+@decorate_view(cache_response("courses"))
+@paginate(SparseCursorPagination, schema=CourseSchemaOut)
+async def list_courses_cursor(request):
+    return Course.objects.all()
+
+# Full-text search, diurutkan berdasarkan relevansi (tsvector + GIN di PostgreSQL,
+# FTS5 di SQLite). Didaftarkan sebelum /courses/{course_id}.
+@router.get("/courses/search", response=List[sparse_schema(CourseSchemaOut)], exclude_unset=True)
+@decorate_view(cache_response("courses"))
+@paginate(SparsePageNumberPagination, schema=CourseSchemaOut)
+async def search_course(request, q: str):
+    return search_courses(q)
+
+# My courses
+@router.get("/mycourses", auth=apiAuth, response=List[CourseMemberOut])
+def my_courses(request):
+    # Satu query JOIN (member, course, teacher, user) yang hanya mengambil kolom
+    # yang dipakai CourseMemberOut, tanpa lazy load per baris.
+    lookups = schema_values_fields(CourseMemberOut)
+    rows = CourseMember.objects.filter(user_id=request.user.id) \
+                               .order_by('-created_at') \
+                               .values(*lookups)
+    files = file_lookups(CourseMember, lookups)
+    result = []
+    for row in rows:
+        for lookup, storage in files:
+            row[lookup] = storage.url(row[lookup]) if row[lookup] else None
+        result.append(nest_values(row))
+    return result
+
 # Create course
 @router.post("/courses", auth=apiAuth, response=CourseSchemaOut)
 def create_course(
@@ -44,18 +92,16 @@ def create_course(
     price: int = Form(...),
     file: UploadedFile = File(None),
 ):
-    user = User.objects.create_user(username='hehehe',password='password123')
-
-    # Ensure user is authenticated before creating a course
-    # if not request.user.is_authenticated:
-    #     return Response({"detail": "Authentication required."}, status=401)
-
-    course = Course.objects.create(
-        name=name,
-        description=description,
-        price=price,
-        teacher=user, # request.user should now be a proper User object
-    )
+    with transaction.atomic():
+        course = Course.objects.create(
+            name=name,
+            description=description,
+            price=price,
+            teacher_id=request.user.id, # id user diambil dari klaim JWT
+        )
+        if file:
+            save_course_image(course, file)
+            course.save(update_fields=['image', 'image_thumb', 'image_medium'])
     return Response({"id": course.id, "name": course.name, "description": course.description, "price": course.price}, status=201 )
 
 # Update course
@@ -68,54 +114,90 @@ def update_course(
     price: int = Form(...),
     file: UploadedFile = File(None),
 ):
-    course = get_object_or_404(Course, id=course_id)
+    # teacher ikut di-join karena dipakai CourseSchemaOut di response
+    course = get_object_or_404(Course.objects.select_related('teacher'), id=course_id)
+    if course.teacher_id != request.user.id:
+        return Response({'error': 'You are not authorized to update this course'}, status=status.HTTP_401_UNAUTHORIZED)
+
     course.name = name
     course.description = description
     course.price = price
 
-    # Jika file di-upload, perbarui image
-    if file:
-        course.image.save(file.name, file.file, save=False)
-
-    course.save()
+    # Jika file di-upload, perbarui image; thumbnail dibuat di background.
+    # Counter dan varian gambar yang sedang dibuat job tidak ikut ditulis
+    # agar perubahan dari request/job lain tidak tertimpa.
+    fields = ['name', 'description', 'price', 'updated_at']
+    with transaction.atomic():
+        if file:
+            save_course_image(course, file)
+            fields += ['image', 'image_thumb', 'image_medium']
+        course.save(update_fields=fields)
     return course
 
 from ninja.errors import HttpError
 
-@router.post("/courses/{course_id}/enroll/")
+@router.post("/courses/{course_id}/enroll/", auth=apiAuth)
 def enroll_course(request, course_id: int):
-    course = get_object_or_404(Course, id=course_id)
+    # Satu INSERT ... SELECT; unique constraint yang menolak pendaftaran ganda,
+    # sehingga aman walaupun ada request bersamaan.
+    try:
+        with transaction.atomic():
+            enrolled = CourseMember.objects.enroll(course_id, request.user.id)
+    except IntegrityError:
+        # hanya bentrok unique_course_member yang berarti sudah terdaftar
+        if CourseMember.objects.filter(course_id=course_id, user_id=request.user.id).exists():
+            raise HttpError(400, "You are already enrolled in this course.")
+        raise
+
+    # course tidak ada, atau user token sudah dihapus
+    if not enrolled:
+        raise HttpError(404, "Not Found")
+    return {"message": "Enrolled successfully"}
 
-    user, created = User.objects.get_or_create(username="user", defaults={"password": "password"}) # temporary fix
+@router.post("/courses/{course_id}/enroll/bulk", auth=apiAuth)
+def enroll_course_bulk(request, course_id: int, payload: CourseEnrollBulkIn):
+    course = get_object_or_404(Course.objects.only('id', 'teacher_id'), id=course_id)
+    if course.teacher_id != request.user.id:
+        return Response({'error': 'You are not authorized to enroll users in this course'}, status=status.HTTP_401_UNAUTHORIZED)
 
-    if CourseMember.objects.filter(course_id=course, user_id=user).exists():
-        raise HttpError(400, "You are already enrolled in this course.")
+    user_ids = list(dict.fromkeys(payload.user_ids))
+    enrolled = CourseMember.objects.enroll_many(course.id, user_ids)
+    return {"enrolled": enrolled, "skipped": len(user_ids) - enrolled}
 
-    CourseMember.objects.create(course_id=course, user_id=user)
-    return {"message": "Enrolled successfully"}
 
+# Course contents (tree)
+@router.get("/courses/{course_id}/contents", response=List[CourseContentNode])
+async def list_course_contents(request, course_id: int, root: Optional[int] = None):
+    root_content = None
+    if root is not None:
+        root_content = await aget_object_or_404(CourseContent.objects.only('id', 'path'), id=root, course_id=course_id)
+
+    # seluruh pohon dibangun di memori dari satu query, bukan query per node
+    tree = await CourseContent.objects.atree(course_id, root=root_content)
+    if not tree and root is None:
+        await aget_object_or_404(Course.objects.only('id'), id=course_id)
+    return tree
 
+# List comments
+@router.get("/contents/{content_id}/comments", response=List[sparse_schema(CourseCommentListOut)], exclude_unset=True)
+@paginate(SparseCursorPagination, schema=CourseCommentListOut)
+async def list_comments(request, content_id: int):
+    return Comment.objects.filter(content_id=content_id)
 
 # Create comment
-@router.post("/contents/{content_id}/comments/")
+@router.post("/contents/{content_id}/comments/", auth=apiAuth)
 def create_comment(request, content_id: int, payload: CourseCommentIn):
-    comment = payload.comment
-    # user = request.user
-    user, created = User.objects.get_or_create(username="user", defaults={"password": "password"}) 
-
-    content = get_object_or_404(CourseContent, id=content_id)
-    course = get_object_or_404(Course, id=content.course_id.id)
-    member = get_object_or_404(CourseMember, user_id=user, course_id=course)
+    content = get_object_or_404(CourseContent.objects.only('id', 'course_id'), id=content_id)
 
-    user, created = User.objects.get_or_create(username="userr", defaults={"password": "password"}) # 
-
-    if user != member.user_id:
+    # Keanggotaan dicek lewat cache per-request, bukan lookup Course/CourseMember terpisah
+    member_id = get_memberships(request).member_id(content.course_id_id)
+    if member_id is None:
         return Response({'error': 'You are not authorized to create comment in this content'}, status=status.HTTP_401_UNAUTHORIZED)
 
     comment = Comment.objects.create(
         content_id=content,
-        member_id=member,
-        comment=comment
+        member_id_id=member_id,
+        comment=payload.comment
     )
 
     return Response({
@@ -124,17 +206,44 @@ def create_comment(request, content_id: int, payload: CourseCommentIn):
         "content_id": content.id
     }, status=201)
 
+# Create comments (bulk)
+@router.post("/contents/{content_id}/comments/bulk", auth=apiAuth)
+def create_comments_bulk(request, content_id: int, payload: CourseCommentBulkIn):
+    content = get_object_or_404(CourseContent.objects.only('id', 'course_id'), id=content_id)
+
+    member_id = get_memberships(request).member_id(content.course_id_id)
+    if member_id is None:
+        return Response({'error': 'You are not authorized to create comment in this content'}, status=status.HTTP_401_UNAUTHORIZED)
+
+    with transaction.atomic():
+        comments = Comment.objects.bulk_create([
+            Comment(content_id_id=content.id, member_id_id=member_id, comment=item.comment)
+            for item in payload.comments
+        ])
+        # bulk_create tidak memanggil save(), counter ditambah sekaligus
+        Course.objects.add_counts(content.course_id_id, comments=len(comments))
+
+    return Response([
+        {"id": comment.id, "comment": comment.comment, "content_id": content.id}
+        for comment in comments
+    ], status=201)
+
+# Delete comments (bulk)
+# didaftarkan sebelum /comments/{comment_id} agar path-nya tidak tertangkap route itu
+@router.post("/comments/bulk-delete", auth=apiAuth)
+def delete_comments_bulk(request, payload: CommentBulkDeleteIn):
+    # Hanya komentar milik user sendiri yang ikut terhapus, dalam satu DELETE
+    member_ids = list(get_memberships(request).by_course.values())
+    deleted, _ = Comment.objects.filter(id__in=payload.ids, member_id__in=member_ids).delete()
+    return {"deleted": deleted, "skipped": len(set(payload.ids)) - deleted}
+
 # Delete comment
 @router.delete("/comments/{comment_id}", auth=apiAuth)
 def delete_comment(request, comment_id: int):
-    user = request.user
-    if not user.is_authenticated:
-        return Response({'error': 'Authentication required'}, status=401)
-
-    comment = get_object_or_404(Comment, id=comment_id)
+    comment = get_object_or_404(Comment.objects.only('id', 'member_id', 'content_id'), id=comment_id)
 
     # Pastikan user adalah pemilik komentar lewat CourseMember
-    if comment.member_id.user_id != user:
+    if not get_memberships(request).owns_member(comment.member_id_id):
         return Response({'error': 'You are not authorized to delete this comment'}, status=403)
 
     comment.delete()
@@ -0,0 +1,120 @@
+import threading
+import time
+from collections import OrderedDict
+
+import jwt
+from django.conf import settings
+from django.core.cache import cache
+from jwt import PyJWTError
+from ninja.errors import AuthenticationError
+from ninja_simple_jwt.auth.ninja_auth import HttpJwtAuth
+from ninja_simple_jwt.jwt.token_operations import TokenTypes, decode_token
+from ninja_simple_jwt.settings import ninja_simple_jwt_settings
+
+
+class TokenCache:
+    """LRU berbatas: token -> klaim yang sudah diverifikasi, sampai waktu kadaluarsanya."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token):
+        with self._lock:
+            entry = self._data.get(token)
+            if entry is None:
+                return None
+            claims, expires_at = entry
+            if expires_at <= time.time():
+                del self._data[token]
+                return None
+            self._data.move_to_end(token)
+            return claims
+
+    def set(self, token, claims, expires_at):
+        with self._lock:
+            self._data[token] = (claims, expires_at)
+            self._data.move_to_end(token)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard(self, token):
+        with self._lock:
+            self._data.pop(token, None)
+
+    def discard_user(self, user_id):
+        with self._lock:
+            for token in [t for t, (claims, _) in self._data.items() if claims.get('user_id') == user_id]:
+                del self._data[token]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+token_cache = TokenCache(settings.JWT_AUTH_CACHE_SIZE)
+
+
+def _revoked_token_key(jti):
+    return f"jwt-revoked:token:{jti}"
+
+
+def _revoked_user_key(user_id):
+    return f"jwt-revoked:user:{user_id}"
+
+
+def revoke_token(token):
+    """Tolak satu access token sampai kadaluarsa, mis. saat logout."""
+    token_cache.discard(token)
+    claims = jwt.decode(token, options={"verify_signature": False})
+    timeout = max(int(claims["exp"] - time.time()), 1)
+    cache.set(_revoked_token_key(claims["jti"]), True, timeout=timeout)
+
+
+def revoke_user(user_id):
+    """Tolak semua access token user yang terbit sebelum saat ini."""
+    token_cache.discard_user(user_id)
+    timeout = int(ninja_simple_jwt_settings.JWT_ACCESS_TOKEN_LIFETIME.total_seconds())
+    cache.set(_revoked_user_key(user_id), time.time(), timeout=timeout)
+
+
+def issued_at(claims):
+    # klaim issued_at (sub-detik, lihat NINJA_SIMPLE_JWT di settings); token lama
+    # hanya punya iat yang dibulatkan ke bawah, jadi dianggap terbit di awal detiknya
+    return claims.get("issued_at", claims.get("iat", 0))
+
+
+def is_revoked(claims):
+    revoked = cache.get_many([_revoked_token_key(claims.get("jti")), _revoked_user_key(claims.get("user_id"))])
+    revoked_at = revoked.get(_revoked_user_key(claims.get("user_id")))
+    return _revoked_token_key(claims.get("jti")) in revoked or (
+        revoked_at is not None and issued_at(claims) < revoked_at)
+
+
+class CachedJwtAuth(HttpJwtAuth):
+    """HttpJwtAuth dengan cache hasil verifikasi token per proses.
+
+    Verifikasi RSA dan pengecekan revocation hanya dilakukan saat token belum
+    ada di cache. Entri disimpan paling lama JWT_AUTH_CACHE_TTL detik, sehingga
+    revocation dari proses lain (lewat cache Django) berlaku paling lambat
+    setelah selang itu; di proses yang sama berlaku seketika.
+    """
+
+    def authenticate(self, request, token):
+        claims = token_cache.get(token)
+        if claims is None:
+            try:
+                claims = decode_token(token, token_type=TokenTypes.ACCESS, verify=True)
+            except PyJWTError as e:
+                raise AuthenticationError(e)
+            if is_revoked(claims):
+                raise AuthenticationError("Token has been revoked")
+            expires_at = min(claims["exp"], time.time() + settings.JWT_AUTH_CACHE_TTL)
+            token_cache.set(token, claims, expires_at)
+
+        self.set_token_claims_to_user(request.user, claims)
+        return True
@@ -0,0 +1,107 @@
+from functools import wraps
+from hashlib import md5
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+
+def _version_key(namespace):
+    return f"api-cache:{namespace}:version"
+
+
+def get_version(namespace):
+    return cache.get_or_set(_version_key(namespace), 1, timeout=None)
+
+
+async def aget_version(namespace):
+    return await cache.aget_or_set(_version_key(namespace), 1, timeout=None)
+
+
+def invalidate(namespace):
+    # Tidak menghapus key satu per satu: cukup naikkan versi namespace sehingga
+    # semua halaman lama tidak lagi terbaca dan kadaluarsa sendiri lewat timeout.
+    try:
+        cache.incr(_version_key(namespace))
+    except ValueError:
+        cache.set(_version_key(namespace), 2, timeout=None)
+
+
+def _request_hash(request):
+    params = sorted(request.GET.lists())
+    return md5(f"{request.path}?{params}".encode()).hexdigest()
+
+
+def make_key(namespace, request):
+    return f"api-cache:{namespace}:{get_version(namespace)}:{_request_hash(request)}"
+
+
+async def amake_key(namespace, request):
+    return f"api-cache:{namespace}:{await aget_version(namespace)}:{_request_hash(request)}"
+
+
+def _cacheable(request):
+    return request.method == "GET" and "Authorization" not in request.headers
+
+
+def cache_response(namespace, timeout=None):
+    """Cache response GET anonim dari operation Ninja.
+
+    Dipakai bersama `ninja.decorators.decorate_view` sehingga yang disimpan
+    adalah body JSON yang sudah diserialisasi:
+
+        @router.get("/courses", response=...)
+        @decorate_view(cache_response("courses"))
+        def list_courses(request): ...
+
+    Operation async (`async def`) otomatis memakai API cache async.
+    """
+
+    def cached_response(cached):
+        content, content_type = cached
+        return HttpResponse(content, content_type=content_type)
+
+    def cache_entry(response):
+        if response.status_code != 200 or response.streaming:
+            return None
+        return ((response.content, response["Content-Type"]),
+                timeout if timeout is not None else settings.API_CACHE_TIMEOUT)
+
+    def decorator(view_func):
+        if iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def async_wrapper(request, *args, **kwargs):
+                if not _cacheable(request):
+                    return await view_func(request, *args, **kwargs)
+
+                key = await amake_key(namespace, request)
+                cached = await cache.aget(key)
+                if cached is not None:
+                    return cached_response(cached)
+
+                response = await view_func(request, *args, **kwargs)
+                if (entry := cache_entry(response)) is not None:
+                    await cache.aset(key, *entry)
+                return response
+
+            return async_wrapper
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if not _cacheable(request):
+                return view_func(request, *args, **kwargs)
+
+            key = make_key(namespace, request)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached_response(cached)
+
+            response = view_func(request, *args, **kwargs)
+            if (entry := cache_entry(response)) is not None:
+                cache.set(key, *entry)
+            return response
+
+        return wrapper
+
+    return decorator
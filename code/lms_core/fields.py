@@ -0,0 +1,78 @@
+from functools import lru_cache
+from typing import Optional
+
+from django.db.models import FileField
+from ninja import Schema
+from ninja.errors import HttpError
+from pydantic import create_model
+
+from lms_core.utils import schema_values_fields, nest_values
+
+
+@lru_cache(maxsize=None)
+def sparse_schema(schema, suffix="Fields"):
+    """Versi `schema` dengan semua field opsional.
+
+    Dipakai bersama `exclude_unset=True` di route sehingga hanya field yang
+    diminta lewat `?fields=` yang ikut di response. `suffix` membedakan nama
+    schema di OpenAPI bila schema yang sama dipakai beberapa jenis paginasi.
+    """
+    fields = {}
+    for name, field in schema.model_fields.items():
+        annotation = field.annotation
+        if isinstance(annotation, type) and issubclass(annotation, Schema):
+            annotation = sparse_schema(annotation)
+        fields[name] = (Optional[annotation], None)
+    return create_model(f"{schema.__name__}{suffix}", __base__=Schema, **fields)
+
+
+def parse_fields(schema, fields=None):
+    """Ubah `?fields=id,name,teacher.first_name` menjadi lookup .values().
+
+    Nama schema bertingkat tanpa sub-field (mis. `teacher`) berarti semua
+    field di dalamnya. Tanpa parameter, semua field schema dipakai.
+    """
+    allowed = schema_values_fields(schema)
+    if not fields:
+        return allowed
+
+    lookups = []
+    for name in fields.split(','):
+        lookup = name.strip().replace('.', '__')
+        if not lookup:
+            continue
+        matched = [f for f in allowed if f == lookup or f.startswith(lookup + '__')]
+        if not matched:
+            raise HttpError(400, f"Unknown field: {name.strip()}")
+        lookups += [f for f in matched if f not in lookups]
+    return lookups
+
+
+def file_lookups(model, lookups):
+    result = []
+    for lookup in lookups:
+        current = model
+        *relations, name = lookup.split('__')
+        for part in relations:
+            current = current._meta.get_field(part).related_model
+        field = current._meta.get_field(name)
+        if isinstance(field, FileField):
+            result.append((lookup, field.storage))
+    return result
+
+
+class Projection:
+    """Ambil hanya kolom yang diminta, lalu bentuk ulang baris .values()."""
+
+    def __init__(self, queryset, schema, fields=None, required=()):
+        self.lookups = parse_fields(schema, fields)
+        self.extra = [f for f in required if f not in self.lookups]
+        self.files = file_lookups(queryset.model, self.lookups)
+        self.queryset = queryset.values(*self.lookups, *self.extra)
+
+    def shape(self, row):
+        for name in self.extra:
+            row.pop(name)
+        for lookup, storage in self.files:
+            row[lookup] = storage.url(row[lookup]) if row[lookup] else None
+        return nest_values(row)
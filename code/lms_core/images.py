@@ -0,0 +1,96 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connections, transaction
+from PIL import Image, ImageOps
+
+from lms_core.cache import invalidate
+from lms_core.models import Course
+
+logger = logging.getLogger(__name__)
+
+# nama varian -> ukuran maksimum (lebar, tinggi); disimpan di Course.image_<nama>
+VARIANT_SIZES = {
+    'thumb': (320, 180),
+    'medium': (960, 540),
+}
+
+_executor = None
+
+
+def get_executor():
+    # Pengganti lokal untuk task queue: thread pool per proses
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=settings.IMAGE_WORKERS,
+                                       thread_name_prefix='course-image')
+    return _executor
+
+
+def render_variant(image, size):
+    variant = image.copy()
+    variant.thumbnail(size)
+    buffer = BytesIO()
+    variant.save(buffer, format='WEBP', quality=80)
+    return buffer.getvalue()
+
+
+def generate_course_variants(course_id, name, obsolete=()):
+    """Buat semua varian dari gambar `name` lalu simpan nama filenya di course.
+
+    Jika gambar course sudah diganti selagi varian dibuat, hasilnya dibuang.
+    """
+    storage = Course._meta.get_field('image').storage
+    with storage.open(name) as f:
+        image = ImageOps.exif_transpose(Image.open(f))
+        image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+
+    stem = PurePosixPath(name).stem
+    saved = {
+        f'image_{variant}': storage.save(f'course/variants/{stem}_{variant}.webp',
+                                         ContentFile(render_variant(image, size)))
+        for variant, size in VARIANT_SIZES.items()
+    }
+    updated = Course.objects.filter(pk=course_id, image=name).update(**saved)
+    for old in (obsolete if updated else saved.values()):
+        storage.delete(old)
+    if updated:
+        invalidate("courses")
+    return updated
+
+
+def _run_job(course_id, name, obsolete):
+    try:
+        generate_course_variants(course_id, name, obsolete)
+    except Exception:
+        logger.exception("Gagal membuat varian gambar course %s (%s)", course_id, name)
+    finally:
+        if not settings.IMAGE_TASKS_EAGER:
+            # koneksi database bersifat per-thread
+            connections.close_all()
+
+
+def save_course_image(course, upload):
+    """Simpan upload sebagai gambar asli; varian dibuat di background setelah commit.
+
+    Panggil di dalam transaction.atomic() bersama course.save() agar job baru
+    berjalan setelah nama file baru tersimpan di database.
+    """
+    obsolete = [f.name for f in (course.image_thumb, course.image_medium) if f]
+    # UploadedFile (bukan upload.file) agar FileSystemStorage bisa memindahkan
+    # file sementara upload besar alih-alih menyalinnya
+    course.image.save(upload.name, upload, save=False)
+    course.image_thumb = course.image_medium = None
+    args = (course.pk, course.image.name, obsolete)
+
+    def submit():
+        if settings.IMAGE_TASKS_EAGER:
+            _run_job(*args)
+        else:
+            get_executor().submit(_run_job, *args)
+
+    transaction.on_commit(submit)
@@ -0,0 +1,150 @@
+import csv
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+
+from lms_core.models import Course, CourseMember, CourseContent, Comment
+
+# (nama file, model, [(kolom, lookup)]) -- nama kolom sama dengan yang dibaca import_lms.
+# Kolom id dipakai importer sebagai pk, kolom tambahan lain (created_at, ...) diabaikan.
+TABLES = [
+    ('user-data.csv', User, [
+        ('id', 'id'), ('firstname', 'first_name'), ('lastname', 'last_name'),
+        ('email', 'email'), ('password_hash', 'password'), ('username', 'username'),
+        ('date_joined', 'date_joined'),
+    ]),
+    ('course-data.csv', Course, [
+        ('id', 'id'), ('name', 'name'), ('description', 'description'), ('price', 'price'),
+        ('teacher', 'teacher_id'), ('created_at', 'created_at'),
+    ]),
+    ('member-data.csv', CourseMember, [
+        ('id', 'id'), ('course_id', 'course_id_id'), ('user_id', 'user_id_id'), ('roles', 'roles'),
+        ('created_at', 'created_at'),
+    ]),
+    ('contents.json', CourseContent, [
+        ('id', 'id'), ('video_url', 'video_url'), ('course_id', 'course_id_id'), ('name', 'name'),
+        ('description', 'description'), ('parent_id', 'parent_id_id'), ('created_at', 'created_at'),
+    ]),
+    # importer membaca user_id komentar sebagai id CourseMember
+    ('comments.json', Comment, [
+        ('id', 'id'), ('content_id', 'content_id_id'), ('user_id', 'member_id_id'),
+        ('comment', 'comment'), ('created_at', 'created_at'),
+    ]),
+]
+
+
+def iter_rows(model, lookups, chunk_size):
+    # .iterator() memakai server-side cursor di PostgreSQL, jadi memori tetap
+    # konstan berapa pun besar tabelnya.
+    queryset = model.objects.order_by('pk').values_list(*lookups)
+    return queryset.iterator(chunk_size=chunk_size)
+
+
+def write_csv(fileobj, columns, rows):
+    writer = csv.writer(fileobj)
+    writer.writerow(columns)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_json_array(fileobj, columns, rows):
+    count = 0
+    fileobj.write('[')
+    for row in rows:
+        fileobj.write(',\n\t' if count else '\n\t')
+        fileobj.write(json.dumps(dict(zip(columns, row)), cls=DjangoJSONEncoder, ensure_ascii=False))
+        count += 1
+    fileobj.write('\n]\n')
+    return count
+
+
+def write_ndjson(fileobj, columns, rows):
+    count = 0
+    for row in rows:
+        fileobj.write(json.dumps(dict(zip(columns, row)), cls=DjangoJSONEncoder, ensure_ascii=False))
+        fileobj.write('\n')
+        count += 1
+    return count
+
+
+class Command(BaseCommand):
+    help = 'Export semua tabel LMS ke file CSV/JSON (format import_lms) atau NDJSON secara streaming'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default=str(Path(settings.BASE_DIR) / 'export'),
+                            help='Folder tujuan, dibuat bila belum ada')
+        parser.add_argument('--format', choices=['native', 'ndjson'], default='native',
+                            help='native = file yang sama dengan csv_data/, ndjson = satu objek JSON per baris')
+        parser.add_argument('--chunk-size', type=int, default=2000,
+                            help='Jumlah baris yang diambil dari database per fetch')
+        parser.add_argument('--workers', type=int, default=1,
+                            help='Jumlah tabel yang diekspor bersamaan (masing-masing koneksi sendiri)')
+        parser.add_argument('--include-passwords', action='store_true',
+                            help='Sertakan hash password user di kolom password_hash '
+                                 '(default tanpa kolom password, user hasil import tidak bisa login)')
+
+    def handle(self, *args, **options):
+        self.path = Path(options['path'])
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.format = options['format']
+        self.chunk_size = options['chunk_size']
+        self.include_passwords = options['include_passwords']
+        start_time = time.time()
+
+        workers = max(options['workers'] or 1, 1)
+        if workers == 1:
+            results = map(self.export_table, TABLES)
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers)
+            results = executor.map(self.export_table_threaded, TABLES)
+        try:
+            for name, count, elapsed in results:
+                self.stdout.write(f'{name}: {count} baris ({count / elapsed if elapsed else 0:.0f} baris/detik)')
+        finally:
+            if workers > 1:
+                executor.shutdown()
+
+        self.stdout.write("--- %s seconds ---" % (time.time() - start_time))
+
+    def export_table_threaded(self, table):
+        try:
+            return self.export_table(table)
+        finally:
+            # koneksi database bersifat per-thread
+            connections.close_all()
+
+    def export_table(self, table):
+        name, model, mapping = table
+        if model is User and not self.include_passwords:
+            mapping = [(column, lookup) for column, lookup in mapping if column != 'password_hash']
+        columns = [column for column, _ in mapping]
+        lookups = [lookup for _, lookup in mapping]
+        rows = iter_rows(model, lookups, self.chunk_size)
+
+        if self.format == 'ndjson':
+            name = Path(name).stem + '.ndjson'
+            write = write_ndjson
+        elif name.endswith('.csv'):
+            write = write_csv
+        else:
+            write = write_json_array
+
+        started = time.perf_counter()
+        target = self.path / name
+        tmp = target.with_name(target.name + '.tmp')
+        # ditulis ke file sementara dulu agar pembaca tidak melihat snapshot setengah jadi
+        with open(tmp, 'w', newline='' if write is write_csv else None, encoding='utf-8') as fileobj:
+            count = write(fileobj, columns, rows)
+        os.replace(tmp, target)
+        return name, count, time.perf_counter() - started
@@ -0,0 +1,269 @@
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+
+from lms_core.models import Course, CourseMember, CourseContent, Comment
+from lms_core.search import rebuild_search_index
+
+
+def iter_json_array(fileobj, chunk_size=64 * 1024):
+    """Baca file berisi JSON array satu elemen demi satu elemen.
+
+    File dibaca per potongan `chunk_size` sehingga memori yang dipakai tidak
+    bergantung pada besar file.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    started = False
+    eof = False
+    while True:
+        buffer = buffer.lstrip()
+        if not started:
+            if buffer.startswith('['):
+                buffer = buffer[1:]
+                started = True
+                continue
+        elif buffer.startswith(','):
+            buffer = buffer[1:]
+            continue
+        elif buffer.startswith(']'):
+            return
+        elif buffer:
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # elemen yang menempel di ujung buffer bisa jadi belum lengkap
+                if end < len(buffer) or eof:
+                    yield item
+                    buffer = buffer[end:]
+                    continue
+        if eof:
+            if started or buffer:
+                raise ValueError('Unexpected end of JSON array')
+            return
+        chunk = fileobj.read(chunk_size)
+        eof = not chunk
+        buffer += chunk
+
+
+def hash_password(password, hasher='default'):
+    # password kosong: user tidak bisa login
+    if not password:
+        return make_password(None)
+    return make_password(password, hasher=hasher)
+
+
+def hash_passwords(passwords, hasher='default'):
+    return [hash_password(password, hasher=hasher) for password in passwords]
+
+
+def init_hash_worker(settings_module):
+    # diperlukan jika worker dibuat dengan metode 'spawn' (macOS/Windows)
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    import django
+    django.setup()
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class Command(BaseCommand):
+    help = 'Import data LMS (user, course, member, konten, komentar) dari folder csv_data secara bulk'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default=str(Path(settings.BASE_DIR) / 'csv_data'),
+                            help='Folder berisi user-data.csv, course-data.csv, member-data.csv, '
+                                 'contents.json dan comments.json')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                            help='Jumlah proses untuk hashing password user (1 = tanpa process pool)')
+        parser.add_argument('--hash-chunk-size', type=int, default=25,
+                            help='Jumlah password per tugas yang dikirim ke worker')
+        parser.add_argument('--fast-hasher', action='store_true',
+                            help='Pakai hasher MD5 yang murah, hanya untuk data fixture/testing '
+                                 '(butuh FAST_PASSWORD_HASHER)')
+        parser.add_argument('--legacy-sample', action='store_true',
+                            help='Hanya untuk data sampel csv_data/: user_id komentar di atas 50 '
+                                 'dipetakan ke member 5-40 seperti importer lama')
+
+    def handle(self, *args, **options):
+        self.path = Path(options['path'])
+        self.batch_size = options['batch_size']
+        self.hash_chunk_size = options['hash_chunk_size']
+        self.legacy_sample = options['legacy_sample']
+        if options['fast_hasher'] and not settings.FAST_PASSWORD_HASHER:
+            raise CommandError('--fast-hasher butuh FAST_PASSWORD_HASHER=1 (hasher MD5 tidak aktif)')
+        self.hasher = 'md5' if options['fast_hasher'] else 'default'
+        start_time = time.time()
+
+        workers = max(options['workers'] or 1, 1)
+        self.pool = None
+        if workers > 1:
+            self.pool = ProcessPoolExecutor(max_workers=workers, initializer=init_hash_worker,
+                                            initargs=(os.environ['DJANGO_SETTINGS_MODULE'],))
+        try:
+            self.import_table(User, self.open_csv('user-data.csv'), self.build_users,
+                              prepare=self.hash_user_passwords)
+        finally:
+            if self.pool is not None:
+                self.pool.shutdown()
+        self.import_table(Course, enumerate(self.open_csv('course-data.csv'), start=1), self.build_courses)
+        rebuild_search_index()
+        self.import_table(CourseMember, enumerate(self.open_csv('member-data.csv'), start=1), self.build_members)
+        self.import_table(CourseContent, enumerate(self.open_json('contents.json'), start=1), self.build_contents,
+                          finish=self.drop_missing_parents)
+        CourseContent.objects.rebuild_paths()
+        self.import_table(Comment, enumerate(self.open_json('comments.json'), start=1), self.build_comments)
+        # bulk_create melewati save(), jadi counter course dihitung ulang sekali di akhir
+        Course.objects.rebuild_counters()
+
+        self.reset_sequences()
+        self.stdout.write("--- %s seconds ---" % (time.time() - start_time))
+
+    def open_csv(self, name):
+        with open(self.path / name, newline='') as csvfile:
+            yield from csv.DictReader(csvfile)
+
+    def open_json(self, name):
+        with open(self.path / name) as jsonfile:
+            yield from iter_json_array(jsonfile)
+
+    def import_table(self, model, rows, build, prepare=None, finish=None):
+        started = time.perf_counter()
+        before = model.objects.count()
+        total = skipped = 0
+        with transaction.atomic():
+            # FK yang valid dimuat sekali di awal, bukan dicek per baris
+            self.known_ids = self.preload_ids(model)
+            for chunk in chunked(rows, self.batch_size):
+                total += len(chunk)
+                size = len(chunk)
+                if prepare is not None:
+                    chunk = prepare(chunk)
+                objs = [obj for obj in map(build, chunk) if obj is not None]
+                skipped += size - len(objs)
+                model.objects.bulk_create(objs, batch_size=self.batch_size, ignore_conflicts=True)
+            if finish is not None:
+                finish()
+        created = model.objects.count() - before
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f'{model._meta.db_table}: {total} baris dibaca, {created} dibuat, '
+                          f'{skipped} dilewati ({total / elapsed if elapsed else 0:.0f} baris/detik)')
+
+    def preload_ids(self, model):
+        if model is User:
+            return set(User.objects.values_list('username', flat=True))
+        if model is Course:
+            return set(User.objects.values_list('id', flat=True))
+        if model in (CourseMember, CourseContent):
+            return {
+                'course': set(Course.objects.values_list('id', flat=True)),
+                'user': set(User.objects.values_list('id', flat=True)),
+            }
+        return {
+            'content': set(CourseContent.objects.values_list('id', flat=True)),
+            'member': set(CourseMember.objects.values_list('id', flat=True)),
+        }
+
+    def hash_user_passwords(self, rows):
+        # user yang sudah ada dibuang dulu agar password-nya tidak ikut di-hash
+        new_rows = []
+        for row in rows:
+            if row['username'] not in self.known_ids:
+                self.known_ids.add(row['username'])
+                new_rows.append(row)
+
+        # Format ditentukan header file, bukan ditebak per baris: kolom password berisi
+        # plaintext, password_hash berisi hash dari export_lms --include-passwords, dan
+        # tanpa keduanya (export default) user dibuat tanpa password yang bisa dipakai.
+        if new_rows and 'password' not in new_rows[0]:
+            for row in new_rows:
+                row['password'] = row.get('password_hash') or make_password(None)
+            return new_rows
+
+        # PBKDF2 memakan CPU, jadi hashing dibagi ke beberapa proses
+        passwords = chunked((row['password'] for row in new_rows), self.hash_chunk_size)
+        hash_chunk = partial(hash_passwords, hasher=self.hasher)
+        hashed = map(hash_chunk, passwords) if self.pool is None else self.pool.map(hash_chunk, passwords)
+        for row, password in zip(new_rows, (p for part in hashed for p in part)):
+            row['password'] = password
+        return new_rows
+
+    @staticmethod
+    def row_pk(num, row):
+        # file hasil export_lms membawa id asli (FK merujuk id itu),
+        # data sampel csv_data/ tanpa kolom id memakai nomor baris
+        return int(row['id']) if row.get('id') else num
+
+    def build_users(self, row):
+        return User(pk=self.row_pk(None, row),
+                    username=row['username'],
+                    password=row['password'],
+                    email=row['email'],
+                    first_name=row['firstname'],
+                    last_name=row['lastname'])
+
+    def build_courses(self, item):
+        num, row = item
+        if int(row['teacher']) not in self.known_ids:
+            return None
+        return Course(pk=self.row_pk(num, row), name=row['name'], price=row['price'],
+                      description=row['description'], teacher_id=int(row['teacher']))
+
+    def build_members(self, item):
+        num, row = item
+        course_id, user_id = int(row['course_id']), int(row['user_id'])
+        if course_id not in self.known_ids['course'] or user_id not in self.known_ids['user']:
+            return None
+        return CourseMember(pk=self.row_pk(num, row), course_id_id=course_id, user_id_id=user_id, roles=row['roles'])
+
+    def build_contents(self, item):
+        num, row = item
+        if int(row['course_id']) not in self.known_ids['course']:
+            return None
+        return CourseContent(pk=self.row_pk(num, row), course_id_id=int(row['course_id']), video_url=row['video_url'],
+                             name=row['name'], description=row['description'],
+                             parent_id_id=int(row['parent_id']) if row.get('parent_id') else None)
+
+    def drop_missing_parents(self):
+        # induk bisa muncul sesudah anaknya di file, jadi dicek setelah semua baris masuk
+        CourseContent.objects.filter(parent_id__isnull=False) \
+                             .exclude(parent_id__in=CourseContent.objects.values('pk')).update(parent_id=None)
+
+    def build_comments(self, item):
+        num, row = item
+        member_id = int(row['user_id'])
+        # Data sampel csv_data/ merujuk member yang tidak ada; dipetakan tetap (bukan acak)
+        # agar hasil import sama di setiap run
+        if self.legacy_sample and member_id > 50:
+            member_id = 5 + member_id % 36
+        if int(row['content_id']) not in self.known_ids['content'] or member_id not in self.known_ids['member']:
+            return None
+        return Comment(pk=self.row_pk(num, row), content_id_id=int(row['content_id']), member_id_id=member_id,
+                       comment=row['comment'])
+
+    def reset_sequences(self):
+        # pk diisi eksplisit, jadi sequence (PostgreSQL) perlu disesuaikan
+        statements = connection.ops.sequence_reset_sql(no_style(), [User, Course, CourseMember, CourseContent, Comment])
+        if statements:
+            with connection.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
@@ -0,0 +1,15 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from lms_core.models import Course
+
+
+class Command(BaseCommand):
+    help = 'Hitung ulang member_count, content_count dan comment_count semua course'
+
+    def handle(self, *args, **options):
+        start_time = time.time()
+        updated = Course.objects.rebuild_counters()
+        self.stdout.write(f'{updated} course diperbarui')
+        self.stdout.write("--- %s seconds ---" % (time.time() - start_time))
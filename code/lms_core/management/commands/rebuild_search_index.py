@@ -0,0 +1,15 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from lms_core.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Isi ulang index pencarian course (FTS5 di SQLite; PostgreSQL selalu sinkron otomatis)'
+
+    def handle(self, *args, **options):
+        start_time = time.time()
+        indexed = rebuild_search_index()
+        self.stdout.write(f'{indexed} course diindeks')
+        self.stdout.write("--- %s seconds ---" % (time.time() - start_time))
@@ -0,0 +1,40 @@
+from lms_core.models import CourseMember
+
+
+class MembershipLookup:
+    """Daftar keanggotaan matkul milik satu user, dimuat sekali per request.
+
+    Semua pengecekan otorisasi di api.py memakai objek ini sehingga berapa kali
+    pun keanggotaan dicek, query ke CourseMember hanya terjadi satu kali.
+    """
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self._by_course = None
+
+    @property
+    def by_course(self):
+        if self._by_course is None:
+            rows = CourseMember.objects.filter(user_id=self.user_id).values_list('course_id', 'id')
+            self._by_course = dict(rows)
+        return self._by_course
+
+    def member_id(self, course_id):
+        return self.by_course.get(course_id)
+
+    def is_member(self, course_id):
+        return course_id in self.by_course
+
+    def owns_member(self, member_id):
+        return member_id in self.by_course.values()
+
+    def add(self, course_id, member_id):
+        self.by_course[course_id] = member_id
+
+
+def get_memberships(request):
+    lookup = getattr(request, '_memberships', None)
+    if lookup is None or lookup.user_id != request.user.id:
+        lookup = MembershipLookup(request.user.id)
+        request._memberships = lookup
+    return lookup
@@ -0,0 +1,195 @@
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.http import HttpResponse
+from ninja.renderers import BaseRenderer
+
+logger = logging.getLogger(__name__)
+
+QUANTILES = (0.5, 0.95, 0.99)
+# (nama metrik, atribut RequestStats, keterangan)
+SUMMARIES = [
+    ("lms_request_duration_seconds", "duration", "Waktu total request"),
+    ("lms_db_queries", "queries", "Jumlah query database per request"),
+    ("lms_db_duration_seconds", "db_time", "Waktu query database per request"),
+    ("lms_serialize_duration_seconds", "serialize_time", "Waktu render response JSON"),
+    ("lms_response_size_bytes", "size", "Ukuran body response"),
+]
+
+
+class RequestStats:
+    __slots__ = ("duration", "queries", "db_time", "serialize_time", "size")
+
+    def __init__(self):
+        self.duration = self.db_time = self.serialize_time = 0.0
+        self.queries = self.size = 0
+
+
+_current = ContextVar("lms_request_stats", default=None)
+
+
+class MetricsRegistry:
+    """Sampel terakhir per endpoint (per proses) untuk menghitung kuantil."""
+
+    def __init__(self, max_samples=1000):
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self._samples = defaultdict(lambda: deque(maxlen=self.max_samples))
+        self._totals = defaultdict(lambda: defaultdict(float))
+        self._counts = defaultdict(int)
+        self._over_budget = defaultdict(int)
+
+    def observe(self, endpoint, stats, over_budget=False):
+        with self._lock:
+            self._samples[endpoint].append(stats)
+            self._counts[endpoint] += 1
+            for _, attr, _ in SUMMARIES:
+                self._totals[endpoint][attr] += getattr(stats, attr)
+            if over_budget:
+                self._over_budget[endpoint] += 1
+
+    def render(self):
+        with self._lock:
+            samples = {endpoint: list(rows) for endpoint, rows in self._samples.items()}
+            totals = {endpoint: dict(values) for endpoint, values in self._totals.items()}
+            counts = dict(self._counts)
+            over_budget = dict(self._over_budget)
+
+        lines = []
+        for name, attr, help_text in SUMMARIES:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} summary"]
+            for endpoint in sorted(samples):
+                values = sorted(getattr(stats, attr) for stats in samples[endpoint])
+                label = _label(endpoint)
+                for q in QUANTILES:
+                    value = values[min(int(q * len(values)), len(values) - 1)]
+                    lines.append(f'{name}{{endpoint="{label}",quantile="{q}"}} {value}')
+                lines.append(f'{name}_sum{{endpoint="{label}"}} {totals[endpoint][attr]}')
+                lines.append(f'{name}_count{{endpoint="{label}"}} {counts[endpoint]}')
+
+        name = "lms_query_budget_exceeded_total"
+        lines += [f"# HELP {name} Request yang melebihi PERF_QUERY_BUDGET", f"# TYPE {name} counter"]
+        for endpoint in sorted(over_budget):
+            lines.append(f'{name}{{endpoint="{_label(endpoint)}"}} {over_budget[endpoint]}')
+        return "\n".join(lines) + "\n"
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+registry = MetricsRegistry()
+
+
+def record_query(execute, sql, params, many, context):
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.db_time += time.perf_counter() - start
+
+
+def install_query_recorder(connection):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+@receiver(connection_created)
+def _install_on_connect(sender, connection, **kwargs):
+    if settings.PERF_METRICS:
+        install_query_recorder(connection)
+
+
+class InstrumentedRenderer(BaseRenderer):
+    """Bungkus renderer lain untuk mencatat waktu serialisasi response."""
+
+    def __init__(self, renderer):
+        self.renderer = renderer
+        self.media_type = renderer.media_type
+        self.charset = renderer.charset
+
+    def render(self, request, data, *, response_status):
+        stats = _current.get()
+        start = time.perf_counter()
+        try:
+            return self.renderer.render(request, data, response_status=response_status)
+        finally:
+            if stats is not None:
+                stats.serialize_time += time.perf_counter() - start
+
+
+def endpoint_name(request):
+    match = getattr(request, "resolver_match", None)
+    route = match.route if match is not None else "unmatched"
+    return f"{request.method} /{route}"
+
+
+class PerformanceMiddleware:
+    """Catat waktu, jumlah & durasi query, waktu serialisasi dan ukuran response
+    per endpoint. Aktif jika PERF_METRICS=1; hasilnya di /metrics."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        stats, token = self.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.finish(request, response, stats, started)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        stats, token = self.start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.finish(request, response, stats, started)
+        return response
+
+    def start(self):
+        # koneksi yang sudah terbuka sebelum middleware dimuat belum punya wrapper
+        for connection in connections.all(initialized_only=True):
+            install_query_recorder(connection)
+        stats = RequestStats()
+        return stats, _current.set(stats)
+
+    def finish(self, request, response, stats, started):
+        stats.duration = time.perf_counter() - started
+        stats.size = 0 if response.streaming else len(response.content)
+        endpoint = endpoint_name(request)
+        over_budget = stats.queries > settings.PERF_QUERY_BUDGET
+        if over_budget:
+            logger.warning("%s menjalankan %d query (budget %d), kemungkinan N+1",
+                           endpoint, stats.queries, settings.PERF_QUERY_BUDGET)
+        registry.observe(endpoint, stats, over_budget)
+
+
+def metrics_view(request):
+    return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,30 @@
+from django.db import migrations, models
+
+
+def dedupe_course_members(apps, schema_editor):
+    # Data lama (mis. hasil importer) bisa berisi pendaftaran ganda; komentar
+    # dipindahkan ke member yang dipertahankan sebelum duplikatnya dihapus.
+    CourseMember = apps.get_model('lms_core', 'CourseMember')
+    Comment = apps.get_model('lms_core', 'Comment')
+    duplicates = (CourseMember.objects.values('course_id', 'user_id')
+                  .annotate(keep_id=models.Min('id'), total=models.Count('id'))
+                  .filter(total__gt=1))
+    for row in duplicates:
+        extra = CourseMember.objects.filter(course_id=row['course_id'], user_id=row['user_id']) \
+                                    .exclude(id=row['keep_id'])
+        Comment.objects.filter(member_id__in=extra).update(member_id=row['keep_id'])
+        extra.delete()
+
+
+class Migration(migrations.Migration):
+    # Terpisah dari 0005_access_pattern_indexes: di PostgreSQL, UPDATE/DELETE
+    # di transaksi yang sama membuat ALTER TABLE ... ADD CONSTRAINT gagal
+    # ("pending trigger events").
+
+    dependencies = [
+        ('lms_core', '0003_coursecontent_coursemember_comment'),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_course_members, migrations.RunPython.noop),
+    ]
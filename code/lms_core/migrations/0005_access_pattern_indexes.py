@@ -0,0 +1,31 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lms_core', '0004_dedupe_course_members'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['content_id', 'created_at'], name='comment_content_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['created_at', 'id'], name='course_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='coursecontent',
+            index=models.Index(fields=['course_id', 'parent_id'], name='content_course_parent_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='coursemember',
+            constraint=models.UniqueConstraint(fields=('course_id', 'user_id'), name='unique_course_member'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:28
+
+from django.db import migrations, models
+
+
+def fill_paths(apps, schema_editor):
+    CourseContent = apps.get_model('lms_core', 'CourseContent')
+    rows = {row.pk: row for row in CourseContent.objects.only('id', 'parent_id')}
+
+    def resolve(row):
+        if row.parent_id_id is None or row.parent_id_id not in rows:
+            return f"/{row.pk}/", 0
+        parent_path, parent_depth = resolve(rows[row.parent_id_id])
+        return f"{parent_path}{row.pk}/", parent_depth + 1
+
+    for row in rows.values():
+        row.path, row.depth = resolve(row)
+    CourseContent.objects.bulk_update(rows.values(), ['path', 'depth'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lms_core', '0005_access_pattern_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coursecontent',
+            name='depth',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='kedalaman'),
+        ),
+        migrations.AddField(
+            model_name='coursecontent',
+            name='path',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255, verbose_name='path'),
+        ),
+        migrations.RunPython(fill_paths, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='coursecontent',
+            index=models.Index(fields=['course_id', 'path'], name='content_course_path_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:53
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_counters(apps, schema_editor):
+    Course = apps.get_model('lms_core', 'Course')
+
+    def count(model_name, course_lookup):
+        model = apps.get_model('lms_core', model_name)
+        rows = model.objects.filter(**{course_lookup: OuterRef('pk')}).order_by() \
+                            .values(course_lookup).annotate(n=Count('pk')).values('n')
+        return Coalesce(Subquery(rows), 0)
+
+    Course.objects.update(
+        member_count=count('CourseMember', 'course_id'),
+        content_count=count('CourseContent', 'course_id'),
+        comment_count=count('Comment', 'content_id__course_id'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lms_core', '0006_coursecontent_path'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Jumlah komentar'),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='content_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Jumlah konten'),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='member_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Jumlah anggota'),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
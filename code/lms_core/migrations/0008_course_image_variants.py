@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lms_core', '0007_course_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='image_medium',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to='course/variants', verbose_name='Gambar sedang'),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='image_thumb',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to='course/variants', verbose_name='Thumbnail'),
+        ),
+    ]
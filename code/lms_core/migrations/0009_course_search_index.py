@@ -0,0 +1,36 @@
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(
+            "ALTER TABLE lms_core_course ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(description, '')), 'B')) STORED"
+        )
+        schema_editor.execute("CREATE INDEX course_search_idx ON lms_core_course USING gin (search_vector)")
+    elif vendor == 'sqlite':
+        schema_editor.execute("CREATE VIRTUAL TABLE lms_core_course_fts USING fts5(name, description)")
+        schema_editor.execute("INSERT INTO lms_core_course_fts (rowid, name, description) "
+                              "SELECT id, name, description FROM lms_core_course")
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute("DROP INDEX IF EXISTS course_search_idx")
+        schema_editor.execute("ALTER TABLE lms_core_course DROP COLUMN IF EXISTS search_vector")
+    elif vendor == 'sqlite':
+        schema_editor.execute("DROP TABLE IF EXISTS lms_core_course_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lms_core', '0008_course_image_variants'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
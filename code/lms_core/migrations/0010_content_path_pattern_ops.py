@@ -0,0 +1,21 @@
+# Generated by Django 5.1.6 on 2026-10-18 20:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lms_core', '0009_course_search_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='coursecontent',
+            name='content_course_path_idx',
+        ),
+        migrations.AddIndex(
+            model_name='coursecontent',
+            index=models.Index(fields=['course_id', 'path'], name='content_course_path_idx', opclasses=['int8_ops', 'varchar_pattern_ops']),
+        ),
+    ]
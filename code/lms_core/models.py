@@ -1,15 +1,52 @@
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.constants import OnConflict
+from django.db.models.functions import Coalesce, Concat, Substr
 from django.contrib.auth.models import User
+from django.utils import timezone
 
 # Create your models here.
+def _count_per_course(model, course_lookup):
+    rows = model.objects.filter(**{course_lookup: OuterRef('pk')}).order_by() \
+                        .values(course_lookup).annotate(n=Count('pk')).values('n')
+    return Coalesce(Subquery(rows), 0)
+
+class CourseManager(models.Manager):
+
+    def add_counts(self, course_id, members=0, contents=0, comments=0):
+        """Ubah counter secara atomik di database (SET x = x + n), tanpa read-modify-write."""
+        deltas = {'member_count': members, 'content_count': contents, 'comment_count': comments}
+        updates = {name: F(name) + delta for name, delta in deltas.items() if delta}
+        if updates:
+            self.filter(pk=course_id).update(**updates)
+
+    def rebuild_counters(self):
+        """Hitung ulang semua counter dari tabel aslinya dalam satu UPDATE."""
+        return self.update(
+            member_count=_count_per_course(CourseMember, 'course_id'),
+            content_count=_count_per_course(CourseContent, 'course_id'),
+            comment_count=_count_per_course(Comment, 'content_id__course_id'),
+        )
+
+COUNTER_FIELDS = ('member_count', 'content_count', 'comment_count')
+
 class Course(models.Model):
     name = models.CharField("Nama Kursus", max_length=255)
     description = models.TextField("Deskripsi")
     price = models.IntegerField("Harga")
     image = models.ImageField("Gambar", upload_to="course", blank=True, null=True)
+    # varian kecil dari image, dibuat di background oleh lms_core.images
+    image_thumb = models.ImageField("Thumbnail", upload_to="course/variants", blank=True, null=True, editable=False)
+    image_medium = models.ImageField("Gambar sedang", upload_to="course/variants", blank=True, null=True, editable=False)
     teacher = models.ForeignKey(User, verbose_name="Pengajar", on_delete=models.RESTRICT)
     created_at = models.DateTimeField("Dibuat pada", auto_now_add=True)
     updated_at = models.DateTimeField("Diperbarui pada", auto_now=True)
+    # counter denormalisasi untuk kartu katalog, dijaga oleh CourseManager.add_counts
+    member_count = models.PositiveIntegerField("Jumlah anggota", default=0, editable=False)
+    content_count = models.PositiveIntegerField("Jumlah konten", default=0, editable=False)
+    comment_count = models.PositiveIntegerField("Jumlah komentar", default=0, editable=False)
+
+    objects = CourseManager()
 
     def __str__(self):
         return self.name
@@ -18,12 +55,88 @@ class Course(models.Model):
         verbose_name = "Mata Kuliah"
         verbose_name_plural = "Data Mata Kuliah"
         ordering = ["-created_at"]
+        indexes = [
+            # listing & cursor pagination diurutkan berdasarkan (created_at, id)
+            models.Index(fields=["created_at", "id"], name="course_created_idx"),
+        ]
 
-    def is_member(self, user):
+    def save(self, *args, **kwargs):
+        # counter hanya diubah lewat CourseManager (x = x + n); save() biasa atas
+        # objek yang sudah ada (mis. dari admin) tidak menimpanya dengan nilai lama
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [field.name for field in self._meta.concrete_fields
+                                       if not field.primary_key and field.name not in COUNTER_FIELDS]
+        super().save(*args, **kwargs)
+
+    def is_member(self, user, memberships=None):
+        # memberships: MembershipLookup milik request agar tidak query EXISTS berulang
+        if memberships is not None:
+            return memberships.is_member(self.id)
         return CourseMember.objects.filter(course_id=self, user_id=user).exists()
 
 ROLE_OPTIONS = [('std', "Siswa"), ('ast', "Asisten")]
 
+class CourseMemberQuerySet(models.QuerySet):
+
+    def delete(self):
+        # komentar member ikut terhapus (CASCADE) dan dihitung di course milik kontennya
+        with transaction.atomic():
+            members = list(self.order_by().values_list('course_id').annotate(n=Count('pk')))
+            comments = list(Comment.objects.filter(member_id__in=self.values('pk')).order_by()
+                                   .values_list('content_id__course_id').annotate(n=Count('pk')))
+            result = super().delete()
+            for course_id, count in members:
+                Course.objects.add_counts(course_id, members=-count)
+            for course_id, count in comments:
+                Course.objects.add_counts(course_id, comments=-count)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+class CourseMemberManager(models.Manager):
+    # Pendaftaran dilakukan dengan satu INSERT ... SELECT yang dijaga oleh
+    # unique constraint (course_id, user_id), tanpa cek-lalu-insert.
+
+    def _insert_select(self, course_id, select_sql, params, ignore_conflicts=False):
+        meta = self.model._meta
+        on_conflict = OnConflict.IGNORE if ignore_conflicts else None
+        columns = ", ".join(connection.ops.quote_name(meta.get_field(name).column)
+                            for name in ("course_id", "user_id", "roles", "created_at", "updated_at"))
+        sql = "%s %s (%s) %s" % (connection.ops.insert_statement(on_conflict=on_conflict),
+                                 connection.ops.quote_name(meta.db_table), columns, select_sql)
+        if ignore_conflicts:
+            sql += " " + connection.ops.on_conflict_suffix_sql([], on_conflict, None, None)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            Course.objects.add_counts(course_id, members=cursor.rowcount)
+            return cursor.rowcount
+
+    @staticmethod
+    def _course_user_select(user_condition):
+        # course & user diambil dari tabelnya sendiri: yang tidak ada menghasilkan
+        # 0 baris, bukan pelanggaran foreign key
+        qn = connection.ops.quote_name
+        return "SELECT c.%s, u.%s, %%s, %%s, %%s FROM %s c, %s u WHERE c.%s = %%s AND u.%s %s" % (
+            qn("id"), qn("id"), qn(Course._meta.db_table), qn(User._meta.db_table), qn("id"), qn("id"),
+            user_condition)
+
+    def enroll(self, course_id, user_id, roles='std'):
+        """Daftarkan user ke course. Mengembalikan 0 jika course atau user tidak
+        ada, IntegrityError (unique_course_member) jika user sudah terdaftar."""
+        now = connection.ops.adapt_datetimefield_value(timezone.now())
+        return self._insert_select(course_id, self._course_user_select("= %s"),
+                                   [roles, now, now, course_id, user_id])
+
+    def enroll_many(self, course_id, user_ids, roles='std'):
+        """Daftarkan banyak user sekaligus; user yang tidak ada atau sudah
+        terdaftar dilewati. Mengembalikan jumlah user yang baru terdaftar."""
+        if not user_ids:
+            return 0
+        now = connection.ops.adapt_datetimefield_value(timezone.now())
+        select = self._course_user_select("IN (%s)" % ", ".join(["%s"] * len(user_ids)))
+        return self._insert_select(course_id, select, [roles, now, now, course_id, *user_ids], ignore_conflicts=True)
+
 class CourseMember(models.Model):
     course_id = models.ForeignKey(Course, verbose_name="matkul", on_delete=models.RESTRICT)
     user_id = models.ForeignKey(User, verbose_name="siswa", on_delete=models.RESTRICT)
@@ -31,13 +144,104 @@ class CourseMember(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CourseMemberManager.from_queryset(CourseMemberQuerySet)()
+
     class Meta:
         verbose_name = "Subscriber Matkul"
         verbose_name_plural = "Subscriber Matkul"
+        constraints = [
+            # satu user hanya boleh terdaftar sekali di satu matkul
+            models.UniqueConstraint(fields=["course_id", "user_id"], name="unique_course_member"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.course_id} : {self.user_id}"
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if adding:
+                Course.objects.add_counts(self.course_id_id, members=1)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            # komentar dihitung di course milik kontennya, sama seperti rebuild_counters
+            comments = dict(Comment.objects.filter(member_id=self.pk).order_by()
+                                   .values_list('content_id__course_id').annotate(n=Count('pk')))
+            result = super().delete(*args, **kwargs)
+            Course.objects.add_counts(self.course_id_id, members=-1,
+                                      comments=-comments.pop(self.course_id_id, 0))
+            for course_id, count in comments.items():
+                Course.objects.add_counts(course_id, comments=-count)
+        return result
+
+class CourseContentQuerySet(models.QuerySet):
+
+    def delete(self):
+        # komentar konten ikut terhapus (CASCADE), course-nya sama dengan kontennya
+        with transaction.atomic():
+            per_course = {course_id: [count, 0] for course_id, count in
+                          self.order_by().values_list('course_id').annotate(n=Count('pk'))}
+            for course_id, count in Comment.objects.filter(content_id__in=self.values('pk')).order_by() \
+                                                   .values_list('content_id__course_id').annotate(n=Count('pk')):
+                per_course[course_id][1] = count
+            result = super().delete()
+            for course_id, (contents, comments) in per_course.items():
+                Course.objects.add_counts(course_id, contents=-contents, comments=-comments)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+class CourseContentManager(models.Manager):
+
+    def _tree_rows(self, course_id, root=None):
+        qs = self.filter(course_id=course_id)
+        if root is not None:
+            qs = qs.filter(path__startswith=root.path or f"/{root.pk}/")
+        return qs.order_by('id').values('id', 'name', 'description', 'video_url', 'parent_id', 'depth')
+
+    def tree(self, course_id, root=None):
+        """Pohon konten sebuah course (atau subtree `root`) dari satu query."""
+        return self._build_tree(self._tree_rows(course_id, root), root)
+
+    async def atree(self, course_id, root=None):
+        rows = [row async for row in self._tree_rows(course_id, root)]
+        return self._build_tree(rows, root)
+
+    @staticmethod
+    def _build_tree(rows, root=None):
+        nodes = {row['id']: {**row, 'children': []} for row in rows}
+        roots = []
+        for node in nodes.values():
+            parent = nodes.get(node['parent_id'])
+            if parent is None or node['id'] == getattr(root, 'pk', None):
+                roots.append(node)
+            else:
+                parent['children'].append(node)
+        return roots
+
+    def rebuild_paths(self, course_id=None):
+        """Hitung ulang path & depth, mis. setelah bulk_create yang melewati save()."""
+        qs = self.all() if course_id is None else self.filter(course_id=course_id)
+        rows = {row.pk: row for row in qs.only('id', 'parent_id', 'path', 'depth')}
+
+        def resolve(row):
+            if row.parent_id_id is None or row.parent_id_id not in rows:
+                return f"/{row.pk}/", 0
+            parent_path, parent_depth = resolve(rows[row.parent_id_id])
+            return f"{parent_path}{row.pk}/", parent_depth + 1
+
+        changed = []
+        for row in rows.values():
+            path, depth = resolve(row)
+            if (row.path, row.depth) != (path, depth):
+                row.path, row.depth = path, depth
+                changed.append(row)
+        self.bulk_update(changed, ['path', 'depth'], batch_size=500)
+        return len(changed)
+
 class CourseContent(models.Model):
     name = models.CharField("judul konten", max_length=200)
     description = models.TextField("deskripsi", default='-')
@@ -46,16 +250,77 @@ class CourseContent(models.Model):
     course_id = models.ForeignKey(Course, verbose_name="matkul", on_delete=models.RESTRICT)
     parent_id = models.ForeignKey("self", verbose_name="induk", 
                                 on_delete=models.RESTRICT, null=True, blank=True)
+    # materialized path, mis. "/3/10/42/", supaya subtree bisa diambil dengan filter prefix
+    path = models.CharField("path", max_length=255, default='', blank=True, editable=False)
+    depth = models.PositiveIntegerField("kedalaman", default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CourseContentManager.from_queryset(CourseContentQuerySet)()
+
     class Meta:
         verbose_name = "Konten Matkul"
         verbose_name_plural = "Konten Matkul"
+        indexes = [
+            models.Index(fields=["course_id", "parent_id"], name="content_course_parent_idx"),
+            # varchar_pattern_ops: di PostgreSQL dengan collation selain C, btree biasa
+            # tidak bisa dipakai untuk filter prefix path LIKE '/3/%' (opclass diabaikan SQLite)
+            models.Index(fields=["course_id", "path"], name="content_course_path_idx",
+                         opclasses=["int8_ops", "varchar_pattern_ops"]),
+        ]
 
     def __str__(self) -> str:
         return f'{self.course_id} {self.name}'
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if adding:
+                Course.objects.add_counts(self.course_id_id, contents=1)
+        self.sync_path()
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            comments = Comment.objects.filter(content_id=self.pk).count()
+            result = super().delete(*args, **kwargs)
+            Course.objects.add_counts(self.course_id_id, contents=-1, comments=-comments)
+        return result
+
+    def sync_path(self):
+        # id baru diketahui setelah insert, jadi path diperbarui sesudah save()
+        if self.parent_id_id is None:
+            path, depth = f"/{self.pk}/", 0
+        else:
+            parent = CourseContent.objects.only('path', 'depth').get(pk=self.parent_id_id)
+            path, depth = f"{parent.path or f'/{parent.pk}/'}{self.pk}/", parent.depth + 1
+        if (path, depth) == (self.path, self.depth):
+            return
+
+        CourseContent.objects.filter(pk=self.pk).update(path=path, depth=depth)
+        if self.path:
+            # konten dipindah: path seluruh turunannya ikut diganti
+            CourseContent.objects.filter(path__startswith=self.path).exclude(pk=self.pk).update(
+                path=Concat(Value(path), Substr('path', len(self.path) + 1)),
+                depth=F('depth') + (depth - self.depth),
+            )
+        self.path, self.depth = path, depth
+
+
+class CommentQuerySet(models.QuerySet):
+
+    def delete(self):
+        # counter dikurangi per course; DELETE sendiri tetap satu query (fast delete)
+        with transaction.atomic():
+            per_course = list(self.order_by().values_list('content_id__course_id')
+                                  .annotate(n=Count('pk')))
+            result = super().delete()
+            for course_id, count in per_course:
+                Course.objects.add_counts(course_id, comments=-count)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
 
 class Comment(models.Model):
     content_id = models.ForeignKey(CourseContent, verbose_name="konten", on_delete=models.CASCADE)
@@ -63,10 +328,31 @@ class Comment(models.Model):
     comment = models.TextField('komentar')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    objects = CommentQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Komentar"
         verbose_name_plural = "Komentar"
+        indexes = [
+            models.Index(fields=["content_id", "created_at"], name="comment_content_created_idx"),
+        ]
 
     def __str__(self) -> str:
-        return "Komen: "+self.member_id.user_id+"-"+self.comment
\ No newline at end of file
+        return "Komen: "+self.member_id.user_id+"-"+self.comment
+
+    def _course_id(self):
+        return Subquery(CourseContent.objects.filter(pk=self.content_id_id).values('course_id')[:1])
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if adding:
+                Course.objects.add_counts(self._course_id(), comments=1)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            Course.objects.add_counts(self._course_id(), comments=-1)
+        return result
\ No newline at end of file
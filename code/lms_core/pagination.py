@@ -0,0 +1,148 @@
+import base64
+import json
+from typing import Any, List, Optional
+
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+from ninja import Field, Schema
+from ninja.conf import settings
+from ninja.errors import HttpError
+from ninja.pagination import AsyncPaginationBase, PageNumberPagination
+
+from lms_core.fields import Projection
+
+
+class CursorPagination(AsyncPaginationBase):
+    """Paginasi keyset berdasarkan (created_at, id).
+
+    Tidak ada COUNT(*) maupun OFFSET: setiap halaman diambil dengan filter
+    `WHERE (created_at, id) < (cursor)` sehingga halaman yang dalam sama
+    cepatnya dengan halaman pertama. Cursor bersifat opaque (base64).
+    """
+
+    class Input(Schema):
+        cursor: Optional[str] = None
+        page_size: Optional[int] = Field(None, ge=1)
+
+    class Output(Schema):
+        items: List[Any]
+        next: Optional[str] = None
+        previous: Optional[str] = None
+
+    def __init__(self, page_size: int = settings.PAGINATION_PER_PAGE,
+                 max_page_size: int = 100, descending: bool = True, **kwargs: Any) -> None:
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.descending = descending
+        super().__init__(**kwargs)
+
+    @staticmethod
+    def encode_cursor(item: Any, reverse: bool = False) -> str:
+        if isinstance(item, dict):
+            created_at, pk = item["created_at"], item["id"]
+        else:
+            created_at, pk = item.created_at, item.pk
+        data = {"c": created_at.isoformat(), "i": pk, "r": reverse}
+        raw = json.dumps(data, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str):
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            data = json.loads(raw)
+            created_at = parse_datetime(data["c"])
+            if created_at is None:
+                raise ValueError(cursor)
+            return created_at, int(data["i"]), bool(data.get("r", False))
+        except (ValueError, KeyError, TypeError):
+            raise HttpError(400, "Invalid cursor")
+
+    def _page_params(self, pagination: Input):
+        size = min(pagination.page_size or self.page_size, self.max_page_size)
+        if pagination.cursor is None:
+            return size, None, None, False
+        created_at, pk, reverse = self.decode_cursor(pagination.cursor)
+        return size, created_at, pk, reverse
+
+    def _build_queryset(self, queryset: QuerySet, created_at, pk, reverse: bool) -> QuerySet:
+        # Mundur (previous) berarti arah urutan dibalik lalu hasilnya dibalik lagi.
+        descending = self.descending != reverse
+        if created_at is not None:
+            op = "lt" if descending else "gt"
+            queryset = queryset.filter(
+                Q(**{f"created_at__{op}": created_at})
+                | Q(created_at=created_at, **{f"pk__{op}": pk})
+            )
+        if descending:
+            return queryset.order_by("-created_at", "-pk")
+        return queryset.order_by("created_at", "pk")
+
+    def _make_page(self, rows: List[Any], size: int, has_cursor: bool, reverse: bool) -> Any:
+        has_more = len(rows) > size
+        rows = rows[:size]
+        if reverse:
+            rows.reverse()
+            has_next, has_previous = has_cursor, has_more
+        else:
+            has_next, has_previous = has_more, has_cursor
+
+        return {
+            "items": rows,
+            "next": self.encode_cursor(rows[-1]) if rows and has_next else None,
+            "previous": self.encode_cursor(rows[0], reverse=True) if rows and has_previous else None,
+        }
+
+    def paginate_queryset(self, queryset: QuerySet, pagination: Input, **params: Any) -> Any:
+        size, created_at, pk, reverse = self._page_params(pagination)
+        # Ambil satu baris ekstra untuk mengetahui apakah masih ada halaman berikutnya
+        rows = list(self._build_queryset(queryset, created_at, pk, reverse)[: size + 1])
+        return self._make_page(rows, size, created_at is not None, reverse)
+
+    async def apaginate_queryset(self, queryset: QuerySet, pagination: Input, **params: Any) -> Any:
+        size, created_at, pk, reverse = self._page_params(pagination)
+        qs = self._build_queryset(queryset, created_at, pk, reverse)[: size + 1]
+        rows = [row async for row in qs]
+        return self._make_page(rows, size, created_at is not None, reverse)
+
+
+class SparseFieldsMixin:
+    """Tambahkan `?fields=` ke paginasi: query hanya mengambil kolom yang
+    diminta (lewat .values()) dan response hanya berisi field tersebut.
+
+    Route memakai `response=List[sparse_schema(Schema)]` dan `exclude_unset=True`.
+    """
+
+    required_fields = ()
+
+    def __init__(self, schema, **kwargs: Any) -> None:
+        self.schema = schema
+        super().__init__(**kwargs)
+
+    def paginate_queryset(self, queryset: QuerySet, pagination: Any, **params: Any) -> Any:
+        projection = Projection(queryset, self.schema, pagination.fields, self.required_fields)
+        page = super().paginate_queryset(projection.queryset, pagination, **params)
+        page["items"] = [projection.shape(row) for row in page["items"]]
+        return page
+
+    async def apaginate_queryset(self, queryset: QuerySet, pagination: Any, **params: Any) -> Any:
+        projection = Projection(queryset, self.schema, pagination.fields, self.required_fields)
+        page = await super().apaginate_queryset(projection.queryset, pagination, **params)
+        items = page["items"]
+        if isinstance(items, QuerySet):
+            items = [row async for row in items]
+        page["items"] = [projection.shape(row) for row in items]
+        return page
+
+
+class SparsePageNumberPagination(SparseFieldsMixin, PageNumberPagination):
+    class Input(PageNumberPagination.Input):
+        fields: Optional[str] = None
+
+
+class SparseCursorPagination(SparseFieldsMixin, CursorPagination):
+    # dibutuhkan untuk membentuk cursor walaupun tidak diminta di ?fields=
+    required_fields = ("id", "created_at")
+
+    class Input(CursorPagination.Input):
+        fields: Optional[str] = None
@@ -0,0 +1,55 @@
+from decimal import Decimal
+from typing import Any
+
+from django.conf import settings
+from django.http import HttpRequest
+from django.utils.module_loading import import_string
+from ninja.renderers import BaseRenderer, JSONRenderer
+from ninja.responses import NinjaJSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson bersifat opsional
+    orjson = None
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Renderer JSON berbasis orjson.
+
+    UUID dan dataclass di-encode langsung oleh orjson (C), sisanya lewat
+    `default`. datetime/date/time sengaja diteruskan ke encoder Ninja
+    (OPT_PASSTHROUGH_DATETIME) agar formatnya sama dengan JSONRenderer:
+    presisi milidetik dan akhiran "Z", bukan mikrodetik seperti orjson.
+    """
+
+    media_type = "application/json"
+    options = 0 if orjson is None else orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("ORJSONRenderer membutuhkan paket orjson")
+        self._fallback = NinjaJSONEncoder()
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, Decimal):
+            return str(o)
+        return self._fallback.default(o)
+
+    def render(self, request: HttpRequest, data: Any, *, response_status: int) -> Any:
+        return orjson.dumps(data, default=self.default, option=self.options)
+
+
+def get_renderer():
+    # settings.API_RENDERER bisa diisi path class renderer; kalau kosong pakai
+    # orjson bila terpasang, selain itu renderer bawaan Ninja (json stdlib).
+    path = getattr(settings, "API_RENDERER", None)
+    if path:
+        renderer = import_string(path)()
+    elif orjson is not None:
+        renderer = ORJSONRenderer()
+    else:
+        renderer = JSONRenderer()
+    if getattr(settings, "PERF_METRICS", False):
+        from lms_core.metrics import InstrumentedRenderer
+        renderer = InstrumentedRenderer(renderer)
+    return renderer
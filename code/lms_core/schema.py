@@ -1,5 +1,5 @@
-from ninja import Schema
-from typing import Optional
+from ninja import Schema, Field
+from typing import List, Optional
 from datetime import datetime
 
 from django.contrib.auth.models import User
@@ -17,10 +17,27 @@ class CourseSchemaOut(Schema):
     description: str
     price: int
     image : Optional[str]
+    image_thumb: Optional[str]
+    image_medium: Optional[str]
     teacher: UserOut
+    member_count: int
+    content_count: int
+    comment_count: int
     created_at: datetime
     updated_at: datetime
 
+class UserMini(Schema):
+    id: int
+    first_name: str
+    last_name: str
+
+
+class CourseMemberMini(Schema):
+    id: int
+    user_id: UserMini
+    roles: str
+
+
 class CourseMemberOut(Schema):
     id: int 
     course_id: CourseSchemaOut
@@ -29,6 +46,10 @@ class CourseMemberOut(Schema):
     # created_at: datetime
 
 
+class CourseEnrollBulkIn(Schema):
+    user_ids: List[int] = Field(..., min_length=1, max_length=500)
+
+
 class CourseSchemaIn(Schema):
     name: str
     description: str
@@ -54,6 +75,17 @@ class CourseContentFull(Schema):
     created_at: datetime
     updated_at: datetime
 
+class CourseContentNode(Schema):
+    id: int
+    name: str
+    description: str
+    video_url: Optional[str]
+    parent_id: Optional[int]
+    depth: int
+    children: List["CourseContentNode"] = []
+
+CourseContentNode.model_rebuild()
+
 class CourseCommentOut(Schema):
     id: int
     content_id: CourseContentMini
@@ -62,5 +94,20 @@ class CourseCommentOut(Schema):
     created_at: datetime
     updated_at: datetime
 
+class CourseCommentListOut(Schema):
+    # versi ringkas untuk feed komentar: course & teacher tidak diulang per baris
+    id: int
+    content_id: int
+    member_id: CourseMemberMini
+    comment: str
+    created_at: datetime
+    updated_at: datetime
+
 class CourseCommentIn(Schema):
     comment: str
+
+class CourseCommentBulkIn(Schema):
+    comments: List[CourseCommentIn] = Field(..., min_length=1, max_length=100)
+
+class CommentBulkDeleteIn(Schema):
+    ids: List[int] = Field(..., min_length=1, max_length=500)
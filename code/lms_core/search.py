@@ -0,0 +1,80 @@
+import re
+
+from django.db import connection
+from django.db.models import FloatField
+from django.db.models.expressions import RawSQL
+
+from lms_core.models import Course
+
+# PostgreSQL: kolom tsvector hasil generate (nama A, deskripsi B) + index GIN.
+# SQLite: tabel virtual FTS5 berisi salinan nama & deskripsi, rowid = id course,
+# disinkronkan lewat signal (lihat lms_core.signals). Keduanya dibuat di migrasi 0009.
+FTS_TABLE = 'lms_core_course_fts'
+PG_CONFIG = 'simple'
+
+
+def _fts5_query(q):
+    # input user dijadikan token berkutip agar sintaks FTS5 (", *, OR, ...) tidak bocor;
+    # token terakhir memakai prefix match untuk pencarian sambil mengetik
+    tokens = re.findall(r'\w+', q)
+    return ' '.join(f'"{token}"' for token in tokens[:-1]) + (f' "{tokens[-1]}"*' if tokens else '')
+
+
+def search_courses(q, queryset=None):
+    """Course yang cocok dengan `q`, diurutkan dari yang paling relevan."""
+    queryset = Course.objects.all() if queryset is None else queryset
+    table = connection.ops.quote_name(Course._meta.db_table)
+
+    if connection.vendor == 'postgresql':
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorField
+
+        # search_vector bukan field model (kolom generate dari migrasi 0009)
+        vector = RawSQL(f'{table}."search_vector"', [], output_field=SearchVectorField())
+        query = SearchQuery(q, config=PG_CONFIG, search_type='websearch')
+        return queryset.alias(vector=vector).filter(vector=query) \
+                       .annotate(rank=SearchRank(vector, query, cover_density=True)) \
+                       .order_by('-rank', '-id')
+
+    match = _fts5_query(q)
+    if not match:
+        return queryset.none()
+    return queryset.filter(
+        id__in=RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [match]),
+    ).annotate(
+        # bm25: makin kecil makin relevan; kecocokan di nama diberi bobot 10x
+        rank=RawSQL(f'SELECT bm25({FTS_TABLE}, 10.0, 1.0) FROM {FTS_TABLE} '
+                    f'WHERE {FTS_TABLE}.rowid = {table}.id AND {FTS_TABLE} MATCH %s',
+                    [match], output_field=FloatField()),
+    ).order_by('rank', '-id')
+
+
+def uses_fts_table():
+    return connection.vendor == 'sqlite'
+
+
+def index_course(course):
+    if not uses_fts_table():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [course.pk])
+        cursor.execute(f'INSERT INTO {FTS_TABLE} (rowid, name, description) VALUES (%s, %s, %s)',
+                       [course.pk, course.name, course.description])
+
+
+def remove_course(course_id):
+    if not uses_fts_table():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [course_id])
+
+
+def rebuild_search_index():
+    """Isi ulang index FTS5 dari tabel course, mis. setelah bulk_create/update()."""
+    if not uses_fts_table():
+        return 0
+    table = connection.ops.quote_name(Course._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {FTS_TABLE}')
+        cursor.execute(f'INSERT INTO {FTS_TABLE} (rowid, name, description) '
+                       f'SELECT id, name, description FROM {table}')
+        return cursor.rowcount
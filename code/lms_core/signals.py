@@ -0,0 +1,35 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from lms_core.auth import revoke_user
+from lms_core.cache import invalidate
+from lms_core.models import Course
+from lms_core.search import index_course, remove_course
+
+
+@receiver([post_save, post_delete], sender=Course)
+def invalidate_course_cache(sender, **kwargs):
+    invalidate("courses")
+
+
+@receiver(post_save, sender=Course)
+def update_search_index(sender, instance, **kwargs):
+    index_course(instance)
+
+
+@receiver(post_delete, sender=Course)
+def remove_from_search_index(sender, instance, **kwargs):
+    remove_course(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def revoke_tokens_on_credential_change(sender, instance, created, **kwargs):
+    # _password hanya terisi jika set_password() dipanggil sebelum save()
+    if not created and (instance._password is not None or not instance.is_active):
+        revoke_user(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def revoke_tokens_on_user_delete(sender, instance, **kwargs):
+    revoke_user(instance.pk)
@@ -0,0 +1,60 @@
+import json
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+# "METHOD /path" (path seperti di lms_core.api.router) -> jumlah query per request.
+# Nilai berupa dict jika berbeda per database (connection.vendor).
+BUDGET_FILE = Path(__file__).with_name('query_budgets.json')
+BUDGETS = json.loads(BUDGET_FILE.read_text())
+
+# Jumlah baris yang di-seed; budget harus sama untuk semuanya (tidak ada N+1)
+ROW_COUNTS = (1, 10, 100)
+
+
+def get_budget(endpoint):
+    budget = BUDGETS[endpoint]
+    return budget[connection.vendor] if isinstance(budget, dict) else budget
+
+
+def at_row_counts(*counts):
+    """Jalankan test sekali per jumlah baris: test(self, n) dipanggil di subTest
+    dan transaksi tersendiri yang di-rollback, sehingga tiap n mulai dari data
+    setUpTestData yang sama."""
+    counts = counts or ROW_COUNTS
+
+    def decorator(test):
+        @wraps(test)
+        def wrapper(self):
+            for n in counts:
+                with self.subTest(rows=n), transaction.atomic():
+                    cache.clear()
+                    try:
+                        test(self, n)
+                    finally:
+                        transaction.set_rollback(True)
+        return wrapper
+    return decorator
+
+
+class QueryBudgetMixin:
+
+    @contextmanager
+    def assertQueryBudget(self, endpoint):
+        """Pastikan blok menjalankan tepat sebanyak budget `endpoint`.
+
+        SAVEPOINT/RELEASE tidak dihitung: jumlahnya bergantung pada apakah
+        request berjalan di dalam transaksi test atau tidak.
+        """
+        budget = get_budget(endpoint)
+        with CaptureQueriesContext(connection) as ctx:
+            yield ctx
+        statements = [q['sql'] for q in ctx.captured_queries if 'SAVEPOINT' not in q['sql']]
+        self.assertEqual(
+            len(statements), budget,
+            f"{endpoint}: {len(statements)} query, budget {budget} "
+            f"(perbarui {BUDGET_FILE.name} jika disengaja)\n" + "\n".join(statements))
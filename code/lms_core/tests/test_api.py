@@ -152,3 +152,24 @@ class APITestCase(TestCase):
         # Verifikasi bahwa statusnya OK dan komentar terhapus dari database
         self.assertEqual(response.status_code, 200)
         self.assertFalse(Comment.objects.filter(id=comment_id).exists())
+
+
+class ListCoursesQueryTestCase(TestCase):
+    base_url = '/api/v1/'
+
+    def create_courses(self, total):
+        start = Course.objects.count()
+        for i in range(start, start + total):
+            teacher = User.objects.create(username=f'teacher{i}')
+            Course.objects.create(name=f"Course {i}", description="-",
+                                  price=1000, teacher=teacher)
+
+    def test_list_courses_query_count_is_constant(self):
+        # 1 query COUNT untuk paginasi + 1 query data (course JOIN teacher)
+        for total in (1, 10):
+            self.create_courses(total)
+            with self.assertNumQueries(2):
+                response = self.client.get(f'{self.base_url}courses')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()['items'][0]['teacher']['id'],
+                             Course.objects.first().teacher.id)
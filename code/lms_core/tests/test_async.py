@@ -0,0 +1,44 @@
+from django.contrib.auth.models import User
+from django.test import AsyncClient, TestCase
+from lms_core.api import router
+from lms_core.models import Course, CourseMember, CourseContent, Comment
+
+
+class AsyncReadEndpointsTest(TestCase):
+    base_url = '/api/v1/'
+
+    def setUp(self):
+        self.client = AsyncClient()
+        teacher = User.objects.create_user(username='teacher', password='password123')
+        student = User.objects.create_user(username='student', password='password123')
+        self.course = Course.objects.create(name="Course A", description="-", price=100, teacher=teacher)
+        member = CourseMember.objects.create(course_id=self.course, user_id=student)
+        self.content = CourseContent.objects.create(course_id=self.course, name="Bab 1")
+        CourseContent.objects.create(course_id=self.course, name="Sub Bab", parent_id=self.content)
+        Comment.objects.create(content_id=self.content, member_id=member, comment="Komentar")
+
+    def test_read_operations_are_async(self):
+        operations = {op.view_func.__name__: op for view in router.path_operations.values() for op in view.operations}
+        for name in ('hello', 'list_courses', 'list_courses_cursor', 'list_course_contents', 'list_comments'):
+            self.assertTrue(operations[name].is_async, name)
+
+    async def test_list_courses(self):
+        response = await self.client.get(f'{self.base_url}courses?fields=id,name,teacher.email')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['items'], [
+            {'id': self.course.id, 'name': 'Course A', 'teacher': {'email': ''}}])
+
+        response = await self.client.get(f'{self.base_url}courses/cursor')
+        self.assertEqual([item['id'] for item in response.json()['items']], [self.course.id])
+
+    async def test_course_contents(self):
+        response = await self.client.get(f'{self.base_url}courses/{self.course.id}/contents')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]['children'][0]['name'], "Sub Bab")
+
+        response = await self.client.get(f'{self.base_url}courses/9999/contents')
+        self.assertEqual(response.status_code, 404)
+
+    async def test_list_comments(self):
+        response = await self.client.get(f'{self.base_url}contents/{self.content.id}/comments')
+        self.assertEqual([item['comment'] for item in response.json()['items']], ["Komentar"])
@@ -0,0 +1,115 @@
+import time
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from ninja_simple_jwt.jwt.token_operations import decode_token
+from lms_core.auth import TokenCache, token_cache, revoke_token, revoke_user
+
+
+class CachedJwtAuthTest(TestCase):
+    base_url = '/api/v1/'
+
+    def setUp(self):
+        cache.clear()
+        token_cache.clear()
+        self.user = User.objects.create_user(username='student', password='password123')
+        response = self.client.post(f'{self.base_url}auth/sign-in',
+                                    data={'username': 'student', 'password': 'password123'},
+                                    content_type='application/json')
+        self.token = response.json()['access']
+
+    def get_mycourses(self, token=None):
+        return self.client.get(f'{self.base_url}mycourses',
+                               HTTP_AUTHORIZATION=f'Bearer {token or self.token}')
+
+    def test_token_verified_once(self):
+        with mock.patch('lms_core.auth.decode_token', wraps=decode_token) as decode:
+            self.assertEqual(self.get_mycourses().status_code, 200)
+            self.assertEqual(self.get_mycourses().status_code, 200)
+        self.assertEqual(decode.call_count, 1)
+
+    def test_invalid_token_rejected(self):
+        self.assertEqual(self.get_mycourses('bukan.token.valid').status_code, 401)
+        self.assertEqual(len(token_cache), 0)
+
+    def test_revoke_token(self):
+        self.get_mycourses()
+        revoke_token(self.token)
+        self.assertEqual(self.get_mycourses().status_code, 401)
+
+    def test_password_change_revokes_tokens(self):
+        self.get_mycourses()
+        self.user.set_password('passwordbaru123')
+        self.user.save()
+        self.assertEqual(self.get_mycourses().status_code, 401)
+
+    def sign_in(self, password='password123'):
+        response = self.client.post(f'{self.base_url}auth/sign-in',
+                                    data={'username': 'student', 'password': password},
+                                    content_type='application/json')
+        return response.json()['access']
+
+    def test_sign_in_right_after_revoke(self):
+        # token baru yang terbit di detik yang sama dengan revoke tetap sah
+        with mock.patch('time.time', return_value=1_900_000_000.25):
+            revoke_user(self.user.pk)
+        with mock.patch('time.time', return_value=1_900_000_000.75):
+            token = self.sign_in()
+        self.assertEqual(self.get_mycourses(token).status_code, 200)
+
+    def test_sign_in_after_password_change(self):
+        self.user.set_password('passwordbaru123')
+        self.user.save()
+        self.assertEqual(self.get_mycourses().status_code, 401)
+        self.assertEqual(self.get_mycourses(self.sign_in('passwordbaru123')).status_code, 200)
+
+    def test_deactivated_user_revokes_tokens(self):
+        self.get_mycourses()
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.get_mycourses().status_code, 401)
+
+    def test_unrelated_user_save_keeps_cache(self):
+        self.get_mycourses()
+        self.user.first_name = 'Budi'
+        self.user.save()
+        self.assertEqual(self.get_mycourses().status_code, 200)
+
+    @override_settings(PASSWORD_HASHERS=settings.PASSWORD_HASHERS + ['django.contrib.auth.hashers.MD5PasswordHasher'])
+    def test_password_hash_upgrade_keeps_tokens(self):
+        User.objects.create(username='fixture', password=make_password('password123', hasher='md5'))
+        response = self.client.post(f'{self.base_url}auth/sign-in',
+                                    data={'username': 'fixture', 'password': 'password123'},
+                                    content_type='application/json')
+        self.assertEqual(self.get_mycourses(response.json()['access']).status_code, 200)
+
+
+class TokenCacheTest(TestCase):
+    def test_evicts_least_recently_used(self):
+        lru = TokenCache(2)
+        expires_at = time.time() + 60
+        lru.set('a', {'user_id': 1}, expires_at)
+        lru.set('b', {'user_id': 2}, expires_at)
+        lru.get('a')
+        lru.set('c', {'user_id': 3}, expires_at)
+        self.assertIsNone(lru.get('b'))
+        self.assertEqual(lru.get('a'), {'user_id': 1})
+
+    def test_expired_entry(self):
+        lru = TokenCache(2)
+        lru.set('a', {'user_id': 1}, time.time() - 1)
+        self.assertIsNone(lru.get('a'))
+        self.assertEqual(len(lru), 0)
+
+    def test_discard_user(self):
+        lru = TokenCache(4)
+        expires_at = time.time() + 60
+        lru.set('a', {'user_id': 1}, expires_at)
+        lru.set('b', {'user_id': 1}, expires_at)
+        lru.set('c', {'user_id': 2}, expires_at)
+        lru.discard_user(1)
+        self.assertEqual(len(lru), 1)
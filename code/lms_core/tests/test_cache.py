@@ -0,0 +1,72 @@
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.contrib.auth.models import User
+from lms_core.models import Course
+from lms_core.cache import cache_response
+
+
+class CourseCacheTestCase(TestCase):
+    base_url = '/api/v1/'
+
+    def setUp(self):
+        cache.clear()
+        self.teacher = User.objects.create_user(username='teacher', password='password123')
+        self.course = Course.objects.create(name="Django for Beginners", description="-",
+                                            price=100, teacher=self.teacher)
+
+    def test_second_request_served_from_cache(self):
+        first = self.client.get(f'{self.base_url}courses')
+        with self.assertNumQueries(0):
+            second = self.client.get(f'{self.base_url}courses')
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(first.json(), second.json())
+
+    def test_query_params_are_part_of_key(self):
+        self.client.get(f'{self.base_url}courses?page=1')
+        with self.assertNumQueries(2):
+            response = self.client.get(f'{self.base_url}courses?page=2')
+        self.assertEqual(response.json()['items'], [])
+
+    def test_course_save_invalidates_listing(self):
+        self.client.get(f'{self.base_url}courses')
+        self.course.name = "Django Lanjutan"
+        self.course.save()
+        response = self.client.get(f'{self.base_url}courses')
+        self.assertEqual(response.json()['items'][0]['name'], "Django Lanjutan")
+
+        Course.objects.create(name="Kursus Baru", description="-", price=100, teacher=self.teacher)
+        response = self.client.get(f'{self.base_url}courses')
+        self.assertEqual(response.json()['count'], 2)
+
+    def test_authorized_request_bypasses_cache(self):
+        self.client.get(f'{self.base_url}courses')
+        with self.assertNumQueries(2):
+            self.client.get(f'{self.base_url}courses', HTTP_AUTHORIZATION='Bearer token')
+
+
+class CacheDecoratorTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+
+    def view(self, request):
+        self.calls += 1
+        return HttpResponse(f"hasil {self.calls}", content_type="text/plain")
+
+    def test_sync_view(self):
+        cached_view = cache_response("sync-test")(self.view)
+        request = RequestFactory().get('/sync')
+        self.assertEqual(cached_view(request).content, b"hasil 1")
+        self.assertEqual(cached_view(request).content, b"hasil 1")
+        self.assertEqual(self.calls, 1)
+
+    async def test_async_view(self):
+        async def view(request):
+            return self.view(request)
+
+        cached_view = cache_response("async-test")(view)
+        request = RequestFactory().get('/async')
+        self.assertEqual((await cached_view(request)).content, b"hasil 1")
+        self.assertEqual((await cached_view(request)).content, b"hasil 1")
+        self.assertEqual(self.calls, 1)
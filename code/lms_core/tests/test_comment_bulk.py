@@ -0,0 +1,64 @@
+import json
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+from lms_core.models import Course, CourseMember, CourseContent, Comment
+
+
+class CommentBulkAPITestCase(TestCase):
+    base_url = '/api/v1/'
+
+    def setUp(self):
+        self.teacher = User.objects.create_user(username='teacher', password='password123')
+        self.student = User.objects.create_user(username='student', password='password123')
+        self.student2 = User.objects.create_user(username='student2', password='password123')
+        self.course = Course.objects.create(name="Django for Beginners", description="-",
+                                            price=100, teacher=self.teacher)
+        self.content = CourseContent.objects.create(course_id=self.course, name="Content Title")
+        self.member = CourseMember.objects.create(course_id=self.course, user_id=self.student)
+        self.member2 = CourseMember.objects.create(course_id=self.course, user_id=self.student2)
+        self.student_token = self.login('student')
+
+    def login(self, username):
+        login = self.client.post(self.base_url + 'auth/sign-in', data=json.dumps({
+            'username': username, 'password': 'password123'
+        }), content_type='application/json')
+        return login.json()['access']
+
+    def post(self, url, data, token):
+        return self.client.post(f'{self.base_url}{url}', data=json.dumps(data),
+                                content_type='application/json',
+                                HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def test_bulk_create_comments(self):
+        # content, membership, insert, update counter (+ savepoint transaksi)
+        with self.assertNumQueries(6):
+            response = self.post(f'contents/{self.content.id}/comments/bulk',
+                                 {'comments': [{'comment': 'Satu'}, {'comment': 'Dua'}]},
+                                 self.student_token)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([item['comment'] for item in response.json()], ['Satu', 'Dua'])
+        self.assertEqual(Comment.objects.filter(member_id=self.member).count(), 2)
+        self.assertEqual(Course.objects.get(pk=self.course.pk).comment_count, 2)
+
+    def test_bulk_create_as_non_member(self):
+        other = Course.objects.create(name="Lain", description="-", price=100, teacher=self.teacher)
+        content = CourseContent.objects.create(course_id=other, name="Content Title")
+        response = self.post(f'contents/{content.id}/comments/bulk',
+                             {'comments': [{'comment': 'Satu'}]}, self.student_token)
+        self.assertEqual(response.status_code, 401)
+        self.assertFalse(Comment.objects.exists())
+
+    def test_bulk_delete_only_own_comments(self):
+        own = [Comment.objects.create(content_id=self.content, member_id=self.member, comment=str(i))
+               for i in range(3)]
+        other = Comment.objects.create(content_id=self.content, member_id=self.member2, comment='x')
+
+        # membership, hitung per course, delete, update counter (+ savepoint transaksi)
+        with self.assertNumQueries(6):
+            response = self.post('comments/bulk-delete',
+                                 {'ids': [c.id for c in own] + [other.id]}, self.student_token)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'deleted': 3, 'skipped': 1})
+        self.assertEqual(list(Comment.objects.values_list('id', flat=True)), [other.id])
+        self.assertEqual(Course.objects.get(pk=self.course.pk).comment_count, 1)
@@ -0,0 +1,55 @@
+from django.test import TestCase
+from django.contrib.auth.models import User
+from lms_core.models import Course, CourseContent
+
+
+class CourseContentTreeTestCase(TestCase):
+    base_url = '/api/v1/'
+
+    def setUp(self):
+        self.teacher = User.objects.create_user(username='teacher', password='password123')
+        self.course = Course.objects.create(name="Django for Beginners", description="-",
+                                            price=100, teacher=self.teacher)
+        self.bab1 = CourseContent.objects.create(course_id=self.course, name="Bab 1")
+        self.bab2 = CourseContent.objects.create(course_id=self.course, name="Bab 2")
+        self.sub1 = CourseContent.objects.create(course_id=self.course, name="Bab 1.1", parent_id=self.bab1)
+        self.sub2 = CourseContent.objects.create(course_id=self.course, name="Bab 1.1.1", parent_id=self.sub1)
+
+    def test_path_and_depth(self):
+        self.sub2.refresh_from_db()
+        self.assertEqual(self.sub2.path, f"/{self.bab1.id}/{self.sub1.id}/{self.sub2.id}/")
+        self.assertEqual(self.sub2.depth, 2)
+
+    def test_move_updates_descendants(self):
+        self.sub1.parent_id = self.bab2
+        self.sub1.save()
+        self.sub2.refresh_from_db()
+        self.assertEqual(self.sub2.path, f"/{self.bab2.id}/{self.sub1.id}/{self.sub2.id}/")
+        self.assertEqual(self.sub2.depth, 2)
+
+    def test_tree_in_single_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(f'{self.base_url}courses/{self.course.id}/contents')
+        self.assertEqual(response.status_code, 200)
+        tree = response.json()
+        self.assertEqual([node['name'] for node in tree], ["Bab 1", "Bab 2"])
+        self.assertEqual(tree[0]['children'][0]['name'], "Bab 1.1")
+        self.assertEqual(tree[0]['children'][0]['children'][0]['name'], "Bab 1.1.1")
+        self.assertEqual(tree[1]['children'], [])
+
+    def test_subtree(self):
+        response = self.client.get(f'{self.base_url}courses/{self.course.id}/contents?root={self.sub1.id}')
+        tree = response.json()
+        self.assertEqual(len(tree), 1)
+        self.assertEqual(tree[0]['id'], self.sub1.id)
+        self.assertEqual([child['id'] for child in tree[0]['children']], [self.sub2.id])
+
+    def test_rebuild_paths(self):
+        CourseContent.objects.update(path='', depth=0)
+        self.assertEqual(CourseContent.objects.rebuild_paths(), 4)
+        self.sub2.refresh_from_db()
+        self.assertEqual(self.sub2.depth, 2)
+
+    def test_unknown_course(self):
+        response = self.client.get(f'{self.base_url}courses/{self.course.id + 1}/contents')
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,129 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.shortcuts import get_object_or_404
+from django.test import TestCase
+from ninja_simple_jwt.jwt.token_operations import get_access_token_for_user
+from lms_core.models import Course, CourseMember, CourseContent, Comment
+
+
+class CourseCountersTest(TestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(username='teacher', password='password123')
+        self.students = [User.objects.create_user(username=f'student{i}', password='password123')
+                         for i in range(3)]
+        self.course = Course.objects.create(name="Course A", description="-", price=100, teacher=self.teacher)
+
+    def counters(self):
+        self.course.refresh_from_db()
+        return self.course.member_count, self.course.content_count, self.course.comment_count
+
+    def test_create_and_delete(self):
+        member = CourseMember.objects.create(course_id=self.course, user_id=self.students[0])
+        content = CourseContent.objects.create(course_id=self.course, name="Bab 1")
+        comment = Comment.objects.create(content_id=content, member_id=member, comment="Satu")
+        Comment.objects.create(content_id=content, member_id=member, comment="Dua")
+        self.assertEqual(self.counters(), (1, 1, 2))
+
+        comment.delete()
+        self.assertEqual(self.counters(), (1, 1, 1))
+        # komentar ikut terhapus (CASCADE) bersama kontennya
+        content.delete()
+        self.assertEqual(self.counters(), (1, 0, 0))
+        member.delete()
+        self.assertEqual(self.counters(), (0, 0, 0))
+
+    def test_member_delete_with_comment_in_other_course(self):
+        other = Course.objects.create(name="Course B", description="-", price=100, teacher=self.teacher)
+        member = CourseMember.objects.create(course_id=self.course, user_id=self.students[0])
+        content = CourseContent.objects.create(course_id=self.course, name="Bab 1")
+        other_content = CourseContent.objects.create(course_id=other, name="Bab 1")
+        Comment.objects.create(content_id=content, member_id=member, comment="Satu")
+        # data lama/impor: komentar di konten course lain
+        Comment.objects.create(content_id=other_content, member_id=member, comment="Dua")
+
+        member.delete()
+        self.assertEqual(self.counters(), (0, 1, 0))
+        other.refresh_from_db()
+        self.assertEqual((other.member_count, other.content_count, other.comment_count), (0, 1, 0))
+
+    def test_queryset_delete(self):
+        other = Course.objects.create(name="Course B", description="-", price=100, teacher=self.teacher)
+        members = [CourseMember.objects.create(course_id=self.course, user_id=student) for student in self.students]
+        other_member = CourseMember.objects.create(course_id=other, user_id=self.students[0])
+        contents = [CourseContent.objects.create(course_id=self.course, name=f"Bab {i}") for i in range(2)]
+        other_content = CourseContent.objects.create(course_id=other, name="Bab 1")
+        Comment.objects.create(content_id=contents[0], member_id=members[0], comment="Satu")
+        Comment.objects.create(content_id=contents[1], member_id=members[1], comment="Dua")
+        Comment.objects.create(content_id=other_content, member_id=members[0], comment="Tiga")
+        Comment.objects.create(content_id=other_content, member_id=other_member, comment="Empat")
+        self.assertEqual(self.counters(), (3, 2, 2))
+
+        CourseContent.objects.filter(pk=contents[1].pk).delete()
+        self.assertEqual(self.counters(), (3, 1, 1))
+        # komentar members[0] di course lain dikurangi dari course tersebut
+        CourseMember.objects.filter(course_id=self.course, user_id__in=self.students[:2]).delete()
+        self.assertEqual(self.counters(), (1, 1, 0))
+        other.refresh_from_db()
+        self.assertEqual((other.member_count, other.content_count, other.comment_count), (1, 1, 1))
+
+    def test_full_save_keeps_counters(self):
+        stale = Course.objects.get(pk=self.course.pk)
+        CourseMember.objects.create(course_id=self.course, user_id=self.students[0])
+        # mis. form admin: save() tanpa update_fields atas objek yang dimuat sebelum enroll
+        stale.name = "Course A+"
+        stale.save()
+        self.assertEqual(self.counters(), (1, 0, 0))
+        self.assertEqual(self.course.name, "Course A+")
+
+    def test_update_does_not_change_counters(self):
+        member = CourseMember.objects.create(course_id=self.course, user_id=self.students[0])
+        member.roles = 'ast'
+        member.save()
+        self.assertEqual(self.counters(), (1, 0, 0))
+
+    def test_enroll(self):
+        CourseMember.objects.enroll(self.course.id, self.students[0].id)
+        CourseMember.objects.enroll_many(self.course.id, [s.id for s in self.students])
+        self.assertEqual(self.counters(), (3, 0, 0))
+
+    def test_queryset_delete(self):
+        member = CourseMember.objects.create(course_id=self.course, user_id=self.students[0])
+        content = CourseContent.objects.create(course_id=self.course, name="Bab 1")
+        for i in range(3):
+            Comment.objects.create(content_id=content, member_id=member, comment=str(i))
+        Comment.objects.filter(comment__in=['0', '1']).delete()
+        self.assertEqual(self.counters(), (1, 1, 1))
+
+    def test_rebuild_command(self):
+        member = CourseMember.objects.create(course_id=self.course, user_id=self.students[0])
+        content = CourseContent.objects.create(course_id=self.course, name="Bab 1")
+        Comment.objects.bulk_create([Comment(content_id=content, member_id=member, comment="x")] * 2)
+        Course.objects.update(member_count=9, content_count=9)
+        out = StringIO()
+        call_command('rebuild_course_counters', stdout=out)
+        self.assertEqual(self.counters(), (1, 1, 2))
+        self.assertIn('1 course diperbarui', out.getvalue())
+
+    def test_listing_includes_counters(self):
+        CourseMember.objects.create(course_id=self.course, user_id=self.students[0])
+        response = self.client.get('/api/v1/courses?fields=id,member_count,comment_count')
+        self.assertEqual(response.json()['items'], [{'id': self.course.id, 'member_count': 1, 'comment_count': 0}])
+
+    def test_update_course_keeps_concurrent_increments(self):
+        def load_then_enroll(*args, **kwargs):
+            course = get_object_or_404(*args, **kwargs)
+            # request lain menambah member setelah course dibaca
+            CourseMember.objects.enroll(self.course.id, self.students[0].id)
+            return course
+
+        token = get_access_token_for_user(self.teacher)[0]
+        with mock.patch('lms_core.api.get_object_or_404', load_then_enroll):
+            response = self.client.post(f'/api/v1/courses/{self.course.id}', data={
+                'name': 'Course B', 'description': '-', 'price': 100,
+            }, HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.counters(), (1, 0, 0))
+        self.assertEqual(self.course.name, 'Course B')
@@ -0,0 +1,88 @@
+import json
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from ninja_simple_jwt.jwt.token_operations import get_access_token_for_user
+from lms_core.models import Course, CourseMember
+
+
+class EnrollAPITestCase(TestCase):
+    base_url = '/api/v1/'
+
+    def setUp(self):
+        self.teacher = User.objects.create_user(username='teacher', password='password123')
+        self.student = User.objects.create_user(username='student', password='password123')
+        self.student2 = User.objects.create_user(username='student2', password='password123')
+        self.course = Course.objects.create(name="Django for Beginners", description="-",
+                                            price=100, teacher=self.teacher)
+        self.token = self.login('teacher')
+        self.student_token = self.login('student')
+
+    def login(self, username):
+        login = self.client.post(self.base_url + 'auth/sign-in', data=json.dumps({
+            'username': username, 'password': 'password123'
+        }), content_type='application/json')
+        return login.json()['access']
+
+    def enroll(self, course_id, token):
+        return self.client.post(f'{self.base_url}courses/{course_id}/enroll/',
+                                HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def test_enroll_is_single_insert(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.enroll(self.course.id, self.student_token)
+        self.assertEqual(response.status_code, 200)
+        statements = [q['sql'] for q in ctx.captured_queries if 'SAVEPOINT' not in q['sql']]
+        # INSERT ... SELECT lalu UPDATE counter member_count
+        self.assertEqual(len(statements), 2)
+        self.assertTrue(statements[0].startswith('INSERT'))
+        self.assertTrue(statements[1].startswith('UPDATE'))
+        self.assertTrue(self.course.is_member(self.student))
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.member_count, 1)
+
+    def test_enroll_twice_is_rejected(self):
+        self.enroll(self.course.id, self.student_token)
+        response = self.enroll(self.course.id, self.student_token)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(CourseMember.objects.filter(user_id=self.student).count(), 1)
+
+    def test_enroll_unknown_course(self):
+        response = self.enroll(self.course.id + 100, self.student_token)
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(CourseMember.objects.exists())
+
+    def test_enroll_missing_user(self):
+        # token sah untuk user yang tidak (lagi) ada di database
+        token = get_access_token_for_user(User(id=9999, username='hilang'))[0]
+        response = self.enroll(self.course.id, token)
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(CourseMember.objects.exists())
+
+    def test_enroll_many_unknown_course(self):
+        self.assertEqual(CourseMember.objects.enroll_many(self.course.id + 100, [self.student.id]), 0)
+        self.assertEqual(CourseMember.objects.enroll(self.course.id, self.student.id + 100), 0)
+        self.assertFalse(CourseMember.objects.exists())
+
+    def test_bulk_enroll(self):
+        CourseMember.objects.create(course_id=self.course, user_id=self.student)
+        response = self.client.post(
+            f'{self.base_url}courses/{self.course.id}/enroll/bulk',
+            data=json.dumps({'user_ids': [self.student.id, self.student2.id, 9999, self.student2.id]}),
+            content_type='application/json',
+            HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'enrolled': 1, 'skipped': 2})
+        self.assertEqual(set(CourseMember.objects.values_list('user_id', flat=True)),
+                         {self.student.id, self.student2.id})
+
+    def test_bulk_enroll_requires_teacher(self):
+        response = self.client.post(
+            f'{self.base_url}courses/{self.course.id}/enroll/bulk',
+            data=json.dumps({'user_ids': [self.student2.id]}),
+            content_type='application/json',
+            HTTP_AUTHORIZATION=f'Bearer {self.student_token}')
+        self.assertEqual(response.status_code, 401)
+        self.assertFalse(CourseMember.objects.exists())
@@ -0,0 +1,139 @@
+import csv
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from lms_core.models import Course, CourseMember, CourseContent, Comment
+
+
+class ExportLmsCommandTest(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = Path(self.tmpdir.name)
+        teacher = User.objects.create_user(username='teacher', password='password123', first_name='Budi')
+        student = User.objects.create_user(username='student', password='password123')
+        course = Course.objects.create(name='Course A', description='Desc, "kutip"', price=1000, teacher=teacher)
+        member = CourseMember.objects.create(course_id=course, user_id=student)
+        content = CourseContent.objects.create(course_id=course, name='Bab 1', video_url='http://v')
+        Comment.objects.create(content_id=content, member_id=member, comment='Komentar ü')
+
+    def run_export(self, **options):
+        out = StringIO()
+        call_command('export_lms', path=self.tmpdir.name, chunk_size=1, stdout=out, **options)
+        return out.getvalue()
+
+    def test_native_format_matches_importer_files(self):
+        output = self.run_export()
+        with open(self.path / 'user-data.csv', newline='') as f:
+            users = list(csv.DictReader(f))
+        self.assertEqual([u['username'] for u in users], ['teacher', 'student'])
+        # hash password tidak ikut diekspor secara default
+        self.assertNotIn('password', users[0])
+        self.assertNotIn('password_hash', users[0])
+        with open(self.path / 'course-data.csv', newline='') as f:
+            self.assertEqual(next(csv.DictReader(f))['description'], 'Desc, "kutip"')
+        comments = json.loads((self.path / 'comments.json').read_text(encoding='utf-8'))
+        self.assertEqual(comments[0]['comment'], 'Komentar ü')
+        self.assertEqual(comments[0]['user_id'], CourseMember.objects.get().pk)
+        self.assertEqual(len(json.loads((self.path / 'contents.json').read_text())), 1)
+        self.assertFalse(list(self.path.glob('*.tmp')))
+        self.assertIn('comments.json: 1 baris', output)
+
+    def clear_database(self):
+        Comment.objects.all().delete()
+        CourseContent.objects.all().delete()
+        CourseMember.objects.all().delete()
+        Course.objects.all().delete()
+        User.objects.all().delete()
+
+    def snapshot(self):
+        return {
+            'users': list(User.objects.order_by('pk').values_list('pk', 'username')),
+            'courses': list(Course.objects.order_by('pk').values_list('pk', 'name', 'teacher__username')),
+            'members': list(CourseMember.objects.order_by('pk')
+                                        .values_list('pk', 'course_id', 'user_id__username')),
+            'contents': list(CourseContent.objects.order_by('pk')
+                                          .values_list('pk', 'course_id', 'parent_id', 'path')),
+            'comments': list(Comment.objects.order_by('pk')
+                                    .values_list('pk', 'content_id', 'member_id__user_id__username', 'comment')),
+        }
+
+    def test_export_can_be_imported_back(self):
+        self.run_export(include_passwords=True)
+        self.clear_database()
+        call_command('import_lms', path=self.tmpdir.name, workers=1, stdout=StringIO())
+        self.assertEqual(User.objects.count(), 2)
+        self.assertEqual(Course.objects.get().description, 'Desc, "kutip"')
+        self.assertEqual(CourseMember.objects.count(), 1)
+        self.assertEqual(Comment.objects.get().comment, 'Komentar ü')
+
+    def test_round_trip_keeps_ids_with_gaps(self):
+        # id tidak berurutan: baris yang dihapus meninggalkan celah di setiap tabel
+        teacher = User.objects.get(username='teacher')
+        for i in range(3):
+            User.objects.create_user(username=f'hapus{i}')
+        User.objects.filter(username__startswith='hapus').delete()
+        teacher2 = User.objects.create_user(username='teacher2')
+        student2 = User.objects.create_user(username='student2')
+        Course.objects.create(name='Dihapus', description='-', price=0, teacher=teacher).delete()
+        course = Course.objects.create(name='Course B', description='-', price=0, teacher=teacher2)
+        CourseMember.objects.create(course_id=course, user_id=teacher).delete()
+        member = CourseMember.objects.create(course_id=course, user_id=student2)
+        CourseContent.objects.create(course_id=course, name='Dihapus').delete()
+        parent = CourseContent.objects.create(course_id=course, name='Bab 1')
+        child = CourseContent.objects.create(course_id=course, name='Bab 1.1', parent_id=parent)
+        Comment.objects.create(content_id=child, member_id=member, comment='Dihapus').delete()
+        Comment.objects.create(content_id=child, member_id=member, comment='Di sub bab')
+        before = self.snapshot()
+        counters = list(Course.objects.order_by('pk').values_list('member_count', 'content_count', 'comment_count'))
+
+        self.run_export(include_passwords=True)
+        self.clear_database()
+        call_command('import_lms', path=self.tmpdir.name, workers=1, stdout=StringIO())
+
+        self.assertEqual(self.snapshot(), before)
+        self.assertEqual(list(Course.objects.order_by('pk').values_list('member_count', 'content_count',
+                                                                         'comment_count')), counters)
+        # sequence disesuaikan: baris baru tidak bentrok dengan id hasil import
+        self.assertGreater(User.objects.create_user(username='baru').pk, student2.pk)
+
+    def test_passwords_survive_round_trip(self):
+        self.run_export(include_passwords=True)
+        self.clear_database()
+        call_command('import_lms', path=self.tmpdir.name, workers=1, stdout=StringIO())
+        # hash dari export tidak di-hash ulang
+        self.assertTrue(User.objects.get(username='teacher').check_password('password123'))
+
+    def test_plaintext_that_looks_like_a_hash_is_hashed(self):
+        # kolom password selalu plaintext, walaupun isinya mirip hash atau diawali '!'
+        (self.path / 'user-data.csv').write_text(
+            "firstname,lastname,email,password,username\n"
+            "A,B,a@mail.net,pbkdf2_sha256$1$garam$hash,hashlike\n"
+            "C,D,c@mail.net,!rahasia,bang\n")
+        for name in ('course-data.csv', 'member-data.csv'):
+            (self.path / name).write_text('id\n')
+        for name in ('contents.json', 'comments.json'):
+            (self.path / name).write_text('[]')
+        call_command('import_lms', path=self.tmpdir.name, workers=1, stdout=StringIO())
+        self.assertTrue(User.objects.get(username='hashlike').check_password('pbkdf2_sha256$1$garam$hash'))
+        self.assertTrue(User.objects.get(username='bang').check_password('!rahasia'))
+
+    def test_default_export_imports_unusable_passwords(self):
+        self.run_export()
+        self.clear_database()
+        call_command('import_lms', path=self.tmpdir.name, workers=1, stdout=StringIO())
+        teacher = User.objects.get(username='teacher')
+        self.assertFalse(teacher.has_usable_password())
+        self.assertFalse(teacher.check_password(''))
+
+    def test_ndjson_format(self):
+        self.run_export(format='ndjson')
+        lines = (self.path / 'member-data.ndjson').read_text().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])['roles'], 'std')
+        self.assertEqual(len(list(self.path.glob('*.ndjson'))), 5)
@@ -0,0 +1,64 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from lms_core.api import apiv1
+from lms_core.models import Course, CourseContent, CourseMember, Comment
+
+
+class SparseFieldsTestCase(TestCase):
+    base_url = '/api/v1/'
+
+    def setUp(self):
+        cache.clear()
+        self.teacher = User.objects.create_user(username='teacher', password='password123', first_name='Budi')
+        self.student = User.objects.create_user(username='student', password='password123', first_name='Ani')
+        self.courses = [
+            Course.objects.create(name=f"Course {i}", description="Deskripsi panjang", price=100,
+                                  teacher=self.teacher)
+            for i in range(3)
+        ]
+
+    def test_course_fields(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f'{self.base_url}courses?fields=id,name')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['items'][0], {'id': self.courses[2].id, 'name': "Course 2"})
+        # kolom yang tidak diminta tidak ikut di-query
+        self.assertNotIn('description', ctx.captured_queries[-1]['sql'])
+
+    def test_nested_fields(self):
+        response = self.client.get(f'{self.base_url}courses?fields=name,teacher.first_name')
+        self.assertEqual(response.json()['items'][0], {'name': "Course 2", 'teacher': {'first_name': 'Budi'}})
+
+        response = self.client.get(f'{self.base_url}courses?fields=teacher')
+        self.assertEqual(set(response.json()['items'][0]['teacher']),
+                         {'id', 'email', 'first_name', 'last_name'})
+
+    def test_unknown_field(self):
+        response = self.client.get(f'{self.base_url}courses?fields=id,password')
+        self.assertEqual(response.status_code, 400)
+
+    def test_cursor_with_fields(self):
+        response = self.client.get(f'{self.base_url}courses/cursor?fields=name&page_size=2')
+        data = response.json()
+        self.assertEqual(data['items'], [{'name': "Course 2"}, {'name': "Course 1"}])
+        response = self.client.get(f"{self.base_url}courses/cursor?fields=name&cursor={data['next']}")
+        self.assertEqual(response.json()['items'], [{'name': "Course 0"}])
+
+    def test_compact_comment_feed(self):
+        content = CourseContent.objects.create(course_id=self.courses[0], name="Content Title")
+        member = CourseMember.objects.create(course_id=self.courses[0], user_id=self.student)
+        Comment.objects.create(content_id=content, member_id=member, comment="Halo")
+
+        response = self.client.get(f'{self.base_url}contents/{content.id}/comments')
+        item = response.json()['items'][0]
+        self.assertEqual(item['content_id'], content.id)
+        self.assertEqual(item['member_id']['user_id']['first_name'], 'Ani')
+        self.assertNotIn('course_id', item['member_id'])
+
+    def test_openapi_schema(self):
+        schemas = apiv1.get_openapi_schema()['components']['schemas']
+        self.assertIn('count', schemas['PagedCourseSchemaOutFields']['properties'])
+        self.assertIn('next', schemas['PagedCourseSchemaOutCursorItem']['properties'])
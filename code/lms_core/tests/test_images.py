@@ -0,0 +1,114 @@
+import json
+import tempfile
+from io import BytesIO
+from unittest import mock
+
+from PIL import Image
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.shortcuts import get_object_or_404
+from django.test import TestCase, override_settings
+from lms_core.images import generate_course_variants
+from lms_core.models import Course
+
+
+def make_image(size=(1600, 900), fmt='PNG'):
+    buffer = BytesIO()
+    Image.new('RGB', size, 'navy').save(buffer, format=fmt)
+    return SimpleUploadedFile(f'sampul.{fmt.lower()}', buffer.getvalue(), content_type=f'image/{fmt.lower()}')
+
+
+class CourseImageTest(TestCase):
+    base_url = '/api/v1/'
+
+    def setUp(self):
+        self.media = tempfile.TemporaryDirectory()
+        self.addCleanup(self.media.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=self.media.name, IMAGE_TASKS_EAGER=True)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.teacher = User.objects.create_user(username='teacher', password='password123')
+        self.course = Course.objects.create(name="Course A", description="-", price=100, teacher=self.teacher)
+        login = self.client.post(f'{self.base_url}auth/sign-in', data=json.dumps({
+            'username': 'teacher', 'password': 'password123'}), content_type='application/json')
+        self.token = login.json()['access']
+
+    def upload(self, image):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(f'{self.base_url}courses/{self.course.id}', data={
+                'name': 'Course A', 'description': '-', 'price': 100, 'file': image,
+            }, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+    def test_upload_generates_variants(self):
+        response = self.upload(make_image())
+        self.assertEqual(response.status_code, 200)
+        self.course.refresh_from_db()
+        with Image.open(self.course.image_thumb.path) as thumb:
+            self.assertEqual(thumb.size, (320, 180))
+        with Image.open(self.course.image_medium.path) as medium:
+            self.assertEqual(medium.size, (960, 540))
+
+        item = self.client.get(f'{self.base_url}courses').json()['items'][0]
+        self.assertTrue(item['image'].endswith('.png'))
+        self.assertTrue(item['image_thumb'].endswith('_thumb.webp'))
+        self.assertTrue(item['image_medium'].endswith('_medium.webp'))
+
+    def test_reupload_replaces_old_variants(self):
+        self.upload(make_image())
+        self.course.refresh_from_db()
+        old_thumb = self.course.image_thumb
+        self.upload(make_image(fmt='JPEG'))
+        self.course.refresh_from_db()
+        self.assertNotEqual(self.course.image_thumb.name, old_thumb.name)
+        self.assertFalse(old_thumb.storage.exists(old_thumb.name))
+
+    def test_stale_job_is_discarded(self):
+        self.upload(make_image())
+        self.course.refresh_from_db()
+        # job untuk gambar yang sudah tidak dipakai course tidak menimpa varian
+        Course.objects.filter(pk=self.course.pk).update(image='course/lain.png')
+        self.assertEqual(generate_course_variants(self.course.pk, self.course.image.name), 0)
+
+    def test_update_without_file_keeps_new_variants(self):
+        self.upload(make_image())
+        self.course.refresh_from_db()
+        image_name = self.course.image.name
+
+        def load_then_finish_job(*args, **kwargs):
+            course = get_object_or_404(*args, **kwargs)
+            # job varian selesai setelah course dibaca oleh request update
+            Course.objects.filter(pk=course.pk).update(image_thumb='course/variants/baru_thumb.webp')
+            return course
+
+        with mock.patch('lms_core.api.get_object_or_404', load_then_finish_job):
+            response = self.client.post(f'{self.base_url}courses/{self.course.id}', data={
+                'name': 'Course B', 'description': '-', 'price': 100,
+            }, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.assertEqual(response.status_code, 200)
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.name, 'Course B')
+        self.assertEqual(self.course.image.name, image_name)
+        self.assertEqual(self.course.image_thumb.name, 'course/variants/baru_thumb.webp')
+
+    def test_create_course_with_image(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f'{self.base_url}courses', data={
+                'name': 'Course B', 'description': '-', 'price': 100, 'file': make_image((200, 100)),
+            }, HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        course = Course.objects.get(pk=response.json()['id'])
+        self.assertTrue(course.image_thumb)
+
+    def test_invalid_image_is_logged(self):
+        with self.assertLogs('lms_core.images', level='ERROR'):
+            self.upload(SimpleUploadedFile('rusak.png', b'bukan gambar', content_type='image/png'))
+        self.course.refresh_from_db()
+        self.assertTrue(self.course.image)
+        self.assertFalse(self.course.image_thumb)
+
+    @override_settings(IMAGE_TASKS_EAGER=False)
+    def test_job_runs_in_background_executor(self):
+        with mock.patch('lms_core.images.get_executor') as get_executor:
+            response = self.upload(make_image())
+        self.assertEqual(response.status_code, 200)
+        get_executor.return_value.submit.assert_called_once()
@@ -0,0 +1,92 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from lms_core.models import Course, CourseMember, CourseContent, Comment
+
+
+class ImportLmsCommandTest(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        path = Path(self.tmpdir.name)
+        (path / 'user-data.csv').write_text(
+            "firstname,lastname,email,password,username\n"
+            "Gisela,Lacy,lacy@mail.net,DSS37LTU3FN,GiselaLacy\n"
+            "Kasimir,Tanek,tanek@mail.net,NKN66UMD3FJ,KasimirTanek\n")
+        (path / 'course-data.csv').write_text(
+            "name,url,description,site,price,teacher\n"
+            "Course A,http://a,Desc A,Coursera,1000,1\n"
+            "Course B,http://b,Desc B,Coursera,2000,99\n")
+        (path / 'member-data.csv').write_text(
+            'course_id,user_id,roles\n1,2,"std"\n1,2,"std"\n')
+        (path / 'contents.json').write_text(json.dumps([
+            {"video_url": "http://v", "course_id": 1, "name": "Bab 1", "description": "-"},
+        ]))
+        (path / 'comments.json').write_text(json.dumps([
+            {"content_id": 1, "user_id": 1, "comment": "Komentar"},
+            {"content_id": 7, "user_id": 1, "comment": "Konten tidak ada"},
+        ]))
+
+    def run_import(self, **options):
+        out = StringIO()
+        call_command('import_lms', path=self.tmpdir.name, batch_size=1, stdout=out, **options)
+        return out.getvalue()
+
+    def test_import_resolves_foreign_keys_and_skips_invalid_rows(self):
+        output = self.run_import()
+        self.assertEqual(User.objects.count(), 2)
+        self.assertTrue(User.objects.get(username='GiselaLacy').check_password('DSS37LTU3FN'))
+        # course B merujuk teacher yang tidak ada
+        self.assertEqual(list(Course.objects.values_list('name', flat=True)), ['Course A'])
+        # baris member ganda diabaikan oleh unique constraint
+        self.assertEqual(CourseMember.objects.count(), 1)
+        self.assertEqual(CourseContent.objects.count(), 1)
+        self.assertEqual(list(Comment.objects.values_list('comment', flat=True)), ['Komentar'])
+        course = Course.objects.get()
+        self.assertEqual((course.member_count, course.content_count, course.comment_count), (1, 1, 1))
+        self.assertIn('baris/detik', output)
+
+    def test_import_is_idempotent(self):
+        self.run_import()
+        self.run_import()
+        self.assertEqual(User.objects.count(), 2)
+        self.assertEqual(Course.objects.count(), 1)
+        self.assertEqual(Comment.objects.count(), 1)
+
+    def test_comment_member_is_not_remapped_without_legacy_sample(self):
+        path = Path(self.tmpdir.name)
+        (path / 'comments.json').write_text(json.dumps([
+            {"content_id": 1, "user_id": 73, "comment": "Member tidak ada"},
+        ]))
+        self.run_import()
+        self.assertFalse(Comment.objects.exists())
+
+    def test_legacy_sample_remaps_comment_member_deterministically(self):
+        path = Path(self.tmpdir.name)
+        # 5 + 73 % 36 = 6, jadi butuh member dengan id 6
+        (path / 'member-data.csv').write_text('course_id,user_id,roles\n' + '1,2,"std"\n' * 5 + '1,1,"std"\n')
+        (path / 'comments.json').write_text(json.dumps([
+            {"content_id": 1, "user_id": 73, "comment": "Sampel"},
+        ]))
+        self.run_import(legacy_sample=True)
+        self.assertEqual(Comment.objects.get().member_id_id, 6)
+
+    @override_settings(FAST_PASSWORD_HASHER=True,
+                       PASSWORD_HASHERS=settings.PASSWORD_HASHERS + ['django.contrib.auth.hashers.MD5PasswordHasher'])
+    def test_parallel_hashing_with_fast_hasher(self):
+        self.run_import(workers=2, hash_chunk_size=1, fast_hasher=True)
+        for username, password in [('GiselaLacy', 'DSS37LTU3FN'), ('KasimirTanek', 'NKN66UMD3FJ')]:
+            user = User.objects.get(username=username)
+            self.assertTrue(user.password.startswith('md5$'))
+            self.assertTrue(user.check_password(password))
+
+    def test_fast_hasher_requires_setting(self):
+        with self.assertRaises(CommandError):
+            self.run_import(fast_hasher=True)
+        self.assertFalse(User.objects.exists())
@@ -0,0 +1,32 @@
+from django.test import TestCase
+from django.contrib.auth.models import User
+from lms_core.models import Course, CourseMember
+from lms_core.membership import MembershipLookup
+
+
+class MembershipLookupTest(TestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(username='teacher1', password='password123')
+        self.student = User.objects.create_user(username='student1', password='password123')
+        self.courses = [
+            Course.objects.create(name=f"Course {i}", description="-", price=100, teacher=self.teacher)
+            for i in range(3)
+        ]
+        self.member = CourseMember.objects.create(course_id=self.courses[0], user_id=self.student)
+
+    def test_memberships_loaded_once(self):
+        lookup = MembershipLookup(self.student.id)
+        with self.assertNumQueries(1):
+            self.assertTrue(lookup.is_member(self.courses[0].id))
+            self.assertFalse(lookup.is_member(self.courses[1].id))
+            self.assertEqual(lookup.member_id(self.courses[0].id), self.member.id)
+            self.assertTrue(lookup.owns_member(self.member.id))
+            for course in self.courses:
+                course.is_member(self.student, memberships=lookup)
+
+    def test_add_updates_lookup(self):
+        lookup = MembershipLookup(self.student.id)
+        member = CourseMember.objects.create(course_id=self.courses[1], user_id=self.student)
+        lookup.add(self.courses[1].id, member.id)
+        with self.assertNumQueries(0):
+            self.assertTrue(lookup.is_member(self.courses[1].id))
@@ -0,0 +1,66 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from lms_core import metrics
+from lms_core.models import Course
+from lms_core.renderers import ORJSONRenderer
+
+MIDDLEWARE = ['lms_core.metrics.PerformanceMiddleware'] + settings.MIDDLEWARE
+
+
+@override_settings(MIDDLEWARE=MIDDLEWARE, PERF_METRICS=True, PERF_QUERY_BUDGET=20)
+class PerformanceMiddlewareTest(TestCase):
+    base_url = '/api/v1/'
+
+    def setUp(self):
+        cache.clear()
+        metrics.registry.reset()
+        teacher = User.objects.create_user(username='teacher', password='password123')
+        for i in range(3):
+            Course.objects.create(name=f"Course {i}", description="-", price=100, teacher=teacher)
+
+    def render_metrics(self):
+        response = metrics.metrics_view(RequestFactory().get('/metrics'))
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        return response.content.decode()
+
+    def test_records_per_endpoint(self):
+        self.client.get(f'{self.base_url}courses')
+        self.client.get(f'{self.base_url}courses')  # dari cache: 0 query
+        output = self.render_metrics()
+        self.assertIn('lms_request_duration_seconds_count{endpoint="GET /api/v1/courses"} 2', output)
+        # halaman pertama: COUNT + SELECT (cache version lewat LocMem, bukan database)
+        self.assertIn('lms_db_queries_sum{endpoint="GET /api/v1/courses"} 2.0', output)
+        self.assertIn('lms_db_queries{endpoint="GET /api/v1/courses",quantile="0.99"} 2', output)
+        self.assertIn('# TYPE lms_response_size_bytes summary', output)
+
+    def test_unmatched_route(self):
+        self.client.get('/tidak-ada/')
+        self.assertIn('endpoint="GET /unmatched"', self.render_metrics())
+
+    @override_settings(PERF_QUERY_BUDGET=1)
+    def test_flags_requests_over_query_budget(self):
+        with self.assertLogs('lms_core.metrics', level='WARNING') as logs:
+            self.client.get(f'{self.base_url}courses')
+        self.assertIn('GET /api/v1/courses menjalankan 2 query (budget 1)', logs.output[0])
+        self.assertIn('lms_query_budget_exceeded_total{endpoint="GET /api/v1/courses"} 1', self.render_metrics())
+
+    def test_queries_outside_request_are_ignored(self):
+        self.client.get(f'{self.base_url}hello')
+        Course.objects.count()
+        self.assertIn('lms_db_queries_sum{endpoint="GET /api/v1/hello"} 0.0', self.render_metrics())
+
+
+class InstrumentedRendererTest(TestCase):
+    def test_measures_serialization(self):
+        renderer = metrics.InstrumentedRenderer(ORJSONRenderer())
+        self.assertEqual(renderer.media_type, 'application/json')
+        stats = metrics.RequestStats()
+        token = metrics._current.set(stats)
+        try:
+            body = renderer.render(None, {'items': list(range(1000))}, response_status=200)
+        finally:
+            metrics._current.reset(token)
+        self.assertTrue(body.startswith(b'{"items":[0,1'))
+        self.assertGreater(stats.serialize_time, 0)
@@ -1,5 +1,6 @@
 # lms_core/tests/test_models.py
 
+from django.db import IntegrityError
 from django.test import TestCase
 from django.contrib.auth.models import User
 from lms_core.models import Course, CourseMember, ROLE_OPTIONS
@@ -59,3 +60,8 @@ class CourseMemberModelTest(TestCase):
 
     def test_course_member_role_options(self):
         self.assertIn(self.course_member.roles, dict(ROLE_OPTIONS).keys())
+
+    def test_course_member_unique(self):
+        # Pendaftaran ganda ditolak oleh unique constraint (course_id, user_id)
+        with self.assertRaises(IntegrityError):
+            CourseMember.objects.create(course_id=self.course, user_id=self.student, roles='std')
@@ -0,0 +1,48 @@
+import json
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+from lms_core.models import Course, CourseMember
+
+
+class MyCoursesTestCase(TestCase):
+    base_url = '/api/v1/'
+
+    def setUp(self):
+        self.student = User.objects.create_user(username='student', password='password123',
+                                                email='student@mail.com')
+        login = self.client.post(self.base_url + 'auth/sign-in', data=json.dumps({
+            'username': 'student', 'password': 'password123'
+        }), content_type='application/json')
+        self.token = login.json()['access']
+
+    def enroll_courses(self, total):
+        start = Course.objects.count()
+        for i in range(start, start + total):
+            teacher = User.objects.create(username=f'teacher{i}', first_name=f'Guru {i}')
+            course = Course.objects.create(name=f"Course {i}", description="-", price=100, teacher=teacher)
+            CourseMember.objects.create(course_id=course, user_id=self.student)
+
+    def test_my_courses(self):
+        self.enroll_courses(2)
+        response = self.client.get(f'{self.base_url}mycourses', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data[0]['course_id']['name'], "Course 1")
+        self.assertEqual(data[0]['course_id']['teacher']['first_name'], "Guru 1")
+        self.assertIsNone(data[0]['course_id']['image'])
+        self.assertEqual(data[0]['user_id']['email'], 'student@mail.com')
+        self.assertEqual(data[0]['roles'], 'std')
+
+    def test_my_courses_query_count_is_constant(self):
+        for total in (1, 10):
+            self.enroll_courses(total)
+            with self.assertNumQueries(1):
+                response = self.client.get(f'{self.base_url}mycourses',
+                                           HTTP_AUTHORIZATION=f'Bearer {self.token}')
+            self.assertEqual(response.status_code, 200)
+
+    def test_my_courses_requires_login(self):
+        response = self.client.get(f'{self.base_url}mycourses')
+        self.assertEqual(response.status_code, 401)
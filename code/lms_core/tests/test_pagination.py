@@ -0,0 +1,61 @@
+from django.test import TestCase
+from django.contrib.auth.models import User
+from lms_core.models import Course, CourseContent, CourseMember, Comment
+
+
+class CursorPaginationTestCase(TestCase):
+    base_url = '/api/v1/'
+
+    def setUp(self):
+        self.teacher = User.objects.create_user(username='teacher', password='password123')
+        self.courses = [
+            Course.objects.create(name=f"Course {i}", description="-", price=100, teacher=self.teacher)
+            for i in range(5)
+        ]
+        # urutan yang diharapkan: created_at terbaru dulu, id sebagai pemutus seri
+        self.expected = list(Course.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+
+    def test_walk_forward_and_backward(self):
+        url = f'{self.base_url}courses/cursor?page_size=2'
+        seen, pages = [], []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            self.assertNotIn('count', data)
+            pages.append(data)
+            seen += [item['id'] for item in data['items']]
+            url = f"{self.base_url}courses/cursor?page_size=2&cursor={data['next']}" if data['next'] else None
+        self.assertEqual(seen, self.expected)
+        self.assertIsNone(pages[0]['previous'])
+
+        # kembali dari halaman terakhir ke halaman sebelumnya
+        response = self.client.get(
+            f"{self.base_url}courses/cursor?page_size=2&cursor={pages[-1]['previous']}")
+        data = response.json()
+        self.assertEqual([item['id'] for item in data['items']], self.expected[2:4])
+        self.assertIsNotNone(data['next'])
+        self.assertIsNotNone(data['previous'])
+
+    def test_single_query_without_count(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(f'{self.base_url}courses/cursor?page_size=2')
+        self.assertEqual(len(response.json()['items']), 2)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(f'{self.base_url}courses/cursor?cursor=bukan-cursor')
+        self.assertEqual(response.status_code, 400)
+
+    def test_list_comments(self):
+        student = User.objects.create_user(username='student', password='password123')
+        content = CourseContent.objects.create(course_id=self.courses[0], name="Content Title")
+        member = CourseMember.objects.create(course_id=self.courses[0], user_id=student)
+        for i in range(3):
+            Comment.objects.create(content_id=content, member_id=member, comment=f"Komentar {i}")
+
+        with self.assertNumQueries(1):
+            response = self.client.get(f'{self.base_url}contents/{content.id}/comments?page_size=2')
+        data = response.json()
+        self.assertEqual([item['comment'] for item in data['items']], ["Komentar 2", "Komentar 1"])
+        response = self.client.get(f"{self.base_url}contents/{content.id}/comments?cursor={data['next']}")
+        self.assertEqual([item['comment'] for item in response.json()['items']], ["Komentar 0"])
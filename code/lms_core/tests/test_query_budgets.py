@@ -0,0 +1,184 @@
+import json
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from ninja_simple_jwt.jwt.token_operations import get_access_token_for_user
+
+from lms_core.api import router
+from lms_core.models import Course, CourseMember, CourseContent, Comment
+from lms_core.search import rebuild_search_index
+from lms_core.tests.query_budget import BUDGETS, QueryBudgetMixin, at_row_counts
+
+
+class QueryBudgetTestCase(QueryBudgetMixin, TestCase):
+    """Jumlah query tiap route di lms_core.api tetap sama untuk 1, 10 dan 100 baris."""
+    base_url = '/api/v1/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create_user(username='teacher', password='password123')
+        cls.student = User.objects.create_user(username='student', password='password123')
+        cls.course = Course.objects.create(name="Django for Beginners", description="-",
+                                           price=100, teacher=cls.teacher)
+        cls.content = CourseContent.objects.create(course_id=cls.course, name="Content Title")
+        cls.member = CourseMember.objects.create(course_id=cls.course, user_id=cls.student)
+        cls.teacher_token = get_access_token_for_user(cls.teacher)[0]
+        cls.student_token = get_access_token_for_user(cls.student)[0]
+
+    def auth(self, token):
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def post_json(self, url, data, token):
+        return self.client.post(self.base_url + url, data=json.dumps(data),
+                                content_type='application/json', **self.auth(token))
+
+    def seed_courses(self, n):
+        courses = Course.objects.bulk_create([
+            Course(name=f"Python {i}", description="Belajar python", price=i, teacher=self.teacher)
+            for i in range(n)
+        ])
+        rebuild_search_index()
+        return courses
+
+    def seed_comments(self, n):
+        comments = Comment.objects.bulk_create([
+            Comment(content_id=self.content, member_id=self.member, comment=f"Komentar {i}")
+            for i in range(n)
+        ])
+        Course.objects.add_counts(self.course.id, comments=n)
+        return comments
+
+    def test_every_route_has_budget(self):
+        routes = {f"{method} {path}"
+                  for path, view in router.path_operations.items()
+                  for operation in view.operations
+                  for method in operation.methods}
+        self.assertEqual(routes, set(BUDGETS))
+
+    @at_row_counts()
+    def test_hello(self, n):
+        self.seed_courses(n)
+        with self.assertQueryBudget("GET /hello"):
+            response = self.client.get(self.base_url + 'hello')
+        self.assertEqual(response.status_code, 200)
+
+    @at_row_counts()
+    def test_list_courses(self, n):
+        self.seed_courses(n)
+        with self.assertQueryBudget("GET /courses"):
+            response = self.client.get(self.base_url + 'courses?page_size=100')
+        self.assertEqual(len(response.json()['items']), min(n + 1, 100))
+
+    @at_row_counts()
+    def test_list_courses_cursor(self, n):
+        self.seed_courses(n)
+        with self.assertQueryBudget("GET /courses/cursor"):
+            response = self.client.get(self.base_url + 'courses/cursor?page_size=100')
+        self.assertEqual(len(response.json()['items']), min(n + 1, 100))
+
+    @at_row_counts()
+    def test_search_courses(self, n):
+        self.seed_courses(n)
+        with self.assertQueryBudget("GET /courses/search"):
+            response = self.client.get(self.base_url + 'courses/search?q=python&page_size=100')
+        self.assertEqual(len(response.json()['items']), n)
+
+    @at_row_counts()
+    def test_my_courses(self, n):
+        CourseMember.objects.bulk_create([
+            CourseMember(course_id=course, user_id=self.student) for course in self.seed_courses(n)
+        ])
+        with self.assertQueryBudget("GET /mycourses"):
+            response = self.client.get(self.base_url + 'mycourses', **self.auth(self.student_token))
+        self.assertEqual(len(response.json()), n + 1)
+
+    @at_row_counts()
+    def test_create_course(self, n):
+        self.seed_courses(n)
+        with self.assertQueryBudget("POST /courses"):
+            response = self.client.post(self.base_url + 'courses', data={
+                'name': 'Baru', 'description': '-', 'price': 10,
+            }, **self.auth(self.teacher_token))
+        self.assertEqual(response.status_code, 201)
+
+    @at_row_counts()
+    def test_update_course(self, n):
+        self.seed_courses(n)
+        with self.assertQueryBudget("POST /courses/{course_id}"):
+            response = self.client.post(f'{self.base_url}courses/{self.course.id}', data={
+                'name': 'Ganti', 'description': '-', 'price': 10,
+            }, **self.auth(self.teacher_token))
+        self.assertEqual(response.status_code, 200)
+
+    @at_row_counts()
+    def test_enroll(self, n):
+        course = self.seed_courses(n)[-1]
+        CourseMember.objects.bulk_create([
+            CourseMember(course_id=course, user_id=user)
+            for user in User.objects.bulk_create([User(username=f'user{i}') for i in range(n)])
+        ])
+        with self.assertQueryBudget("POST /courses/{course_id}/enroll/"):
+            response = self.client.post(f'{self.base_url}courses/{course.id}/enroll/',
+                                        **self.auth(self.student_token))
+        self.assertEqual(response.status_code, 200)
+
+    @at_row_counts()
+    def test_enroll_bulk(self, n):
+        users = User.objects.bulk_create([User(username=f'user{i}') for i in range(n)])
+        with self.assertQueryBudget("POST /courses/{course_id}/enroll/bulk"):
+            response = self.post_json(f'courses/{self.course.id}/enroll/bulk',
+                                      {'user_ids': [user.id for user in users]}, self.teacher_token)
+        self.assertEqual(response.json(), {'enrolled': n, 'skipped': 0})
+
+    @at_row_counts()
+    def test_course_contents(self, n):
+        parents = CourseContent.objects.bulk_create([
+            CourseContent(course_id=self.course, name=f"Bab {i}") for i in range(n)
+        ])
+        CourseContent.objects.bulk_create([
+            CourseContent(course_id=self.course, parent_id=parent, name=f"Sub {parent.name}")
+            for parent in parents
+        ])
+        CourseContent.objects.rebuild_paths(self.course.id)
+        with self.assertQueryBudget("GET /courses/{course_id}/contents"):
+            response = self.client.get(f'{self.base_url}courses/{self.course.id}/contents')
+        self.assertEqual(len(response.json()), n + 1)
+
+    @at_row_counts()
+    def test_list_comments(self, n):
+        self.seed_comments(n)
+        with self.assertQueryBudget("GET /contents/{content_id}/comments"):
+            response = self.client.get(f'{self.base_url}contents/{self.content.id}/comments?page_size=100')
+        self.assertEqual(len(response.json()['items']), n)
+
+    @at_row_counts()
+    def test_create_comment(self, n):
+        self.seed_comments(n)
+        with self.assertQueryBudget("POST /contents/{content_id}/comments/"):
+            response = self.post_json(f'contents/{self.content.id}/comments/',
+                                      {'comment': 'Baru'}, self.student_token)
+        self.assertEqual(response.status_code, 201)
+
+    @at_row_counts()
+    def test_create_comments_bulk(self, n):
+        with self.assertQueryBudget("POST /contents/{content_id}/comments/bulk"):
+            response = self.post_json(f'contents/{self.content.id}/comments/bulk',
+                                      {'comments': [{'comment': str(i)} for i in range(n)]},
+                                      self.student_token)
+        self.assertEqual(len(response.json()), n)
+
+    @at_row_counts()
+    def test_delete_comments_bulk(self, n):
+        comments = self.seed_comments(n)
+        with self.assertQueryBudget("POST /comments/bulk-delete"):
+            response = self.post_json('comments/bulk-delete',
+                                      {'ids': [c.id for c in comments]}, self.student_token)
+        self.assertEqual(response.json(), {'deleted': n, 'skipped': 0})
+
+    @at_row_counts()
+    def test_delete_comment(self, n):
+        comments = self.seed_comments(n)
+        with self.assertQueryBudget("DELETE /comments/{comment_id}"):
+            response = self.client.delete(f'{self.base_url}comments/{comments[0].id}',
+                                          **self.auth(self.student_token))
+        self.assertEqual(response.status_code, 200)
@@ -0,0 +1,40 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+from ninja.renderers import JSONRenderer
+from lms_core.renderers import ORJSONRenderer, get_renderer
+
+
+class RendererTest(TestCase):
+    def test_orjson_renderer(self):
+        data = {
+            'price': Decimal('1500.50'),
+            'created_at': datetime(2024, 12, 11, 3, 59, tzinfo=timezone.utc),
+            'items': [{'id': 1}],
+        }
+        body = ORJSONRenderer().render(None, data, response_status=200)
+        self.assertEqual(json.loads(body), {
+            'price': '1500.50',
+            'created_at': '2024-12-11T03:59:00Z',
+            'items': [{'id': 1}],
+        })
+
+    def test_datetime_format_matches_json_renderer(self):
+        # format tanggal bagian dari kontrak API: milidetik, sama seperti renderer bawaan Ninja
+        data = {'created_at': datetime(2024, 12, 11, 3, 59, 1, 123456, tzinfo=timezone.utc)}
+        body = ORJSONRenderer().render(None, data, response_status=200)
+        self.assertEqual(json.loads(body), {'created_at': '2024-12-11T03:59:01.123Z'})
+        self.assertEqual(json.loads(body), json.loads(JSONRenderer().render(None, data, response_status=200)))
+
+    def test_renderer_from_settings(self):
+        with override_settings(API_RENDERER='ninja.renderers.JSONRenderer'):
+            self.assertIsInstance(get_renderer(), JSONRenderer)
+        with override_settings(API_RENDERER=None):
+            self.assertIsInstance(get_renderer(), ORJSONRenderer)
+
+    def test_api_response(self):
+        response = self.client.get('/api/v1/hello')
+        self.assertEqual(response['Content-Type'], 'application/json; charset=utf-8')
+        self.assertEqual(response.json(), {'msg': 'Hello World'})
@@ -0,0 +1,65 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from lms_core.models import Course
+from lms_core.search import search_courses
+
+
+class CourseSearchTest(TestCase):
+    base_url = '/api/v1/'
+
+    def setUp(self):
+        self.teacher = User.objects.create_user(username='teacher', password='password123')
+        self.python = Course.objects.create(name="Belajar Python", description="Dasar pemrograman",
+                                            price=100, teacher=self.teacher)
+        self.django = Course.objects.create(name="Django Lanjutan", description="Framework web berbasis Python",
+                                            price=100, teacher=self.teacher)
+        self.php = Course.objects.create(name="PHP", description="Bahasa web", price=100, teacher=self.teacher)
+
+    def search(self, q, **params):
+        response = self.client.get(f'{self.base_url}courses/search', {'q': q, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_match_in_name_ranks_first(self):
+        data = self.search('python')
+        self.assertEqual([item['id'] for item in data['items']], [self.python.id, self.django.id])
+        self.assertEqual(data['count'], 2)
+
+    def test_prefix_and_all_terms(self):
+        self.assertEqual([i['id'] for i in self.search('web djan')['items']], [self.django.id])
+
+    def test_special_characters_are_safe(self):
+        self.assertEqual(self.search('"python* (')['count'], 2)
+        self.assertEqual(self.search('!!!')['count'], 0)
+
+    def test_sparse_fields_and_pagination(self):
+        data = self.search('web', fields='id,name', page=1)
+        self.assertEqual({tuple(item) for item in data['items']}, {('id', 'name')})
+
+    def test_index_follows_save_and_delete(self):
+        self.php.name = "PHP dan Python"
+        self.php.save()
+        self.assertIn(self.php.id, [i['id'] for i in self.search('python')['items']])
+        self.python.delete()
+        self.assertNotIn(self.python.id, search_courses('python').values_list('id', flat=True))
+
+    def test_rebuild_after_bulk_update(self):
+        Course.objects.filter(pk=self.php.pk).update(name="Kotlin")
+        self.assertEqual(search_courses('kotlin').count(), 0)
+        call_command('rebuild_search_index', stdout=StringIO())
+        self.assertEqual(list(search_courses('kotlin').values_list('id', flat=True)), [self.php.id])
+
+    def test_search_route_is_not_shadowed(self):
+        # /courses/{course_id} hanya POST; /courses/search harus tetap GET pencarian
+        response = self.client.get(f'{self.base_url}courses/search')
+        self.assertEqual(response.status_code, 422)
+
+    def test_admin_search_uses_index(self):
+        User.objects.create_superuser(username='admin', password='password123')
+        self.client.login(username='admin', password='password123')
+        response = self.client.get('/admin/lms_core/course/', {'q': 'python'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual({c.id for c in response.context['cl'].result_list}, {self.python.id, self.django.id})
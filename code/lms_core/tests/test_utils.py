@@ -1,5 +1,5 @@
 from django.test import TestCase
-from lms_core.utils import calculator
+from lms_core.utils import calculator, schema_values_fields, nest_values
 
 class CalculatorFunctionTests(TestCase):
     def test_addition(self):
@@ -31,3 +31,16 @@ class CalculatorFunctionTests(TestCase):
         with self.assertRaises(ValueError) as context:
             calculator(10, 5, '%')
         self.assertEqual(str(context.exception), "Invalid operator")
+
+
+class ValuesHelperTests(TestCase):
+    def test_schema_values_fields(self):
+        from lms_core.schema import CourseMemberOut
+        fields = schema_values_fields(CourseMemberOut)
+        self.assertIn('course_id__teacher__email', fields)
+        self.assertIn('user_id__first_name', fields)
+        self.assertNotIn('course_id', fields)
+
+    def test_nest_values(self):
+        row = {'id': 1, 'course_id__name': 'Django', 'course_id__teacher__id': 2}
+        self.assertEqual(nest_values(row), {'id': 1, 'course_id': {'name': 'Django', 'teacher': {'id': 2}}})
@@ -0,0 +1,34 @@
+import json
+
+from django.core import serializers
+from django.core.serializers.json import DjangoJSONEncoder
+from django.test import TestCase
+from django.contrib.auth.models import User
+from lms_core.models import Course
+
+
+class TestingViewTest(TestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(username='teacher', password='password123')
+        for i in range(3):
+            Course.objects.create(name=f"Course {i}", description="-", price=100, teacher=self.teacher)
+
+    def expected(self):
+        data = serializers.serialize("python", Course.objects.order_by('pk'))
+        return json.loads(json.dumps(data, cls=DjangoJSONEncoder))
+
+    def test_streaming_json(self):
+        response = self.client.get('/testing/')
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(b''.join(response.streaming_content)), self.expected())
+
+    def test_streaming_ndjson(self):
+        response = self.client.get('/testing/?format=ndjson')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], self.expected())
+
+    def test_empty_table(self):
+        Course.objects.all().delete()
+        response = self.client.get('/testing/')
+        self.assertEqual(json.loads(b''.join(response.streaming_content)), [])
@@ -30,4 +30,28 @@ def validate_password(password):
 def calculate_discount(price, discount):
     if discount < 0 or discount > 100:
         raise ValueError("Discount must be between 0 and 100")
-    return price - (price * (discount / 100))
\ No newline at end of file
+    return price - (price * (discount / 100))
+
+def schema_values_fields(schema, prefix=''):
+    """Daftar lookup untuk .values() sesuai field schema Ninja, termasuk schema
+    bertingkat, mis. CourseMemberOut -> ['id', 'course_id__teacher__email', ...]."""
+    fields = []
+    for name, field in schema.model_fields.items():
+        annotation = field.annotation
+        if isinstance(annotation, type) and hasattr(annotation, 'model_fields'):
+            fields += schema_values_fields(annotation, f'{prefix}{name}__')
+        else:
+            fields.append(prefix + name)
+    return fields
+
+
+def nest_values(row):
+    """Ubah hasil .values() yang datar ({'course_id__name': ..}) menjadi dict bertingkat."""
+    nested = {}
+    for key, value in row.items():
+        target = nested
+        *parents, leaf = key.split('__')
+        for part in parents:
+            target = target.setdefault(part, {})
+        target[leaf] = value
+    return nested
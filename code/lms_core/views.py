@@ -1,16 +1,42 @@
+import json
+
 from django.shortcuts import render, HttpResponse
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from lms_core.models import Course
-from django.core import serializers
+from django.core.serializers.json import DjangoJSONEncoder
 from django.contrib.auth.models import User
 
+EXPORT_CHUNK_SIZE = 2000
+
 def index(request):
     return HttpResponse("<h1>Hello World</h1>")
     
+def iter_serialized(model, chunk_size=EXPORT_CHUNK_SIZE):
+    # Format sama dengan serializers.serialize("python", ...), tetapi dibaca per
+    # chunk lewat .iterator() sehingga seluruh tabel tidak pernah ada di memori.
+    label = model._meta.label_lower
+    fields = [f for f in model._meta.concrete_fields if not f.primary_key]
+    rows = model.objects.order_by('pk').values_list('pk', *[f.attname for f in fields])
+    for pk, *values in rows.iterator(chunk_size=chunk_size):
+        yield {"model": label, "pk": pk,
+               "fields": {f.name: value for f, value in zip(fields, values)}}
+
+def stream_json_array(objects):
+    yield "["
+    for num, obj in enumerate(objects):
+        yield ("," if num else "") + json.dumps(obj, cls=DjangoJSONEncoder)
+    yield "]"
+
+def stream_ndjson(objects):
+    for obj in objects:
+        yield json.dumps(obj, cls=DjangoJSONEncoder) + "\n"
+
 def testing(request):
-    dataCourse = Course.objects.all()
-    dataCourse = serializers.serialize("python", dataCourse)
-    return JsonResponse(dataCourse, safe=False)
+    # ?format=ndjson -> satu objek JSON per baris
+    dataCourse = iter_serialized(Course)
+    if request.GET.get("format") == "ndjson":
+        return StreamingHttpResponse(stream_ndjson(dataCourse), content_type="application/x-ndjson")
+    return StreamingHttpResponse(stream_json_array(dataCourse), content_type="application/json")
 
 def addData(request): # jangan lupa menambahkan fungsi ini di urls.py
     course = Course(
@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
+import time
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -76,15 +78,133 @@ WSGI_APPLICATION = 'simplelms.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
+# PostgreSQL dipakai jika POSTGRES_HOST di-set (lihat docker-compose.yml),
+# selain itu SQLite lokal.
+
+POSTGRES_HOST = os.environ.get('POSTGRES_HOST')
+
+if POSTGRES_HOST:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'HOST': POSTGRES_HOST,
+            'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+            'NAME': os.environ.get('POSTGRES_DB', 'simple_lms'),
+            'USER': os.environ.get('POSTGRES_USER', 'simple_user'),
+            'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+            # koneksi lama dicek dulu sebelum dipakai ulang, bukan langsung error
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {},
+        }
+    }
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+    # DB_POOL_MAX_SIZE > 0: connection pool bawaan Django 5.1 (butuh psycopg 3
+    # + psycopg-pool). Pool dan CONN_MAX_AGE tidak bisa dipakai bersamaan.
+    DB_POOL_MAX_SIZE = int(os.environ.get('DB_POOL_MAX_SIZE', 0))
+    if DB_POOL_MAX_SIZE:
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default']['OPTIONS']['pool'] = {
+            'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+            'max_size': DB_POOL_MAX_SIZE,
+            'timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        }
+    else:
+        # koneksi persisten: dipakai ulang antar request selama N detik
+        DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('DB_CONN_MAX_AGE', 60))
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            # SQLITE_PATH: mis. database sementara hasil benchmarks/load_test.py
+            'NAME': os.environ.get('SQLITE_PATH', BASE_DIR / 'db.sqlite3'),
+        }
     }
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# Redis dipakai jika REDIS_URL di-set (lihat docker-compose.yml), selain itu
+# memakai cache in-memory lokal (cukup untuk development & testing).
+
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Lama (detik) response katalog disimpan di cache
+API_CACHE_TIMEOUT = int(os.environ.get('API_CACHE_TIMEOUT', 60))
+
+
+# Instrumentasi performa (lms_core.metrics): PERF_METRICS=1 memasang
+# PerformanceMiddleware dan endpoint /metrics (format Prometheus). Request
+# dengan query lebih dari PERF_QUERY_BUDGET dicatat sebagai warning.
+PERF_METRICS = os.environ.get('PERF_METRICS', '') == '1'
+PERF_QUERY_BUDGET = int(os.environ.get('PERF_QUERY_BUDGET', 20))
+
+if PERF_METRICS:
+    MIDDLEWARE.insert(0, 'lms_core.metrics.PerformanceMiddleware')
+
+
+# Cache verifikasi JWT per proses (lms_core.auth.CachedJwtAuth): jumlah token
+# maksimum dan lama (detik) sebelum token diverifikasi & dicek revocation ulang
+JWT_AUTH_CACHE_SIZE = int(os.environ.get('JWT_AUTH_CACHE_SIZE', 4096))
+JWT_AUTH_CACHE_TTL = int(os.environ.get('JWT_AUTH_CACHE_TTL', 60))
+
+# Klaim bawaan ninja_simple_jwt ditambah issued_at: waktu terbit token dengan
+# presisi sub-detik (iat dibulatkan ke detik), dibandingkan dengan waktu
+# revoke_user oleh lms_core.auth.is_revoked
+NINJA_SIMPLE_JWT = {
+    'TOKEN_CLAIM_USER_ATTRIBUTE_MAP': {
+        'user_id': 'id',
+        'username': 'username',
+        'first_name': 'first_name',
+        'last_name': 'last_name',
+        'email': 'email',
+        'is_staff': 'is_staff',
+        'is_superuser': 'is_superuser',
+        'last_login': 'last_login',
+        'date_joined': 'date_joined',
+        'is_active': 'is_active',
+        'issued_at': lambda user: time.time(),
+    },
 }
 
 
+# Renderer JSON untuk Ninja API, mis. 'ninja.renderers.JSONRenderer'.
+# Kosong = orjson (lms_core.renderers.ORJSONRenderer) jika terpasang.
+API_RENDERER = os.environ.get('API_RENDERER')
+
+
+# Password hashing
+# https://docs.djangoproject.com/en/5.1/topics/auth/passwords/
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+# MD5 hanya untuk `import_lms --fast-hasher` (data fixture), password tersebut
+# di-upgrade ke PBKDF2 saat user login. Selama aktif, hash MD5 apa pun di
+# database diterima, jadi harus dinyalakan eksplisit dengan FAST_PASSWORD_HASHER=1.
+FAST_PASSWORD_HASHER = os.environ.get('FAST_PASSWORD_HASHER', '0') == '1'
+if FAST_PASSWORD_HASHER:
+    PASSWORD_HASHERS.append('django.contrib.auth.hashers.MD5PasswordHasher')
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -121,6 +241,15 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Upload (gambar course & variannya)
+MEDIA_URL = 'media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+
+# Jumlah thread pembuat thumbnail per proses. IMAGE_TASKS_EAGER menjalankan
+# job langsung (tanpa thread), dipakai di test.
+IMAGE_WORKERS = int(os.environ.get('IMAGE_WORKERS', 2))
+IMAGE_TASKS_EAGER = os.environ.get('IMAGE_TASKS_EAGER', '') == '1'
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
@@ -14,6 +14,8 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path
 from lms_core.views import index, testing, addData, editData, deleteData
@@ -27,5 +29,9 @@ urlpatterns = [
     path('ubah/', editData),
     path('hapus/', deleteData),
     path('', index),
-]
+] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+
+if settings.PERF_METRICS:
+    from lms_core.metrics import metrics_view
+    urlpatterns.insert(0, path('metrics', metrics_view))
 # jangan lupa menambahkan fungsi ini di urls.py
\ No newline at end of file
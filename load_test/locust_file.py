@@ -39,7 +39,7 @@ class UserBehavior(TaskSet):
     def post_comment(self, content_id):
         headers = {"Authorization": f"Bearer {self.token}"}
         comment_data = {"comment": "This is a test comment."}
-        response = self.client.post(f"/contents/{content_id}/comments", json=comment_data, headers=headers)
+        response = self.client.post(f"/contents/{content_id}/comments/", json=comment_data, headers=headers)
         if response.status_code == 201:
             self.comment_id = response.json().get("id")
             # print("Comment posted:", response.json())